@@ -125,10 +125,34 @@ L2VNI_OPTS = [
         help='Time-to-live in seconds for cached Ironic node and port data. '
              'Each system_id entry is cached independently and expires after '
              'this duration from when it was fetched. This avoids thundering '
-             'herd issues when multiple agents are running. A small amount of '
-             'jitter (10-20%%) is automatically added to spread cache refresh '
-             'times. Default is 3600 seconds (1 hour). Minimum is 300 seconds '
-             '(5 minutes) to avoid excessive API load.'),
+             'herd issues when multiple agents are running. Entries are '
+             'refreshed in the background once they reach 80%% of this '
+             'duration, with a small amount of jitter (10%%) to spread cache '
+             'refresh times, and are still used until the refresh '
+             'completes. Entries older than twice this duration are fetched '
+             'again before being used. Default is 3600 seconds (1 hour). '
+             'Minimum is 300 seconds (5 minutes) to avoid excessive API '
+             'load.'),
+    cfg.IntOpt(
+        'ironic_cache_size',
+        default=10000,
+        min=1,
+        help='Maximum number of system_id entries kept in the cache of '
+             'Ironic node and port data. The least recently used entries '
+             'are evicted once the cache is full. The cache hits, misses, '
+             'refreshes and evictions are logged at debug level after each '
+             'L2VNI trunk reconciliation to help sizing this option and '
+             'ironic_cache_ttl.'),
+    cfg.IntOpt(
+        'ironic_port_fetch_workers',
+        default=4,
+        min=1,
+        help='Maximum number of concurrent Ironic port requests when the '
+             'L2VNI trunk discovery fetches the local link information of '
+             'several network nodes not cached yet, for instance on agent '
+             'startup. The ports of each network node are fetched with one '
+             'request, only for the network nodes whose anchor ports need '
+             'local link information and without OVN LLDP data.'),
     cfg.StrOpt(
         'ironic_conductor_group',
         default=None,
@@ -144,6 +168,78 @@ L2VNI_OPTS = [
              'local_link_information data. This allows the agent to only '
              'query nodes in a specific shard, reducing API load in large '
              'sharded deployments. If not specified, all nodes are queried.'),
+    cfg.IntOpt(
+        'l2vni_subport_batch_size',
+        default=100,
+        min=1,
+        help='Maximum number of subports created with a single bulk port '
+             'create request and attached to a trunk with a single request '
+             'when reconciling trunk subports. A network node needing many '
+             'new VLANs is then configured with a few requests per batch '
+             'instead of two requests per VLAN. If a batch fails its '
+             'subports are retried one at a time. Set to 1 to create and '
+             'attach subports individually.'),
+    cfg.IntOpt(
+        'l2vni_port_delete_workers',
+        default=8,
+        min=1,
+        help='Number of subport and anchor ports deleted concurrently when '
+             'removing subports from a trunk or cleaning up the trunks of '
+             'removed network nodes. The subports removed from a trunk are '
+             'detached with a single request before their ports are '
+             'deleted. Set to 1 to delete ports one after another.'),
+    cfg.IntOpt(
+        'l2vni_reconciliation_workers',
+        default=1,
+        min=1,
+        help='Number of trunks discovered and reconciled concurrently by '
+             'each L2VNI trunk reconciliation. Trunks of different network '
+             'nodes and physical networks are independent, and most of '
+             'their reconciliation time is spent waiting on the Neutron '
+             'API, so large deployments benefit from several workers. A '
+             'failure to reconcile a trunk does not affect the others. '
+             'With the default of 1 the trunks are reconciled one after '
+             'another. The time taken by each trunk is logged at debug '
+             'level to help sizing this option.'),
+    cfg.IntOpt(
+        'l2vni_reconciliation_deadline',
+        default=0,
+        min=0,
+        help='Maximum time in seconds a full L2VNI trunk reconciliation '
+             'spends discovering and reconciling trunks. Trunks that are '
+             'not started before the deadline are skipped and reconciled '
+             'by the next reconciliation, trunks already started are '
+             'completed. Set to 0, the default, to disable the deadline.'),
+    cfg.IntOpt(
+        'l2vni_desired_state_max_age',
+        default=1800,
+        min=0,
+        help='Maximum age in seconds of the VLANs required by each trunk '
+             'reused by the periodic L2VNI trunk reconciliation. When '
+             'enable_l2vni_trunk_reconciliation_events is enabled, OVN '
+             'localnet port events update the required VLANs and router '
+             'port HA chassis group and chassis bridge mapping changes '
+             'invalidate them, so the periodic reconciliation only '
+             'computes them again from the OVN and Neutron state once '
+             'they are invalidated or older than this. Changes without '
+             'an OVN event, such as a new overlay segment on a network, '
+             'are picked up within this time. Set to 0 to compute the '
+             'required VLANs on every reconciliation.'),
+    cfg.FloatOpt(
+        'l2vni_event_coalesce_window',
+        default=0.2,
+        min=0,
+        help='Time in seconds during which the localnet port events '
+             'handled by enable_l2vni_trunk_reconciliation_events are '
+             'coalesced before being reconciled. The VLANs added and '
+             'removed by all the events of the window are reconciled '
+             'together, sharing a single OVN snapshot and trunk lookup per '
+             'network node and adding or removing the subports of each '
+             'trunk in batches, so bursts of events, such as many overlay '
+             'networks being created or a Neutron resync, do not reconcile '
+             'each VLAN separately. If a VLAN is added and removed within '
+             'the window only the last change is applied. Set to 0 to '
+             'reconcile each event as soon as it is received.'),
 ]
 
 # HA chassis group alignment options
@@ -230,6 +326,140 @@ BAREMETAL_AGENT_OPTS = [
              'post-upgrade). A value of 60 means each agent will start '
              'reconciliation within 0-60 seconds of startup. Matches '
              'l2vni_startup_jitter_max for consistency.'),
+    # Baremetal node state reporting options
+    cfg.IntOpt(
+        'ironic_port_list_page_size',
+        default=1000,
+        min=0,
+        help='Number of Ironic ports to request per page when listing '
+             'ports for state reporting. Only the port fields needed to '
+             'build the agent bridge mappings are requested, and pages are '
+             'processed as they arrive, so this bounds the amount of port '
+             'data held in memory at any time. Set to 0 to use the Ironic '
+             'API default page size.'),
+    cfg.IntOpt(
+        'ironic_node_list_page_size',
+        default=1000,
+        min=0,
+        help='Number of Ironic nodes to request per page when listing node '
+             'UUIDs to find stale baremetal agents. Set to 0 to use the '
+             'Ironic API default page size.'),
+    cfg.IntOpt(
+        'stale_agent_cleanup_workers',
+        default=4,
+        min=1,
+        help='Number of stale baremetal agents deleted concurrently by the '
+             'cleanup that runs in the background when the agent starts.'),
+    cfg.BoolOpt(
+        'enable_incremental_port_sync',
+        default=False,
+        help='Keep a local inventory of Ironic ports between state report '
+             'cycles. When enabled, the agent lists all Ironic ports once '
+             'at startup and then only fetches ports created since the '
+             'last seen port on each report_interval, so the cost of a '
+             'cycle scales with port churn rather than with the size of '
+             'the fleet. Port updates and deletions are picked up by a '
+             'periodic full resync, see ironic_port_full_resync_cycles.'),
+    cfg.IntOpt(
+        'ironic_port_full_resync_cycles',
+        default=10,
+        min=1,
+        help='Number of state report cycles that only list new Ironic '
+             'ports between two full Ironic port listings when '
+             'enable_incremental_port_sync is enabled. '
+             'Changes to existing ports, such as a new physical_network, '
+             'and deleted ports are reflected in the reported agent state '
+             'within this many cycles. Default is 10.'),
+    cfg.IntOpt(
+        'report_state_workers',
+        default=1,
+        min=1,
+        help='Number of threads used to send baremetal node state reports '
+             'to the Neutron server. With the default of 1 the reports '
+             'are sent one after another. Increase this in large '
+             'deployments where sending every report of a cycle takes '
+             'longer than [AGENT]report_interval, which causes the '
+             'baremetal agents in Neutron to flap between alive and down.'),
+    cfg.IntOpt(
+        'ovn_event_workers',
+        default=1,
+        min=1,
+        help='Number of threads handling the OVN events watched by the '
+             'agent, such as the localnet port events of the event-driven '
+             'L2VNI trunk reconciliation and the HA chassis group events '
+             'of the router HA binding. The OVN database notification '
+             'thread only queues the events, so slow Neutron requests or '
+             'waiting for a running L2VNI reconciliation do not delay the '
+             'processing of OVN database updates. With more than one '
+             'worker, events may be handled out of order.'),
+    cfg.IntOpt(
+        'ovn_event_queue_size',
+        default=1000,
+        min=1,
+        help='Maximum number of OVN events waiting for one of the '
+             'ovn_event_workers. Once the queue is full, the OVN database '
+             'notification thread waits for a worker to take an event and '
+             'a warning with the number of queued, handled and delayed '
+             'events is logged.'),
+    cfg.FloatOpt(
+        'report_state_rate_limit',
+        default=0,
+        min=0,
+        help='Maximum number of baremetal node state report RPCs per '
+             'second sent to the Neutron server, shared by all '
+             'report_state_workers. With enable_bulk_state_report a '
+             'single RPC carries the state of several nodes. This '
+             'protects the Neutron server from bursts of state reports '
+             'when running with many workers. Set to 0, the default, to '
+             'disable rate limiting.'),
+    cfg.BoolOpt(
+        'enable_bulk_state_report',
+        default=False,
+        help='Report the state of many baremetal nodes in a single RPC to '
+             'the Neutron server instead of one RPC per node. The Neutron '
+             'server must have the baremetal mechanism driver enabled, '
+             'which creates or updates the agents in batches. If the '
+             'Neutron server does not support bulk state reports the agent '
+             'falls back to one state report per node.'),
+    cfg.IntOpt(
+        'state_report_batch_size',
+        default=500,
+        min=1,
+        help='Maximum number of baremetal nodes reported in a single RPC '
+             'when enable_bulk_state_report is enabled.'),
+    cfg.BoolOpt(
+        'enable_change_only_state_report',
+        default=False,
+        help='Only report the state of baremetal nodes whose configuration '
+             'changed on each [AGENT]report_interval. The state of the '
+             'other nodes is refreshed once every node_liveness_interval, '
+             'spread evenly over the report cycles, to keep their agents '
+             'alive in Neutron. This turns the per cycle load on the '
+             'Neutron server from one state report per node into roughly '
+             'report_interval / node_liveness_interval of the nodes.'),
+    cfg.IntOpt(
+        'node_liveness_interval',
+        default=60,
+        min=1,
+        help='Maximum interval in seconds between two state reports of a '
+             'baremetal node with an unchanged configuration when '
+             'enable_change_only_state_report is enabled. This must be '
+             'lower than the agent_down_time of the Neutron server, '
+             'including a margin for the report cycle duration, otherwise '
+             'baremetal agents are reported as down. The default of 60 '
+             'seconds fits the default agent_down_time of 75 seconds.'),
+    cfg.StrOpt(
+        'state_snapshot_file',
+        default=None,
+        help='Path of a file where the agent saves its agent ID and the '
+             'configuration last reported for each baremetal node after '
+             'every report cycle in which they changed. The snapshot is '
+             'loaded at startup, so a restarted agent keeps its position '
+             'in the hash ring and only re-announces the nodes whose '
+             'configuration changed while it was down, instead of sending '
+             'a full state report for every node. The file is written '
+             'atomically. A snapshot written on another host is ignored. '
+             'Disabled when not set.'),
 ]
 
 
@@ -0,0 +1,137 @@
+# Copyright (c) 2026 Red Hat, Inc.
+# All Rights Reserved
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Thread pool with a bounded queue of pending tasks."""
+
+import collections
+from concurrent import futures
+import threading
+import time
+
+from oslo_log import log as logging
+
+LOG = logging.getLogger(__name__)
+
+
+class BoundedExecutor(object):
+    """Thread pool with a bounded queue of pending tasks.
+
+    Submitting a task while all the workers are busy and ``max_queued``
+    tasks are already waiting for a worker blocks until a task completes,
+    pushing back on the producer instead of queuing without bound.
+    Unexpected task errors are logged, they do not stop the workers.
+    """
+
+    def __init__(self, workers, max_queued, name):
+        """Initialize the executor.
+
+        :param workers: Number of worker threads.
+        :param max_queued: Maximum number of tasks waiting for a worker.
+        :param name: Name of the executor, prefix of its thread names.
+        """
+        self.name = name
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=name)
+        # One slot per running or queued task
+        self._free_slots = workers + max_queued
+        self._slots = threading.Condition()
+        self._stopped = False
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._max_pending = 0
+        self._blocked_time = 0.0
+        self._counters = collections.Counter()
+
+    def submit(self, func, *args):
+        """Run a task in a worker thread.
+
+        Blocks while the queue is full, until a task starts or the executor
+        is shut down.
+
+        :param func: Callable to run.
+        :param args: Arguments of the callable.
+        :returns: A future of the task.
+        :raises: RuntimeError if the executor is shut down.
+        """
+        with self._slots:
+            if not self._stopped and not self._free_slots:
+                LOG.warning('%(name)s queue is full, waiting for a worker '
+                            '(%(stats)s)', {'name': self.name,
+                                            'stats': self.stats()})
+                start = time.monotonic()
+                self._slots.wait_for(
+                    lambda: self._free_slots or self._stopped)
+                with self._lock:
+                    self._counters['blocked'] += 1
+                    self._blocked_time += time.monotonic() - start
+            if self._stopped:
+                raise RuntimeError('%s executor is shut down' % self.name)
+            self._free_slots -= 1
+
+        with self._lock:
+            self._counters['submitted'] += 1
+            self._pending += 1
+            self._max_pending = max(self._max_pending, self._pending)
+        try:
+            return self._executor.submit(self._run, func, args)
+        except RuntimeError:
+            self._done()
+            raise
+
+    def _run(self, func, args):
+        try:
+            func(*args)
+        except Exception:
+            LOG.exception('Unexpected error in %s task %s', self.name, func)
+            with self._lock:
+                self._counters['failed'] += 1
+        finally:
+            with self._lock:
+                self._counters['completed'] += 1
+            self._done()
+
+    def _done(self):
+        with self._lock:
+            self._pending -= 1
+        with self._slots:
+            self._free_slots += 1
+            self._slots.notify()
+
+    def stats(self):
+        """Get the executor counters.
+
+        :returns: dict with the submitted, completed, failed and blocked
+                  (submissions that waited for a free slot) task counters,
+                  the number of pending (queued or running) tasks, its high
+                  watermark max_pending and blocked_time, the total time in
+                  seconds submissions waited for a free slot.
+        """
+        with self._lock:
+            stats = {key: self._counters[key] for key in (
+                'submitted', 'completed', 'failed', 'blocked')}
+            stats.update(pending=self._pending,
+                         max_pending=self._max_pending,
+                         blocked_time=round(self._blocked_time, 3))
+        return stats
+
+    def shutdown(self):
+        """Stop the executor, dropping the queued tasks.
+
+        Submissions waiting for a free slot are woken up and fail.
+        """
+        with self._slots:
+            self._stopped = True
+            self._slots.notify_all()
+        self._executor.shutdown(wait=False, cancel_futures=True)
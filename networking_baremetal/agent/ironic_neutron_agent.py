@@ -13,12 +13,17 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from concurrent import futures
+import hashlib
+import heapq
+import json
 import os
 import secrets
 import socket
 import sys
 import threading
 from urllib import parse as urlparse
+import zlib
 
 from neutron.agent import rpc as agent_rpc
 from neutron.common import config as common_config
@@ -41,21 +46,44 @@ from oslo_utils import timeutils
 from oslo_utils import uuidutils
 from ovsdbapp.backend.ovs_idl import idlutils
 from ovsdbapp import exceptions as ovs_exc
-from tooz import hashring
 
 from networking_baremetal.agent import agent_config
+from networking_baremetal.agent import event_executor
+from networking_baremetal.agent import ironic_port_inventory
 from networking_baremetal.agent import l2vni_trunk_manager
+from networking_baremetal.agent import member_hashring
 from networking_baremetal.agent import ovn_client
 from networking_baremetal.agent import ovn_events
+from networking_baremetal.agent import rate_limiter
 from networking_baremetal.agent import router_ha_binding
+from networking_baremetal.agent import state_snapshot
 from networking_baremetal import constants
 from networking_baremetal import ironic_client
 from networking_baremetal import neutron_client
+from networking_baremetal import state_report_rpc
 
 CONF = cfg.CONF
 LOG = logging.getLogger(__name__)
 CONF.import_group('AGENT', 'neutron.plugins.ml2.drivers.agent.config')
 
+# Ironic port fields needed to build the node bridge mappings
+IRONIC_PORT_FIELDS = ['uuid', 'node_uuid', 'physical_network']
+
+# Warn when a state report cycle takes longer than this fraction of
+# [AGENT]report_interval
+REPORT_CYCLE_WARNING_RATIO = 0.8
+
+
+def _config_digest(configurations):
+    """Return a digest of an agent configuration.
+
+    :param configurations: Agent configurations dict
+    :returns: Hex digest of the configurations
+    """
+    return hashlib.sha256(
+        json.dumps(configurations, sort_keys=True).encode('utf-8')
+    ).hexdigest()
+
 
 def list_opts():
     return [
@@ -104,39 +132,71 @@ class HashRingMemberManagerNotificationEndpoint(object):
     filter_rule = oslo_messaging.NotificationFilter(
         publisher_id='^ironic-neutron-agent.*')
 
-    members = []
-    hashring = hashring.HashRing([])
+    # Member payloads keyed by agent id
+    members = {}
+    # Min-heap of (timestamp, agent id), one entry per member. The
+    # timestamp may be older than the member's last heartbeat, entries
+    # are checked against the member when they reach the top.
+    _expiry_heap = []
+    _lock = threading.Lock()
+    hashring = member_hashring.MemberHashRing()
+
+    def _expire_members(self, cutoff):
+        """Pop the members that have not checked in since cutoff.
+
+        :param cutoff: Members with an older heartbeat timestamp expire
+        :returns: List of expired member payloads
+        """
+        expired = []
+        while self._expiry_heap and self._expiry_heap[0][0] < cutoff:
+            _timestamp, member_id = heapq.heappop(self._expiry_heap)
+            member = self.members.get(member_id)
+            if member is None:
+                continue
+            if member['timestamp'] >= cutoff:
+                # The member checked in since this entry was pushed
+                heapq.heappush(self._expiry_heap,
+                               (member['timestamp'], member_id))
+                continue
+            LOG.info('Removing member %s on host %s from hashring.',
+                     member['id'], member['host'])
+            expired.append(self.members.pop(member_id))
+        return expired
 
     def info(self, ctxt, publisher_id, event_type, payload, metadata):
 
         timestamp = timeutils.utcnow_ts()
-        # Add members or update timestamp for existing members
-        if payload['id'] not in [x['id'] for x in self.members]:
-            try:
+        cutoff = timestamp - CONF.AGENT.report_interval * 3
+        with self._lock:
+            # Add members or update timestamp for existing members
+            added = []
+            member = self.members.get(payload['id'])
+            if member is None:
                 LOG.info('Adding member id %s on host %s to hashring.',
                          payload['id'], payload['host'])
-                self.hashring.add_node(payload['id'])
-                self.members.append(payload)
-            except Exception:
-                LOG.exception('Failed to add member %s to hash ring!',
-                              payload['id'])
-        else:
-            for member in self.members:
-                if payload['id'] == member['id']:
-                    member['timestamp'] = payload['timestamp']
-
-        # Remove members that have not checked in for a while
-        for member in self.members:
-            if (timestamp - member['timestamp']) > (
-                    CONF.AGENT.report_interval * 3):
+                self.members[payload['id']] = payload
+                heapq.heappush(self._expiry_heap,
+                               (payload['timestamp'], payload['id']))
+                added.append(payload['id'])
+            else:
+                member['timestamp'] = payload['timestamp']
+
+            # Remove members that have not checked in for a while
+            removed = self._expire_members(cutoff)
+
+            if added or removed:
                 try:
-                    LOG.info('Removing member %s on host %s from hashring.',
-                             member['id'], member['host'])
-                    self.hashring.remove_node(member['id'])
-                    self.members.remove(member)
+                    self.hashring.update(
+                        add=added, remove=[m['id'] for m in removed])
                 except Exception:
-                    LOG.exception('Failed to remove member %s from hash ring!',
-                                  member['id'])
+                    LOG.exception('Failed to update hash ring members!')
+                    # Retry the changes on the next heartbeat
+                    for member_id in added:
+                        del self.members[member_id]
+                    for member in removed:
+                        self.members[member['id']] = member
+                        heapq.heappush(self._expiry_heap,
+                                       (member['timestamp'], member['id']))
 
         return oslo_messaging.NotificationResult.HANDLED
 
@@ -145,9 +205,23 @@ class BaremetalNeutronAgent(service.ServiceBase):
 
     def __init__(self):
         self.context = context.get_admin_context_without_session()
-        self.agent_id = uuidutils.generate_uuid(dashed=True)
-        LOG.info('Agent ID generated: %s', self.agent_id)
         self.agent_host = socket.gethostname()
+        snapshot = None
+        if CONF.baremetal_agent.state_snapshot_file:
+            snapshot = state_snapshot.load(
+                CONF.baremetal_agent.state_snapshot_file)
+            if snapshot and snapshot['host'] != self.agent_host:
+                LOG.warning('Ignoring state snapshot of host %s',
+                            snapshot['host'])
+                snapshot = None
+        if snapshot:
+            # Keep the agent ID, and with it the position in the hash ring
+            # of the other agents, across restarts.
+            self.agent_id = snapshot['agent_id']
+            LOG.info('Agent ID loaded from state snapshot: %s', self.agent_id)
+        else:
+            self.agent_id = uuidutils.generate_uuid(dashed=True)
+            LOG.info('Agent ID generated: %s', self.agent_id)
         self.heartbeat = None
         self.notify_agents = None
 
@@ -172,7 +246,50 @@ class BaremetalNeutronAgent(service.ServiceBase):
 
         self.state_rpc = agent_rpc.PluginReportStateAPI(topics.REPORTS)
         self.ironic_client = ironic_client.get_client()
+        # Digest of the last configuration successfully reported per node
         self.reported_nodes = {}
+        if snapshot:
+            self.reported_nodes.update(snapshot['reported_nodes'])
+        self._snapshot_nodes = dict(self.reported_nodes)
+        # Serializes the changes of reported_nodes by the state report and
+        # the hash ring rebalance
+        self._reported_nodes_lock = threading.Lock()
+        self._report_cycle = 0
+        # Physical networks per node from the last Ironic port listing
+        self._node_physnets = {}
+        # Targeted reconciliation after hash ring membership changes
+        self._rebalance_executor = futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='hashring-rebalance')
+        # OVN event handling, off the OVN IDL notification thread
+        self._ovn_event_executor = event_executor.BoundedExecutor(
+            CONF.baremetal_agent.ovn_event_workers,
+            CONF.baremetal_agent.ovn_event_queue_size, 'ovn-event')
+        self.port_inventory = None
+        if CONF.baremetal_agent.enable_incremental_port_sync:
+            self.port_inventory = ironic_port_inventory.IronicPortInventory(
+                CONF.baremetal_agent.ironic_port_full_resync_cycles)
+            LOG.info('Incremental Ironic port sync enabled, full resync '
+                     'every %d cycles',
+                     CONF.baremetal_agent.ironic_port_full_resync_cycles)
+
+        # State report fan-out to the Neutron server
+        self._report_executor = None
+        if CONF.baremetal_agent.report_state_workers > 1:
+            self._report_executor = futures.ThreadPoolExecutor(
+                max_workers=CONF.baremetal_agent.report_state_workers,
+                thread_name_prefix='report-state')
+        self._report_rate_limiter = None
+        if CONF.baremetal_agent.report_state_rate_limit:
+            self._report_rate_limiter = rate_limiter.TokenBucket(
+                CONF.baremetal_agent.report_state_rate_limit)
+        self.bulk_state_rpc = None
+        # Set once the Neutron server accepted a bulk state report
+        self._bulk_state_report_works = False
+        if CONF.baremetal_agent.enable_bulk_state_report:
+            self.bulk_state_rpc = state_report_rpc.BaremetalStateReportAPI(
+                constants.BAREMETAL_STATE_REPORT_TOPIC)
+            LOG.info('Bulk state report enabled, reporting up to %d nodes '
+                     'per RPC', CONF.baremetal_agent.state_report_batch_size)
 
         # Initialize OVN connections and Neutron client if any OVN-based
         # features are enabled (L2VNI, router HA binding, or HA alignment)
@@ -206,7 +323,14 @@ class BaremetalNeutronAgent(service.ServiceBase):
         # L2VNI trunk reconciliation (optional feature)
         self.trunk_manager = None
         self.l2vni_reconcile = None
+        # Prevents overlapping periodic reconciliations, the trunk manager
+        # locks the trunks changed by targeted and periodic reconciliations
         self._l2vni_reconciliation_lock = threading.Lock()
+        # Localnet port events waiting for targeted reconciliation:
+        # {(physnet, vlan_id): {action: network_id}}
+        self._l2vni_pending_vlans = {}
+        self._l2vni_pending_lock = threading.Lock()
+        self._l2vni_flush_timer = None
 
         if (CONF.l2vni.enable_l2vni_trunk_reconciliation
                 or CONF.l2vni.enable_l2vni_trunk_reconciliation_events):
@@ -315,6 +439,7 @@ class BaremetalNeutronAgent(service.ServiceBase):
                 LOG.info('Registered OVN event handler for L2VNI localnet '
                          'port changes (CREATE/DELETE) using dedicated '
                          'event-only connection')
+                self._register_l2vni_desired_state_events()
 
             # Register HA chassis group event for router HA binding
             if needs_router_ha_events:
@@ -334,6 +459,34 @@ class BaremetalNeutronAgent(service.ServiceBase):
                 'OVN event-driven reconciliation disabled. Using '
                 'periodic reconciliation only.')
 
+    def _register_l2vni_desired_state_events(self):
+        """Watch the OVN changes invalidating the L2VNI desired state.
+
+        The VLANs required by each trunk are only reused between L2VNI
+        trunk reconciliations once these events are watched.
+        """
+        nb_idl = self.trunk_manager.ovn_nb_idl
+        sb_idl = self.trunk_manager.ovn_sb_idl
+        if nb_idl is None or sb_idl is None:
+            return
+        try:
+            for event_class in (ovn_events.L2VNIRouterPortEvent,
+                                ovn_events.L2VNIHAChassisGroupEvent,
+                                ovn_events.L2VNIHAChassisEvent,
+                                ovn_events.L2VNIGatewayChassisEvent):
+                nb_idl.idl.notify_handler.watch_event(
+                    event_class(self.trunk_manager))
+            sb_idl.idl.notify_handler.watch_event(
+                ovn_events.L2VNIChassisEvent(self.trunk_manager))
+        except Exception:
+            LOG.exception('Failed to register OVN event handlers for the '
+                          'L2VNI desired state, the required VLANs will be '
+                          'computed on every reconciliation.')
+            return
+        self.trunk_manager.desired_state.tracked = True
+        LOG.info('Registered OVN event handlers for L2VNI router port, HA '
+                 'chassis and chassis bridge mapping changes')
+
     def start(self):
         LOG.info('Starting agent networking-baremetal.')
         cfg.CONF.log_opt_values(LOG, logging.INFO)
@@ -346,7 +499,11 @@ class BaremetalNeutronAgent(service.ServiceBase):
             self._report_state)
         self.heartbeat.start(interval=CONF.AGENT.report_interval,
                              initial_delay=CONF.AGENT.report_interval)
-        self.cleanup_stale_agents()
+        self.member_manager.hashring.add_listener(self._on_hashring_change)
+        # Run the stale agent cleanup in the background, it does not need
+        # to complete before the agent starts reporting state.
+        threading.Thread(target=self.cleanup_stale_agents,
+                         name='cleanup-stale-agents', daemon=True).start()
 
         # Start L2VNI trunk reconciliation loop if periodic reconciliation
         # is enabled (event-driven reconciliation works without the loop)
@@ -402,6 +559,9 @@ class BaremetalNeutronAgent(service.ServiceBase):
 
     def stop(self, failure=False):
         LOG.info('Stopping agent networking-baremetal.')
+        self.member_manager.hashring.remove_listener(self._on_hashring_change)
+        self._rebalance_executor.shutdown(wait=False, cancel_futures=True)
+        self._ovn_event_executor.shutdown()
         if self.heartbeat:
             self.heartbeat.stop()
         if self.notify_agents:
@@ -409,12 +569,17 @@ class BaremetalNeutronAgent(service.ServiceBase):
         if self.l2vni_reconcile:
             self.l2vni_reconcile.stop()
             LOG.info('Stopped L2VNI trunk reconciliation loop')
+        with self._l2vni_pending_lock:
+            if self._l2vni_flush_timer:
+                self._l2vni_flush_timer.cancel()
         if self.ha_alignment_reconcile:
             self.ha_alignment_reconcile.stop()
             LOG.info('Stopped HA chassis group alignment reconciliation loop')
         if self.router_ha_reconcile:
             self.router_ha_reconcile.stop()
             LOG.info('Stopped router HA binding reconciliation loop')
+        if self._report_executor:
+            self._report_executor.shutdown(wait=False, cancel_futures=True)
         self.listener.stop()
         self.pool_listener.stop()
         self.listener.wait()
@@ -463,8 +628,29 @@ class BaremetalNeutronAgent(service.ServiceBase):
             'agent_type': constants.BAREMETAL_AGENT_TYPE,
             'action': 'update'}
 
-    def _report_state(self):
-        node_states = {}
+    def _build_node_state(self, node, physnets):
+        """Build the agent state of a baremetal node.
+
+        :param node: Ironic node UUID
+        :param physnets: Physical networks of the node's ports
+        :returns: Agent state for the node
+        """
+        template_node_state = self.get_template_node_state(node)
+        mapping = template_node_state["configurations"]["bridge_mappings"]
+        for physnet in physnets:
+            mapping[physnet] = "yes"
+        return template_node_state
+
+    def _list_ironic_ports(self, **query):
+        """List Ironic ports, filtered by the configured conductor groups.
+
+        Only the fields in IRONIC_PORT_FIELDS are requested. The listing is
+        paginated and returned as a generator, so callers can process each
+        page while the following pages are still being fetched.
+
+        :param query: Additional query parameters for the port listing
+        :returns: Generator of Ironic ports
+        """
         conductor_groups_config = getattr(CONF, 'conductor_groups', None)
         conductor_groups = getattr(
             conductor_groups_config, 'conductor_groups', None) or []
@@ -472,27 +658,258 @@ class BaremetalNeutronAgent(service.ServiceBase):
         if conductor_groups:
             LOG.info("Using conductor groups filter: %s", conductor_groups)
 
-        ironic_ports = self.ironic_client.ports(
-            details=True, conductor_groups=conductor_groups)
+        page_size = CONF.baremetal_agent.ironic_port_list_page_size
+        if page_size:
+            query['limit'] = page_size
+
+        return self.ironic_client.ports(
+            fields=IRONIC_PORT_FIELDS, conductor_groups=conductor_groups,
+            **query)
+
+    def _sync_port_inventory(self):
+        """Bring the local Ironic port inventory up to date.
+
+        Runs a full listing when the inventory is empty or due for a
+        resync, otherwise only fetches ports created after the inventory
+        marker.
 
-        # NOTE: the above calls returns a generator, so we need to handle
-        # exceptions that happen just before the first loop iteration, when
-        # the actual request to ironic happens
+        :returns: dict {node_uuid: set of physical network names}
+        """
+        inventory = self.port_inventory
+        if not inventory.needs_full_resync:
+            try:
+                inventory.apply_delta(
+                    self._list_ironic_ports(marker=inventory.marker))
+                return inventory.get_node_physnets()
+            except sdk_exc.NotFoundException:
+                # The port used as marker was deleted in Ironic.
+                LOG.info("Ironic port %s used as inventory marker no longer "
+                         "exists, running a full port resync.",
+                         inventory.marker)
+                inventory.invalidate()
+
+        count = inventory.resync(self._list_ironic_ports())
+        LOG.debug("Full Ironic port resync found %d ports", count)
+        return inventory.get_node_physnets()
+
+    def _get_node_physnets(self):
+        """Get the physical networks of every Ironic node with ports.
+
+        :returns: dict {node_uuid: set of physical network names}
+        """
+        if self.port_inventory is not None:
+            return self._sync_port_inventory()
+
+        node_physnets = {}
+        for port in self._list_ironic_ports():
+            physnets = node_physnets.setdefault(port.node_id, set())
+            if port.physical_network is not None:
+                physnets.add(port.physical_network)
+        return node_physnets
+
+    def _report_state(self):
+        watch = timeutils.StopWatch()
+        watch.start()
         try:
-            for port in ironic_ports:
-                node = port.node_id
-                if (self.agent_id not in
-                        self.member_manager.hashring[node.encode('utf-8')]):
-                    continue
-                template_node_state = self.get_template_node_state(node)
-                node_states.setdefault(node, template_node_state)
-                mapping = node_states[
-                    node]["configurations"]["bridge_mappings"]
-                if port.physical_network is not None:
-                    mapping[port.physical_network] = "yes"
+            with self._reported_nodes_lock:
+                self._report_nodes_state()
+        finally:
+            elapsed = watch.elapsed()
+            interval = CONF.AGENT.report_interval
+            if elapsed > interval * REPORT_CYCLE_WARNING_RATIO:
+                LOG.warning('State report cycle took %(elapsed).2f seconds, '
+                            'close to or above the report interval of '
+                            '%(interval)s seconds. Baremetal agents may be '
+                            'reported as down, consider increasing '
+                            '[baremetal_agent]report_state_workers.',
+                            {'elapsed': elapsed, 'interval': interval})
+            else:
+                LOG.debug('State report cycle took %.2f seconds', elapsed)
+            LOG.debug('Hash ring ownership cache stats: %s',
+                      self.member_manager.hashring.get_stats())
+
+    def _prepare_node_state(self, state):
+        """Set the start_flag of a node state report if needed.
+
+        :param state: Agent state for the node, see get_template_node_state
+        """
+        # If the node was not previously reported with current
+        # configuration set the start_flag True.
+        # NOTE(TheJulia) reported_nodes is an internal list of nodes
+        # we *have* updated.
+        if not _config_digest(state['configurations']) == (
+                self.reported_nodes.get(state['host'])):
+            state.update({'start_flag': True})
+            LOG.info('Reporting state for host agent %s with new '
+                     'configuration: %s',
+                     state['host'], state['configurations'])
+
+    def _send_node_state_batch(self, states):
+        """Send the state reports of a batch of baremetal nodes.
+
+        With bulk state report enabled the batch is sent in a single RPC,
+        falling back to one report_state RPC per node when the Neutron
+        server does not consume the bulk state report API.
+
+        :param states: List of agent states
+        """
+        bulk_state_rpc = self.bulk_state_rpc
+        if bulk_state_rpc is not None:
+            try:
+                LOG.debug('Reporting state for %d hosts in bulk',
+                          len(states))
+                bulk_state_rpc.report_states(self.context, states)
+                self._bulk_state_report_works = True
+                return
+            except (oslo_messaging.NoSuchMethod,
+                    oslo_messaging.UnsupportedVersion,
+                    oslo_messaging.MessageDeliveryFailure):
+                pass
+            except oslo_messaging.MessagingTimeout:
+                # Without a consumer on the topic the call times out,
+                # once bulk reports worked this is a real failure.
+                if self._bulk_state_report_works:
+                    raise
+            LOG.warning("Neutron server does not support bulk baremetal "
+                        "agent state reports, falling back to one state "
+                        "report per node.")
+            self.bulk_state_rpc = None
+
+        for state in states:
+            LOG.debug('Reporting state for host: %s with configuration: '
+                      '%s', state['host'], state['configurations'])
+            self.state_rpc.report_state(self.context, state)
+
+    def _send_node_states(self, node_states):
+        """Send the state reports of baremetal nodes.
+
+        Reports are sent by up to report_state_workers threads, throttled
+        by report_state_rate_limit. With bulk state report enabled each
+        RPC carries up to state_report_batch_size nodes. The first failure
+        stops the remaining reports from being sent, nodes are only added
+        to reported_nodes once their report was sent successfully.
+
+        :param node_states: dict {node_uuid: agent state}
+        :returns: The exception of the first failed report, or None if all
+                  reports were sent.
+        """
+        stop_event = threading.Event()
+        lock = threading.Lock()
+        failures = []
+
+        def report(states):
+            if stop_event.is_set():
+                return
+            if self._report_rate_limiter:
+                self._report_rate_limiter.consume()
+                if stop_event.is_set():
+                    return
+            try:
+                self._send_node_state_batch(states)
+            except Exception as e:
+                stop_event.set()
+                with lock:
+                    first_failure = not failures
+                    failures.append(e)
+                if isinstance(e, AttributeError):
+                    # This means the server does not support report_state
+                    LOG.exception("Neutron server does not support state "
+                                  "report. State report for this agent "
+                                  "will be disabled.")
+                elif first_failure:
+                    LOG.exception("Failed reporting state!")
+                else:
+                    LOG.debug("Failed reporting state: %s", e)
+                return
+            with lock:
+                self.reported_nodes.update(
+                    {state['host']: _config_digest(state['configurations'])
+                     for state in states})
+
+        states = list(node_states.values())
+        for state in states:
+            self._prepare_node_state(state)
+        batch_size = 1
+        if self.bulk_state_rpc is not None:
+            batch_size = CONF.baremetal_agent.state_report_batch_size
+        batches = [states[i:i + batch_size]
+                   for i in range(0, len(states), batch_size)]
+
+        if self._report_executor and len(batches) > 1:
+            # Consume the results so the pool has finished before we return
+            list(self._report_executor.map(report, batches))
+        else:
+            for batch in batches:
+                report(batch)
+                if stop_event.is_set():
+                    break
+
+        if not failures:
+            return None
+        # An AttributeError means the server does not support report_state,
+        # it takes precedence over any other failure.
+        for failure in failures:
+            if isinstance(failure, AttributeError):
+                return failure
+        return failures[0]
+
+    def _is_liveness_slot(self, node, cycle):
+        """Whether a node's liveness is refreshed in a report cycle.
+
+        Nodes are spread evenly over the report cycles that fit in
+        node_liveness_interval, so that each cycle refreshes about the same
+        number of nodes.
+
+        :param node: Ironic node UUID
+        :param cycle: Report cycle number
+        :returns: True if the node state must be reported in this cycle
+        """
+        slots = max(1, (CONF.baremetal_agent.node_liveness_interval
+                        // CONF.AGENT.report_interval))
+        return zlib.crc32(node.encode('utf-8')) % slots == cycle % slots
+
+    def _select_node_states(self, node_states):
+        """Select the node states to send in this report cycle.
+
+        All node states are sent, unless change-only state reporting is
+        enabled. Then only nodes with a new configuration and the nodes
+        due for a liveness refresh are sent. The report cycle only advances
+        once its states were sent, a failed cycle is retried with the same
+        liveness slot.
+
+        :param node_states: dict {node_uuid: agent state} of owned nodes
+        :returns: dict {node_uuid: agent state} to send
+        """
+        cycle = self._report_cycle
+        if not CONF.baremetal_agent.enable_change_only_state_report:
+            return node_states
+
+        changed = 0
+        selected = {}
+        for node, state in node_states.items():
+            if (_config_digest(state['configurations'])
+                    != self.reported_nodes.get(node)):
+                changed += 1
+                selected[node] = state
+            elif self._is_liveness_slot(node, cycle):
+                selected[node] = state
+        LOG.debug('Reporting state for %d of %d nodes, %d with a new '
+                  'configuration', len(selected), len(node_states), changed)
+        return selected
+
+    def _report_nodes_state(self):
+        node_states = {}
+
+        # NOTE: the port listing returns a generator, so we need to handle
+        # exceptions that happen during iteration, when the actual request
+        # to ironic happens
+        try:
+            node_physnets = self._get_node_physnets()
         except sdk_exc.OpenStackCloudException:
             LOG.exception("Failed to get ironic ports data! "
                           "Not reporting state.")
+            if self.port_inventory is not None:
+                self.port_inventory.invalidate()
             try:
                 # Replace the client, just to be on the safe side in
                 # the event there was some sort of hard/breaking failure.
@@ -501,49 +918,57 @@ class BaremetalNeutronAgent(service.ServiceBase):
                 # Failed to re-launch a new client, aborting.
                 self.stop(failure=True)
             return
+
+        self._node_physnets = node_physnets
+        for node, physnets in node_physnets.items():
+            if (self.agent_id not in
+                    self.member_manager.hashring[node.encode('utf-8')]):
+                continue
+            node_states[node] = self._build_node_state(node, physnets)
+
         abort_operation = False
-        for state in node_states.values():
-            # If the node was not previously reported with current
-            # configuration set the start_flag True.
-            # NOTE(TheJulia) reported_nodes is an internal list of nodes
-            # we *have* updated.
-            if not state['configurations'] == self.reported_nodes.get(
-                    state['host']):
-                state.update({'start_flag': True})
-                LOG.info('Reporting state for host agent %s with new '
-                         'configuration: %s',
-                         state['host'], state['configurations'])
-            try:
-                LOG.debug('Reporting state for host: %s with configuration: '
-                          '%s', state['host'], state['configurations'])
-                self.state_rpc.report_state(self.context, state)
-            except AttributeError:
-                # This means the server does not support report_state
-                LOG.exception("Neutron server does not support state report. "
-                              "State report for this agent will be disabled.")
-                # Don't continue reporting the remaining agents in this case.
-                abort_operation = True
-                break
-            except Exception:
-                LOG.exception("Failed reporting state!")
-                # Don't continue reporting the remaining nodes if one failed.
-                return
-            self.reported_nodes.update(
-                {state['host']: state['configurations']})
+        failure = self._send_node_states(
+            self._select_node_states(node_states))
+        if isinstance(failure, AttributeError):
+            # Don't continue reporting the remaining agents in this case.
+            abort_operation = True
+        elif failure is not None:
+            # Don't continue reporting the remaining nodes if one failed.
+            return
+        else:
+            self._report_cycle += 1
 
         # Identify nodes that are no longer present in Ironic by subtracting
-        # the keys of `node_states` from the keys of `reported_nodes`. Then
-        # delete agents for nodes that are no longer present.
-        deleted_nodes = self.reported_nodes.keys() - node_states.keys()
+        # the keys of `node_states` from the keys of `reported_nodes`. Nodes
+        # still present in Ironic are owned by another agent now, which
+        # reports them, forget them. Then delete agents for nodes that are
+        # no longer present.
+        deleted_nodes = set()
+        for node in self.reported_nodes.keys() - node_states.keys():
+            if node in node_physnets:
+                self.reported_nodes.pop(node, None)
+            else:
+                deleted_nodes.add(node)
         deleted_agents = self._delete_agents(deleted_nodes)
         for node in deleted_agents:
-            self.reported_nodes.pop(node)
+            self.reported_nodes.pop(node, None)
+        self._save_state_snapshot()
 
         if abort_operation:
             # We don't expect the agent to work, and as such we should call
             # stop so the program unwinds and begins to exit.
             self.stop(failure=True)
 
+    def _save_state_snapshot(self):
+        """Write the state snapshot if the reported nodes changed."""
+        path = CONF.baremetal_agent.state_snapshot_file
+        if not path or self.reported_nodes == self._snapshot_nodes:
+            return
+        reported_nodes = dict(self.reported_nodes)
+        if state_snapshot.save(path, self.agent_id, self.agent_host,
+                               reported_nodes):
+            self._snapshot_nodes = reported_nodes
+
     def _get_down_agents(self):
         """Retrieves a list of inactive Baremetal agents.
 
@@ -568,25 +993,25 @@ class BaremetalNeutronAgent(service.ServiceBase):
     def _get_nodes_not_found(self, down_bm_agents):
         """Identifies nodes that are not found in the Ironic
 
-        The method iterates over each agent in the 'down_bm_agents' list.
-        For each agent, it attempts to retrieve the corresponding node using
-        the Ironic client's 'get_node' method. If the node is not found the
-        node is appended to the 'nodes_not_found' list.
+        Lists the UUIDs of all nodes in Ironic once, and returns the hosts
+        of the agents in 'down_bm_agents' that are not in that list.
 
         :param down_bm_agents: (list) Agents that are down in Neutron.
         :return: (list) Nodes that are not found in Ironic.
         """
-        nodes_not_found = []
-        for agent in down_bm_agents:
-            node = agent['host']
-            try:
-                self.ironic_client.get_node(node)
-            except sdk_exc.NotFoundException:
-                nodes_not_found.append(node)
+        if not down_bm_agents:
+            return []
 
-        return nodes_not_found
+        query = {'fields': ['uuid']}
+        page_size = CONF.baremetal_agent.ironic_node_list_page_size
+        if page_size:
+            query['limit'] = page_size
+        node_uuids = {node.id for node in self.ironic_client.nodes(**query)}
 
-    def _delete_agents(self, nodes, log=True):
+        return [agent['host'] for agent in down_bm_agents
+                if agent['host'] not in node_uuids]
+
+    def _delete_agents(self, nodes, log=True, workers=1):
         """Delete agents for nodes that are not found in ironic
 
         Clean up agent records in neutron for ironic nodes that have been
@@ -594,10 +1019,15 @@ class BaremetalNeutronAgent(service.ServiceBase):
 
         :param nodes_not_found: (list) Nodes that are not found in Ironic.
         :log: (bool) Log the actions taken.
+        :workers: (int) Number of agents deleted concurrently.
         :return: (list) Agents that have been deleted in Neutron.
         """
         deleted_agents = []
-        for node in nodes:
+        unsupported = threading.Event()
+
+        def delete(node):
+            if unsupported.is_set():
+                return
             if log:
                 LOG.info('Removing agent for host: %s', node)
             try:
@@ -606,9 +1036,19 @@ class BaremetalNeutronAgent(service.ServiceBase):
                 self.state_rpc.delete_agent(self.context, **kwargs)
                 deleted_agents.append(node)
             except oslo_messaging.NoSuchMethod:
-                LOG.warning("Neutron server doesn't support "
-                            "`delete_agent` endpoint.")
-                break
+                if not unsupported.is_set():
+                    unsupported.set()
+                    LOG.warning("Neutron server doesn't support "
+                                "`delete_agent` endpoint.")
+
+        if workers > 1 and len(nodes) > 1:
+            with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(delete, nodes))
+        else:
+            for node in nodes:
+                delete(node)
+                if unsupported.is_set():
+                    break
 
         return deleted_agents
 
@@ -619,14 +1059,150 @@ class BaremetalNeutronAgent(service.ServiceBase):
         inactive in the Neutron server and are not associated with
         any nodes in Ironic. It then deletes these stale agents.
         """
-        down_bm_agents = self._get_down_agents()
-        nodes_not_found = self._get_nodes_not_found(down_bm_agents)
-        deleted_agents = self._delete_agents(nodes_not_found, log=False)
+        try:
+            down_bm_agents = self._get_down_agents()
+            nodes_not_found = self._get_nodes_not_found(down_bm_agents)
+            deleted_agents = self._delete_agents(
+                nodes_not_found, log=False,
+                workers=CONF.baremetal_agent.stale_agent_cleanup_workers)
+        except Exception:
+            LOG.exception("Failed to clean up stale baremetal agents.")
+            return
 
         if deleted_agents:
             LOG.info("Stale baremetal agent for hosts was removed: %s",
                      ", ".join(deleted_agents))
 
+    def _on_hashring_change(self, old_ring, new_ring):
+        """Schedule a targeted rebalance after a hash ring change.
+
+        Called by the member manager with the previous and the new hash
+        ring, from the notification listener thread.
+
+        :param old_ring: Hash ring before the membership change
+        :param new_ring: Hash ring after the membership change
+        """
+        if not old_ring.nodes:
+            # Initial membership, the periodic tasks do the first sync
+            return
+        try:
+            self._rebalance_executor.submit(
+                self._rebalance, old_ring, new_ring)
+        except RuntimeError:
+            # The executor is shut down, the agent is stopping
+            pass
+
+    def _submit_ovn_event(self, func, *args):
+        """Handle an OVN event in an OVN event worker.
+
+        Called by OVN event handlers, from the OVN IDL notification thread,
+        which must not be blocked by Neutron requests or locks.
+
+        :param func: Callable handling the event
+        :param args: Arguments of the callable
+        """
+        try:
+            self._ovn_event_executor.submit(func, *args)
+        except RuntimeError:
+            # The executor is shut down, the agent is stopping
+            pass
+
+    def _get_moved_keys(self, keys, old_ring, new_ring):
+        """Find the keys this agent gained or lost in a ring change.
+
+        :param keys: Iterable of hash ring keys (strings)
+        :param old_ring: Hash ring before the membership change
+        :param new_ring: Hash ring after the membership change
+        :returns: tuple (gained keys, lost keys)
+        """
+        gained = set()
+        lost = set()
+        for key in keys:
+            encoded = key.encode('utf-8')
+            was_owner = self.agent_id in old_ring[encoded]
+            is_owner = self.agent_id in new_ring[encoded]
+            if is_owner and not was_owner:
+                gained.add(key)
+            elif was_owner and not is_owner:
+                lost.add(key)
+        return gained, lost
+
+    def _rebalance(self, old_ring, new_ring):
+        """Reconcile only the resources that moved in a ring change.
+
+        - Nodes this agent gained are reported right away, nodes it lost
+          are forgotten so that their agents are not deleted as stale. This
+          waits for a running state report.
+        - The trunks of the OVN chassis this agent gained are reconciled.
+        - Router HA binding and HA chassis group alignment run for the
+          networks this agent gained. Running L2VNI and HA alignment
+          reconciliations are waited for, not skipped.
+
+        Resources this agent lost are handled by their new owner.
+
+        :param old_ring: Hash ring before the membership change
+        :param new_ring: Hash ring after the membership change
+        """
+        try:
+            with self._reported_nodes_lock:
+                node_physnets = self._node_physnets
+                gained, lost = self._get_moved_keys(
+                    node_physnets, old_ring, new_ring)
+                for node in lost:
+                    self.reported_nodes.pop(node, None)
+                if gained or lost:
+                    LOG.info('Hash ring changed, gained %d and lost %d '
+                             'baremetal nodes', len(gained), len(lost))
+                if gained:
+                    self._send_node_states(
+                        {node: self._build_node_state(
+                            node, node_physnets[node])
+                         for node in gained})
+        except Exception:
+            LOG.exception('Failed to rebalance baremetal nodes after hash '
+                          'ring change')
+
+        if self.trunk_manager:
+            # The chassis managed by this agent may have changed
+            self.trunk_manager.desired_state.invalidate('hash ring changed')
+
+        if (self.trunk_manager and self.trunk_manager.ovn_sb_idl
+                and CONF.l2vni.enable_l2vni_trunk_reconciliation):
+            try:
+                chassis = [
+                    c.name for c in self.trunk_manager.ovn_sb_idl.tables[
+                        'Chassis'].rows.values()]
+                gained, _lost = self._get_moved_keys(
+                    chassis, old_ring, new_ring)
+                if gained:
+                    LOG.info('Hash ring changed, gained %d OVN chassis, '
+                             'reconciling their L2VNI trunks', len(gained))
+                    self._reconcile_l2vni_trunks(chassis=gained)
+            except Exception:
+                LOG.exception('Failed to rebalance L2VNI trunks after hash '
+                              'ring change')
+
+        if self.router_ha_binding:
+            try:
+                network_ha_groups = (
+                    self.router_ha_binding
+                    ._get_networks_with_ha_chassis_groups())
+                gained, _lost = self._get_moved_keys(
+                    network_ha_groups, old_ring, new_ring)
+                if gained:
+                    LOG.info('Hash ring changed, gained %d networks, '
+                             'reconciling router HA binding', len(gained))
+                for network_id in gained:
+                    self.router_ha_binding.bind_router_interfaces_for_network(
+                        network_id, network_ha_groups[network_id])
+                if (gained and CONF.baremetal_agent
+                        .enable_ha_chassis_group_alignment):
+                    self._reconcile_ha_chassis_group_alignment(
+                        network_ids=gained)
+            except Exception:
+                LOG.exception('Failed to rebalance networks after hash ring '
+                              'change')
+
     def _get_neutron_client(self):
         """Get Neutron client using OpenStack SDK.
 
@@ -638,33 +1214,98 @@ class BaremetalNeutronAgent(service.ServiceBase):
         """
         return neutron_client.get_client()
 
+    def _queue_l2vni_vlan_change(self, network_id, physnet, vlan_id, action):
+        """Queue a VLAN change for targeted reconciliation.
+
+        Called by OVN event handlers. The changes queued within
+        l2vni_event_coalesce_window are reconciled together by an OVN event
+        worker, only the last change of each VLAN and network is kept. The
+        removal of a VLAN is kept when the VLAN is then added for another
+        network, so that the subport of the previous network is replaced.
+
+        :param network_id: Neutron network UUID
+        :param physnet: Physical network name
+        :param vlan_id: VLAN ID to add or remove
+        :param action: 'add' or 'remove'
+        """
+        window = CONF.l2vni.l2vni_event_coalesce_window
+        if not window:
+            self._submit_ovn_event(self._reconcile_single_vlan_blocking,
+                                   network_id, physnet, vlan_id, action)
+            return
+
+        with self._l2vni_pending_lock:
+            # {action: network_id} of the VLAN
+            vlan_changes = self._l2vni_pending_vlans.setdefault(
+                (physnet, vlan_id), {})
+            for queued_action, queued_network_id in list(
+                    vlan_changes.items()):
+                if queued_network_id == network_id:
+                    del vlan_changes[queued_action]
+            vlan_changes[action] = network_id
+            if self._l2vni_flush_timer is None:
+                self._l2vni_flush_timer = threading.Timer(
+                    window, self._submit_ovn_event,
+                    args=(self._flush_l2vni_vlan_changes,))
+                self._l2vni_flush_timer.daemon = True
+                self._l2vni_flush_timer.start()
+
+    def _flush_l2vni_vlan_changes(self):
+        """Reconcile the queued VLAN changes.
+
+        Waits for the locks of the trunks being reconciled elsewhere.
+        Changes queued meanwhile start a new window.
+        """
+        with self._l2vni_pending_lock:
+            pending = self._l2vni_pending_vlans
+            self._l2vni_pending_vlans = {}
+            self._l2vni_flush_timer = None
+
+        # {(physnet, action): {vlan_id: network_id}}
+        changes = {}
+        for (physnet, vlan_id), vlan_changes in pending.items():
+            for action, network_id in vlan_changes.items():
+                changes.setdefault((physnet, action), {})[vlan_id] = (
+                    network_id)
+
+        try:
+            self.trunk_manager.reconcile_vlans(changes)
+        except Exception:
+            LOG.exception("Failed targeted reconciliation of %d VLAN "
+                          "changes", len(pending))
+
     def _reconcile_single_vlan_blocking(
             self, network_id, physnet, vlan_id, action):
         """Targeted reconciliation for a single VLAN (blocking lock).
 
-        Called by OVN event handlers. Uses blocking lock acquisition to ensure
-        the event is processed (unlike periodic reconciliation which skips if
-        locked).
+        Called by OVN event handlers. Waits for the locks of the trunks
+        being reconciled elsewhere to ensure the event is processed, the
+        other trunks are reconciled in parallel with the periodic
+        reconciliation.
 
         :param network_id: Neutron network UUID
         :param physnet: Physical network name
         :param vlan_id: VLAN ID to add or remove
         :param action: 'add' or 'remove'
         """
-        LOG.debug("Acquiring lock for targeted VLAN reconciliation...")
-        with self._l2vni_reconciliation_lock:
-            LOG.debug("Lock acquired, processing targeted reconciliation for "
-                      "VLAN %d on physnet %s", vlan_id, physnet)
-            try:
-                self.trunk_manager.reconcile_single_vlan(
-                    network_id, physnet, vlan_id, action)
-            except Exception:
-                LOG.exception("Failed targeted reconciliation for VLAN %d",
-                              vlan_id)
+        LOG.debug("Processing targeted reconciliation for VLAN %d on "
+                  "physnet %s", vlan_id, physnet)
+        try:
+            self.trunk_manager.reconcile_single_vlan(
+                network_id, physnet, vlan_id, action)
+        except Exception:
+            LOG.exception("Failed targeted reconciliation for VLAN %d",
+                          vlan_id)
 
-    def _reconcile_l2vni_trunks(self):
-        """Periodic L2VNI trunk reconciliation"""
-        if not self._l2vni_reconciliation_lock.acquire(blocking=False):
+    def _reconcile_l2vni_trunks(self, chassis=None):
+        """Periodic L2VNI trunk reconciliation
+
+        :param chassis: Only reconcile the trunks of these chassis
+                        system-ids, once a running reconciliation is done.
+                        All managed chassis by default.
+        """
+        if not self._l2vni_reconciliation_lock.acquire(
+                blocking=chassis is not None):
             LOG.debug("L2VNI reconciliation already in progress, skipping")
             return
 
@@ -692,7 +1333,7 @@ class BaremetalNeutronAgent(service.ServiceBase):
                              "reconciliation cycle. Will retry on next cycle.")
                     return
 
-            self.trunk_manager.reconcile()
+            self.trunk_manager.reconcile(chassis=chassis)
             LOG.debug("L2VNI trunk reconciliation completed.")
 
         except Exception:
@@ -720,15 +1361,20 @@ class BaremetalNeutronAgent(service.ServiceBase):
         except Exception:
             LOG.exception("Failed to reconcile router HA binding")
 
-    def _reconcile_ha_chassis_group_alignment(self):
+    def _reconcile_ha_chassis_group_alignment(self, network_ids=None):
         """Periodic HA chassis group alignment reconciliation.
 
         This reconciliation ensures that router ports on networks with
         baremetal external ports use the same ha_chassis_group as those
         baremetal ports. This fixes LP#1995078 where mismatched priorities
         cause intermittent connectivity issues.
+
+        :param network_ids: Only align these networks, regardless of the
+                            time window, once a running alignment is done.
+                            All networks by default.
         """
-        if not self._ha_alignment_lock.acquire(blocking=False):
+        if not self._ha_alignment_lock.acquire(
+                blocking=network_ids is not None):
             LOG.debug("HA alignment reconciliation already in progress, "
                       "skipping")
             return
@@ -754,7 +1400,8 @@ class BaremetalNeutronAgent(service.ServiceBase):
 
             # Determine time window for filtering recent resources
             cutoff_time = None
-            if (CONF.baremetal_agent
+            if network_ids is None and (
+                    CONF.baremetal_agent
                     .limit_ha_chassis_group_alignment_to_recent_changes_only):
                 window = CONF.baremetal_agent.ha_chassis_group_alignment_window
                 if window > 0:
@@ -776,6 +1423,8 @@ class BaremetalNeutronAgent(service.ServiceBase):
             networks_with_bm_ports = {}
             for port in bm_ports:
                 network_id = port.network_id
+                if network_ids is not None and network_id not in network_ids:
+                    continue
 
                 # Apply time window filtering if enabled
                 if cutoff_time is not None:
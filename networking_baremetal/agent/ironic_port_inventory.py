@@ -0,0 +1,113 @@
+# Copyright (c) 2026 Red Hat, Inc.
+# All Rights Reserved
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Local inventory of Ironic ports used for agent state reporting.
+
+The inventory keeps the port to (node, physical_network) mapping between
+state report cycles so that the agent only needs to fetch the ports that
+appeared since the previous cycle instead of listing every port in the
+deployment each ``report_interval``.
+
+Ironic returns ports ordered by creation, so the UUID of the last port
+seen is used as a pagination ``marker`` (the watermark) for the next
+delta listing. Updates to existing ports and port deletions are not
+visible through the marker, they are picked up by the full resync that
+runs every ``ironic_port_full_resync_cycles`` cycles.
+"""
+
+from oslo_log import log as logging
+
+LOG = logging.getLogger(__name__)
+
+
+class IronicPortInventory(object):
+    """Port UUID to (node UUID, physical network) inventory."""
+
+    def __init__(self, full_resync_cycles):
+        """Initialize the port inventory.
+
+        :param full_resync_cycles: Number of delta cycles to run between
+                                   two full port listings.
+        """
+        self.full_resync_cycles = full_resync_cycles
+        self.ports = {}
+        self.marker = None
+        # None means the inventory was never populated, or was
+        # invalidated and must be rebuilt from a full listing.
+        self._cycles_since_resync = None
+
+    @property
+    def needs_full_resync(self):
+        """Whether the next sync must be a full port listing."""
+        return (self._cycles_since_resync is None
+                or self.marker is None
+                or self._cycles_since_resync >= self.full_resync_cycles)
+
+    def invalidate(self):
+        """Force a full resync on the next cycle."""
+        self._cycles_since_resync = None
+
+    def resync(self, ports):
+        """Replace the inventory with the result of a full port listing.
+
+        The inventory is only replaced once the whole listing has been
+        consumed, a failure half way through leaves the previous
+        inventory untouched.
+
+        :param ports: Iterable of Ironic ports
+        :returns: Number of ports in the inventory
+        """
+        inventory = {}
+        marker = None
+        for port in ports:
+            inventory[port.id] = (port.node_id, port.physical_network)
+            marker = port.id
+
+        self.ports = inventory
+        self.marker = marker
+        self._cycles_since_resync = 0
+        LOG.debug('Ironic port inventory resynced with %d ports',
+                  len(inventory))
+        return len(inventory)
+
+    def apply_delta(self, ports):
+        """Add or update ports returned by a delta listing.
+
+        :param ports: Iterable of Ironic ports created after ``marker``
+        :returns: Number of ports applied
+        """
+        applied = 0
+        for port in ports:
+            self.ports[port.id] = (port.node_id, port.physical_network)
+            self.marker = port.id
+            applied += 1
+
+        self._cycles_since_resync += 1
+        LOG.debug('Applied %d Ironic port change(s) to the inventory, '
+                  '%d cycle(s) since last full resync', applied,
+                  self._cycles_since_resync)
+        return applied
+
+    def get_node_physnets(self):
+        """Group the inventory by node.
+
+        :returns: dict {node_uuid: set of physical network names}
+        """
+        node_physnets = {}
+        for node, physnet in self.ports.values():
+            physnets = node_physnets.setdefault(node, set())
+            if physnet is not None:
+                physnets.add(physnet)
+        return node_physnets
@@ -27,11 +27,17 @@ Architecture:
 - Stateless reconciliation based on current OVN/Neutron state
 """
 
+import collections
+from concurrent import futures
+import contextlib
+import functools
 import random
+import threading
 import time
 
 import yaml
 
+from neutron.common.ovn import constants as ovn_const
 from neutron.common.ovn import utils as ovn_utils
 from neutron_lib.api.definitions import portbindings
 from neutron_lib import constants as n_const
@@ -56,6 +62,11 @@ DEVICE_OWNER_L2VNI_ANCHOR = 'baremetal:l2vni_anchor'
 DEVICE_OWNER_L2VNI_SUBPORT = 'baremetal:l2vni_subport'
 DEVICE_OWNER_L2VNI_NETWORK = 'baremetal:l2vni_network'
 
+# Segment types used by L2VNI: VLAN segments and the overlay segment
+# carrying the VNI. Other segments are filtered out by the Neutron server.
+OVERLAY_NETWORK_TYPES = (n_const.TYPE_VXLAN, n_const.TYPE_GENEVE)
+SEGMENT_NETWORK_TYPES = [n_const.TYPE_VLAN] + list(OVERLAY_NETWORK_TYPES)
+
 
 def _get_trunk_name(system_id, physnet):
     """Generate consistent trunk name.
@@ -97,9 +108,537 @@ def _get_ha_group_network_name(ha_group_name):
     return f"l2vni-ha-group-{ha_group_name}"
 
 
+def _parse_physnet_bridges(bridge_mappings_str):
+    """Parse an OVN bridge-mappings string.
+
+    :param bridge_mappings_str: String like "physnet1:br-ex,physnet2:br2"
+    :returns: dict {physnet: bridge_name}
+    """
+    physnet_bridges = {}
+    if not bridge_mappings_str:
+        return physnet_bridges
+
+    for mapping in bridge_mappings_str.split(','):
+        if ':' not in mapping:
+            continue
+        physnet, bridge = mapping.split(':', 1)
+        physnet = physnet.strip()
+        if physnet:
+            physnet_bridges[physnet] = bridge.strip()
+
+    return physnet_bridges
+
+
+def _index_lldp_ports(ports):
+    """Index the OVS ports with LLDP data by chassis.
+
+    :param ports: OVN Southbound Port rows
+    :returns: dict {chassis_name: [(interface_names, local_link)]} where
+              local_link is the local_link_information parsed from the
+              LLDP external_ids of the port
+    """
+    index = {}
+    for port in ports:
+        # Port.interfaces is a list of Interface objects
+        if not hasattr(port, 'interfaces') or not port.interfaces:
+            continue
+        lldp = port.external_ids
+        chassis_id = lldp.get('lldp_chassis_id')
+        port_id = lldp.get('lldp_port_id')
+        if not chassis_id or not port_id:
+            continue
+        iface_names = tuple(iface.name for iface in port.interfaces
+                            if hasattr(iface, 'name'))
+        local_link = {'switch_id': chassis_id,
+                      'port_id': port_id,
+                      'switch_info': lldp.get('lldp_system_name') or ''}
+        index.setdefault(getattr(port.chassis, 'name', None), []).append(
+            (iface_names, local_link))
+    return index
+
+
+class OVNSnapshot:
+    """Indexes of the OVN tables used during a reconciliation.
+
+    Built with a single pass over the Chassis table at the start of a
+    reconciliation, over the Logical_Switch table the first time a switch
+    is looked up and over the Port table the first time LLDP data is
+    looked up, so the lookups done for every network, segment and chassis
+    are dictionary lookups instead of table scans.
+    """
+
+    def __init__(self, ovn_nb_idl, ovn_sb_idl):
+        """Build the OVN snapshot.
+
+        :param ovn_nb_idl: OVN Northbound IDL connection
+        :param ovn_sb_idl: OVN Southbound IDL connection
+        """
+        self._ovn_nb_idl = ovn_nb_idl
+        self._ovn_sb_idl = ovn_sb_idl
+        # Chassis name (system-id) -> Chassis row
+        self.chassis = {}
+        # Chassis name -> {physnet: bridge_name}
+        self.bridge_mappings = {}
+        # Physnet -> set of chassis names
+        self.physnet_chassis = {}
+        for chassis in ovn_sb_idl.tables['Chassis'].rows.values():
+            self.chassis[chassis.name] = chassis
+            physnet_bridges = _parse_physnet_bridges(
+                chassis.other_config.get('ovn-bridge-mappings', ''))
+            self.bridge_mappings[chassis.name] = physnet_bridges
+            for physnet in physnet_bridges:
+                self.physnet_chassis.setdefault(physnet, set()).add(
+                    chassis.name)
+
+    @functools.cached_property
+    def logical_switches(self):
+        """Logical switch name -> Logical_Switch row."""
+        return {ls.name: ls for ls in
+                self._ovn_nb_idl.tables['Logical_Switch'].rows.values()}
+
+    @functools.cached_property
+    def lldp_ports(self):
+        """Chassis name -> [(interface names, local link)].
+
+        See _index_lldp_ports.
+        """
+        return _index_lldp_ports(
+            self._ovn_sb_idl.tables['Port'].rows.values())
+
+
+def _index_by_name(resources, prefix=None, names=()):
+    """Index Neutron resources by name, keeping the first of each name.
+
+    :param resources: Iterable of Neutron resources
+    :param prefix: Only index resources with a name starting with prefix
+    :param names: Also index resources with one of these names
+    :returns: dict {name: resource}
+    """
+    index = {}
+    for resource in resources:
+        name = resource.name
+        if not name:
+            continue
+        if prefix is None or name.startswith(prefix) or name in names:
+            index.setdefault(name, resource)
+    return index
+
+
+def _trunk_changed(trunk, current_trunk):
+    """Check if a trunk changed since it was listed.
+
+    :param trunk: Trunk as listed
+    :param current_trunk: Trunk as currently in Neutron
+    :returns: True if the revision differs, or is not known
+    """
+    revision = getattr(trunk, 'revision_number', None)
+    return (revision is None
+            or revision != getattr(current_trunk, 'revision_number', None))
+
+
+class NeutronSnapshot:
+    """L2VNI resources listed from Neutron once per reconciliation.
+
+    Trunks, anchor ports and networks are listed with a single request
+    each at the start of a reconciliation, so looking them up by
+    name for every chassis and physnet does not cost an API round trip.
+    Resources created during the reconciliation are added to the
+    snapshot, so later lookups in the same reconciliation find them.
+    """
+
+    def __init__(self, neutron_client):
+        """List the L2VNI resources from Neutron.
+
+        :param neutron_client: Neutron client
+        """
+        network_api = neutron_client.network
+        # Trunk name -> trunk
+        self.trunks = _index_by_name(network_api.trunks(),
+                                     prefix='l2vni-trunk-')
+        # Port name -> anchor port (trunk parent)
+        self.anchor_ports = _index_by_name(network_api.ports(
+            device_owner=DEVICE_OWNER_L2VNI_ANCHOR))
+        # Network name -> subport anchor and HA chassis group networks
+        self.networks = _index_by_name(
+            network_api.networks(), prefix='l2vni-',
+            names=(CONF.l2vni.l2vni_subport_anchor_network,))
+        LOG.debug("Prefetched %d L2VNI trunks, %d anchor ports and %d "
+                  "networks from Neutron", len(self.trunks),
+                  len(self.anchor_ports), len(self.networks))
+
+
+def _trunk_digest(vlan_ids):
+    """Get the digest of the VLANs of a trunk.
+
+    The digest is the set of VLAN IDs, exact and cheap to compare.
+
+    :param vlan_ids: Iterable of VLAN IDs
+    :returns: frozenset of VLAN IDs
+    """
+    return frozenset(vlan_ids)
+
+
+class DesiredState:
+    """VLANs required by each trunk, kept between reconciliations.
+
+    A full reconciliation computes the VLANs required by each trunk from
+    the OVN and Neutron state. Once the OVN events keeping it up to date
+    are watched, localnet port events add and remove VLANs, and the other
+    OVN changes that may affect the required VLANs invalidate it, so the
+    next reconciliation computes it again. It is also computed again once
+    older than l2vni_desired_state_max_age, to pick up changes that have
+    no OVN event.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # {(system_id, physnet): {vlan_id: vlan_info}}, None when it must
+        # be computed again
+        self._required_vlans = None
+        # {(system_id, physnet): digest of the required VLANs}
+        self._digests = {}
+        self._computed_at = 0
+        # Incremented on every invalidation and targeted change
+        self._generation = 0
+        # Set once the OVN events keeping the model up to date are watched
+        self.tracked = False
+
+    @property
+    def generation(self):
+        """Number of invalidations and targeted changes.
+
+        See :meth:`update`.
+        """
+        return self._generation
+
+    def get(self):
+        """Get the required VLANs if they can be reused.
+
+        :returns: dict {(system_id, physnet): {vlan_id: vlan_info}}, or
+                  None if they must be computed again
+        """
+        max_age = CONF.l2vni.l2vni_desired_state_max_age
+        with self._lock:
+            if (not self.tracked or not max_age
+                    or self._required_vlans is None
+                    or time.monotonic() - self._computed_at >= max_age):
+                return None
+            return self._required_vlans
+
+    def update(self, required_vlans, generation):
+        """Store computed required VLANs.
+
+        :param required_vlans: dict {(system_id, physnet):
+                               {vlan_id: vlan_info}}
+        :param generation: Generation read before reading the OVN and
+                           Neutron state the required VLANs were computed
+                           from. If the model was invalidated since, the
+                           required VLANs may be outdated and are not
+                           stored.
+        """
+        with self._lock:
+            if generation != self._generation:
+                LOG.debug("L2VNI desired state invalidated while it was "
+                          "computed, it will be computed again")
+                return
+            self._required_vlans = required_vlans
+            self._digests = {key: _trunk_digest(vlans)
+                             for key, vlans in required_vlans.items()}
+            self._computed_at = time.monotonic()
+
+    def add_vlan(self, keys, vlan_id, vlan_info):
+        """Add a VLAN to the VLANs required by trunks.
+
+        :param keys: Iterable of (system_id, physnet) of the trunks
+        :param vlan_id: VLAN ID
+        :param vlan_info: dict with the 'vni' and 'segment_id' of the VLAN
+        """
+        with self._lock:
+            # Required VLANs being computed may miss this VLAN
+            self._generation += 1
+            if self._required_vlans is None:
+                return
+            for key in keys:
+                vlans = self._required_vlans.setdefault(key, {})
+                vlans[vlan_id] = vlan_info
+                self._digests[key] = _trunk_digest(vlans)
+
+    def remove_vlan(self, physnet, vlan_id):
+        """Remove a VLAN from the VLANs required by the trunks of a physnet.
+
+        :param physnet: Physical network name
+        :param vlan_id: VLAN ID
+        """
+        with self._lock:
+            # Required VLANs being computed may include this VLAN
+            self._generation += 1
+            if self._required_vlans is None:
+                return
+            for key, vlans in self._required_vlans.items():
+                if key[1] == physnet and vlan_id in vlans:
+                    del vlans[vlan_id]
+                    self._digests[key] = _trunk_digest(vlans)
+
+    def invalidate(self, reason):
+        """Require the VLANs to be computed again.
+
+        :param reason: Reason of the invalidation, for logging
+        """
+        with self._lock:
+            self._generation += 1
+            self._required_vlans = None
+            self._digests = {}
+        LOG.debug("L2VNI desired state invalidated: %s", reason)
+
+    def digest(self, key):
+        """Get the digest of the VLANs required by a trunk.
+
+        :param key: (system_id, physnet) of the trunk
+        :returns: Digest, or None if the required VLANs are not known
+        """
+        with self._lock:
+            if self._required_vlans is None:
+                return None
+            return self._digests.get(key, _trunk_digest(()))
+
+
+class IronicLinkCache:
+    """Bounded LRU cache of the Ironic ports of each system_id.
+
+    Entries are renewed by a background refresher once they reach a
+    jittered fraction of ironic_cache_ttl, and stay readable until the
+    refresh lands, so reconciliations only query Ironic inline for
+    system_ids not cached yet or whose entry is older than twice the TTL.
+    The least recently used entries are evicted above ironic_cache_size
+    entries.
+    """
+
+    # Fraction of the TTL after which an entry is refreshed
+    REFRESH_AHEAD = 0.8
+
+    def __init__(self, fetch):
+        """Create the cache.
+
+        :param fetch: Callable taking a system_id and returning its cache
+                      entry, or None
+        """
+        self._fetch = fetch
+        self._lock = threading.Lock()
+        # system_id -> entry, least recently used first
+        self._entries = collections.OrderedDict()
+        # system_id -> time.time() after which the entry is refreshed
+        self._refresh_after = {}
+        # system_ids with a refresh queued or running
+        self._refreshing = set()
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='l2vni-ironic-refresh')
+        self.counters = collections.Counter()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, system_id):
+        """Get the cached entry of a system_id.
+
+        Queues a background refresh of the entry when it is due.
+
+        :param system_id: Chassis system-id
+        :returns: The cache entry, or None if not cached or expired
+        """
+        ttl = CONF.l2vni.ironic_cache_ttl
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(system_id)
+            if entry is None or now - entry['cached_at'] >= 2 * ttl:
+                self.counters['misses'] += 1
+                return None
+            self._entries.move_to_end(system_id)
+            if now >= self._refresh_after[system_id]:
+                self.counters['stale_hits'] += 1
+                if system_id not in self._refreshing:
+                    self._refreshing.add(system_id)
+                    self._executor.submit(self._refresh, system_id)
+            else:
+                self.counters['hits'] += 1
+            return entry
+
+    def put(self, system_id, entry):
+        """Store the entry of a system_id, evicting the oldest entries.
+
+        :param system_id: Chassis system-id
+        :param entry: Cache entry, with its cached_at time
+        """
+        # Jitter (90-110%) spreads the refreshes of entries fetched
+        # together, and across multiple agents, to avoid thundering herd
+        jitter = 0.9 + random.random() * 0.2  # noqa: S311
+        refresh_after = (entry['cached_at'] + CONF.l2vni.ironic_cache_ttl
+                         * self.REFRESH_AHEAD * jitter)
+        with self._lock:
+            self._entries[system_id] = entry
+            self._entries.move_to_end(system_id)
+            self._refresh_after[system_id] = refresh_after
+            while len(self._entries) > CONF.l2vni.ironic_cache_size:
+                evicted, _entry = self._entries.popitem(last=False)
+                del self._refresh_after[evicted]
+                self.counters['evictions'] += 1
+
+    def _refresh(self, system_id):
+        """Fetch and store the entry of a system_id in the background.
+
+        :param system_id: Chassis system-id
+        """
+        try:
+            entry = self._fetch(system_id)
+        except Exception:
+            # Runs in the refresher thread, nothing else would log it
+            LOG.exception("Failed to refresh Ironic data for system_id %s",
+                          system_id)
+            entry = None
+        with self._lock:
+            self._refreshing.discard(system_id)
+            if not entry:
+                # Keep serving the current entry, it is refreshed again on
+                # its next lookup and dropped once older than twice the TTL
+                self.counters['refresh_failures'] += 1
+                return
+            self.counters['refreshes'] += 1
+        self.put(system_id, entry)
+
+    def stats(self):
+        """Get the cache counters.
+
+        :returns: dict with the number of entries and the hits, stale_hits,
+                  misses, refreshes, refresh_failures and evictions counters
+        """
+        with self._lock:
+            stats = {key: self.counters[key] for key in (
+                'hits', 'stale_hits', 'misses', 'refreshes',
+                'refresh_failures', 'evictions')}
+            stats['entries'] = len(self._entries)
+        return stats
+
+
+class TrunkLocks:
+    """Locks of the trunks, keyed by (system_id, physnet).
+
+    Targeted and periodic reconciliations lock the trunks they change, so
+    that different trunks are reconciled in parallel. The locks of several
+    trunks are always acquired in sorted order, so they cannot deadlock.
+    Targeted reconciliations number their changes, so the periodic
+    reconciliation can tell which trunks changed since it read the OVN and
+    Neutron state.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._locks = collections.defaultdict(threading.Lock)
+        # (system_id, physnet) -> sequence of the last change
+        self._changes = {}
+        self._sequence = 0
+
+    @property
+    def sequence(self):
+        """Sequence of the last change, see :meth:`changed_since`."""
+        return self._sequence
+
+    def _get(self, key):
+        with self._lock:
+            return self._locks[key]
+
+    @contextlib.contextmanager
+    def hold(self, keys, blocking=True, changes=False):
+        """Hold the locks of trunks.
+
+        :param keys: Iterable of (system_id, physnet) of the trunks
+        :param blocking: Wait for the locks held elsewhere. If False and a
+                         lock is held elsewhere, no lock is held.
+        :param changes: Record a change of the trunks when their locks are
+                        acquired and released, for targeted changes
+        :returns: Context manager yielding True if the locks are held
+        """
+        keys = sorted(set(keys))
+        acquired = []
+        for key in keys:
+            if not self._get(key).acquire(blocking=blocking):
+                break
+            acquired.append(key)
+        if len(acquired) != len(keys):
+            self._release(acquired)
+            acquired = []
+        if changes:
+            self._mark_changed(acquired)
+        try:
+            yield len(acquired) == len(keys)
+        finally:
+            if changes:
+                self._mark_changed(acquired)
+            self._release(acquired)
+
+    def _release(self, keys):
+        for key in reversed(keys):
+            self._get(key).release()
+
+    def _mark_changed(self, keys):
+        with self._lock:
+            self._sequence += 1
+            for key in keys:
+                self._changes[key] = self._sequence
+
+    def changed_since(self, key, sequence):
+        """Check if a trunk changed after a given sequence.
+
+        :param key: (system_id, physnet) of the trunk
+        :param sequence: Value of :attr:`sequence` read earlier
+        :returns: True if the trunk changed since
+        """
+        with self._lock:
+            return self._changes.get(key, 0) > sequence
+
+
+class _ReconciliationContext(threading.local):
+    """State of the reconciliation running in the current thread.
+
+    Targeted and periodic reconciliations run concurrently, each with its
+    own snapshots and caches. The per-trunk workers of a reconciliation
+    share the state of the thread running it, see
+    L2VNITrunkManager._run_per_trunk.
+    """
+
+    def __init__(self):
+        # Chassis cache: chassis_name -> chassis_object
+        # Built once per reconciliation cycle for performance
+        self.chassis_cache = None
+        # OVN table indexes, built once per reconciliation cycle
+        self.ovn_snapshot = None
+        # Neutron L2VNI resources, listed once per reconciliation cycle
+        self.neutron_snapshot = None
+        # Trunks listed or created during the current reconciliation, with
+        # their subports: trunk_id -> trunk
+        self.trunk_cache = {}
+        # Monotonic time after which no more trunks are started in the
+        # current reconciliation, None without deadline
+        self.reconcile_deadline = None
+        # TrunkLocks sequence when the periodic reconciliation started,
+        # None for targeted reconciliations
+        self.reconcile_sequence = None
+
+
+def _context_property(name):
+    """Manager attribute stored in its _ReconciliationContext."""
+    return property(lambda self: getattr(self._context, name),
+                    lambda self, value: setattr(self._context, name, value))
+
+
 class L2VNITrunkManager:
     """Manages L2VNI trunk ports and subports for network nodes."""
 
+    _chassis_cache = _context_property('chassis_cache')
+    _ovn_snapshot = _context_property('ovn_snapshot')
+    _neutron_snapshot = _context_property('neutron_snapshot')
+    _trunk_cache = _context_property('trunk_cache')
+    _reconcile_deadline = _context_property('reconcile_deadline')
+    _reconcile_sequence = _context_property('reconcile_sequence')
+
     def __init__(self, neutron_client, ovn_nb_idl, ovn_sb_idl,
                  ironic_client, member_manager=None, agent_id=None):
         """Initialize L2VNI trunk manager.
@@ -119,16 +658,30 @@ class L2VNITrunkManager:
         self.member_manager = member_manager
         self.agent_id = agent_id
         self._config_cache = None
-        # Per-record cache: system_id -> data
-        # Thread safety: This cache is only accessed from reconcile() and its
-        # helper methods. The reconcile() method is protected by
-        # _l2vni_reconciliation_lock in the agent (see
-        # ironic_neutron_agent.py:_reconcile_l2vni_trunks), which prevents
-        # concurrent execution. Therefore, no additional locking is needed.
-        self._ironic_cache = {}
-        # Chassis cache: chassis_name -> chassis_object
-        # Built once per reconciliation cycle for performance
-        self._chassis_cache = None
+        # Per-record cache: system_id -> data, refreshed in the background
+        self._ironic_cache = IronicLinkCache(
+            self._fetch_ironic_data_for_system_id)
+        # Ironic node index: system_id -> node_uuid, built with a single
+        # node listing and refreshed once per ironic_cache_ttl. Refreshed
+        # under a lock, trunks are discovered concurrently.
+        self._system_id_index = None
+        self._system_id_index_at = 0
+        self._system_id_index_lock = threading.Lock()
+        # Snapshots and caches of the reconciliation of each thread
+        self._context = _ReconciliationContext()
+        # Trunks being reconciled, see TrunkLocks
+        self.trunk_locks = TrunkLocks()
+        # Serializes the creation and cleanup of infrastructure networks
+        self._infrastructure_lock = threading.Lock()
+        # VLANs required by each trunk, maintained by OVN events between
+        # reconciliations
+        self.desired_state = DesiredState()
+        # Segments of each network, kept between reconciliations:
+        # network_id -> {'revision': network revision_number,
+        #                'vlan_segments': [...], 'vni_segments': [...]}
+        # Replaced by every full segment listing, entries whose network
+        # revision in OVN changed are fetched again.
+        self._segment_cache = {}
 
     def _should_manage_chassis(self, system_id):
         """Check if this agent should manage this chassis based on hash ring.
@@ -153,15 +706,19 @@ class L2VNITrunkManager:
 
         :returns: dict {chassis_name: chassis_object}
         """
+        if self._ovn_snapshot is not None:
+            all_chassis = self._ovn_snapshot.chassis.values()
+        else:
+            all_chassis = self.ovn_sb_idl.tables['Chassis'].rows.values()
         cache = {
             chassis.name: chassis
-            for chassis in self.ovn_sb_idl.tables['Chassis'].rows.values()
+            for chassis in all_chassis
             if self._should_manage_chassis(chassis.name)
         }
 
         return cache
 
-    def reconcile(self):
+    def reconcile(self, chassis=None):
         """Main reconciliation entry point.
 
         Performs stateless reconciliation of trunk infrastructure:
@@ -171,6 +728,10 @@ class L2VNITrunkManager:
         4. Calculate required VLANs per chassis from OVN state
         5. Reconcile subports to match requirements
         6. Clean up unused infrastructure
+
+        :param chassis: Only reconcile the trunks of these chassis
+                        system-ids, without cleaning up unused
+                        infrastructure. All managed chassis by default.
         """
         try:
             # Skip reconciliation if OVN connections are not available
@@ -179,24 +740,54 @@ class L2VNITrunkManager:
                           "reconciliation")
                 return
 
-            # Build chassis cache once for this reconciliation cycle
+            generation = self.desired_state.generation
+            # Trunks changed by targeted reconciliations after this are
+            # left to them, this reconciliation state may be outdated
+            self._reconcile_sequence = self.trunk_locks.sequence
+            deadline = CONF.l2vni.l2vni_reconciliation_deadline
+            if deadline:
+                self._reconcile_deadline = time.monotonic() + deadline
+
+            # Build OVN indexes and chassis cache once for this
+            # reconciliation cycle
+            self._ovn_snapshot = OVNSnapshot(self.ovn_nb_idl,
+                                             self.ovn_sb_idl)
             self._chassis_cache = self._build_chassis_cache()
 
+            # List the existing L2VNI resources from Neutron once, only
+            # creations and updates call Neutron after this
+            self._neutron_snapshot = NeutronSnapshot(self.neutron)
+
             # Ensure infrastructure networks exist
             self._ensure_infrastructure_networks()
 
             # Build trunk map: {(system_id, physnet): trunk_id}
-            trunk_map = self._discover_trunks()
+            trunk_map = self._discover_trunks(chassis)
 
             # Calculate required VLANs with VNI info:
             # {(system_id, physnet): {vlan_id: vni}}
-            required_vlans = self._calculate_required_vlans()
+            # unless they were kept up to date by OVN events
+            required_vlans = self.desired_state.get()
+            if required_vlans is None:
+                required_vlans = self._calculate_required_vlans()
+                self.desired_state.update(required_vlans, generation)
+            else:
+                LOG.debug("Reusing required VLANs of %d trunks maintained "
+                          "from OVN events", len(required_vlans))
 
             # Reconcile subports
             self._reconcile_subports(trunk_map, required_vlans)
 
-            # Clean up unused infrastructure
-            self._cleanup_unused_infrastructure()
+            # Clean up unused infrastructure, this needs the trunks of all
+            # managed chassis
+            if chassis is None:
+                self._cleanup_unused_infrastructure()
+
+            LOG.debug("Ironic cache: %(entries)d entries, %(hits)d hits, "
+                      "%(stale_hits)d stale hits, %(misses)d misses, "
+                      "%(refreshes)d refreshes, %(refresh_failures)d "
+                      "failed refreshes, %(evictions)d evictions",
+                      self._ironic_cache.stats())
 
         except (sdkexc.SDKException, AttributeError, KeyError, TypeError,
                 ValueError, IndexError):
@@ -212,8 +803,13 @@ class L2VNITrunkManager:
                           "reconciliation.")
             # Don't re-raise - let reconciliation continue on next interval
         finally:
-            # Clear chassis cache to free memory between reconciliation cycles
+            # Clear caches to free memory between reconciliation cycles
             self._chassis_cache = None
+            self._ovn_snapshot = None
+            self._neutron_snapshot = None
+            self._trunk_cache = {}
+            self._reconcile_deadline = None
+            self._reconcile_sequence = None
 
     def reconcile_single_vlan(self, network_id, physnet, vlan_id,
                               action='add'):
@@ -239,11 +835,16 @@ class L2VNITrunkManager:
                           "targeted reconciliation")
                 return
 
-            # Build chassis cache for this operation
+            # Build OVN indexes and chassis cache for this operation
+            self._ovn_snapshot = OVNSnapshot(self.ovn_nb_idl,
+                                             self.ovn_sb_idl)
             self._chassis_cache = self._build_chassis_cache()
 
-            # Ensure infrastructure networks exist (creates if missing)
-            self._ensure_infrastructure_networks()
+            # Ensure infrastructure networks exist (creates if missing),
+            # unless a full reconciliation verified them and nothing
+            # invalidated the desired state since
+            if self.desired_state.get() is None:
+                self._ensure_infrastructure_networks()
 
             # Get subport anchor network
             anchor_network_id = self._get_subport_anchor_network_id()
@@ -274,25 +875,35 @@ class L2VNITrunkManager:
                 return
 
             # For each chassis, add or remove the subport
-            for system_id in chassis_set:
-                if not self._should_manage_chassis(system_id):
-                    continue
+            managed = sorted(system_id for system_id in chassis_set
+                             if self._should_manage_chassis(system_id))
+            for system_id in managed:
+                with self.trunk_locks.hold([(system_id, physnet)],
+                                           changes=True):
+                    # Ensure trunk exists
+                    trunk_id = self._find_or_create_trunk(system_id, physnet)
+                    if not trunk_id:
+                        LOG.error("Cannot reconcile VLAN %d for chassis %s: "
+                                  "trunk not found/created", vlan_id,
+                                  system_id)
+                        continue
 
-                # Ensure trunk exists
-                trunk_id = self._find_or_create_trunk(system_id, physnet)
-                if not trunk_id:
-                    LOG.error("Cannot reconcile VLAN %d for chassis %s: "
-                              "trunk not found/created", vlan_id, system_id)
-                    continue
+                    # Add or remove this specific VLAN
+                    if action == 'add':
+                        self._ensure_single_subport(
+                            trunk_id, system_id, physnet, vlan_id,
+                            anchor_network_id, segment_id, vni=vni)
+                    elif action == 'remove':
+                        self._remove_single_subport(
+                            trunk_id, system_id, physnet, vlan_id)
 
-                # Add or remove this specific VLAN
-                if action == 'add':
-                    self._ensure_single_subport(
-                        trunk_id, system_id, physnet, vlan_id,
-                        anchor_network_id, segment_id, vni=vni)
-                elif action == 'remove':
-                    self._remove_single_subport(
-                        trunk_id, system_id, physnet, vlan_id)
+            # Keep the desired state up to date
+            if action == 'add':
+                self.desired_state.add_vlan(
+                    [(system_id, physnet) for system_id in managed],
+                    vlan_id, {'vni': vni, 'segment_id': segment_id})
+            elif action == 'remove':
+                self.desired_state.remove_vlan(physnet, vlan_id)
 
             LOG.info("Completed targeted reconciliation for %s VLAN %d "
                      "(VNI: %s) on physnet %s",
@@ -304,8 +915,141 @@ class L2VNITrunkManager:
                 "physnet %s, will retry on next periodic reconciliation",
                 vlan_id, physnet)
         finally:
-            # Clear chassis cache to free memory
+            # Clear caches to free memory
             self._chassis_cache = None
+            self._ovn_snapshot = None
+            self._trunk_cache = {}
+
+    def reconcile_vlans(self, changes):
+        """Targeted reconciliation for a batch of VLANs.
+
+        Called by the agent with the localnet port events coalesced during
+        l2vni_event_coalesce_window. The OVN snapshot, the infrastructure
+        networks and the trunk of each chassis are shared by all the VLANs,
+        and the subports of each trunk are added and removed in batches.
+
+        :param changes: dict {(physnet, action): {vlan_id: network_id}},
+                        action being 'add' or 'remove'. The removals are
+                        reconciled before the additions.
+        """
+        try:
+            LOG.debug("Starting targeted reconciliation of %d VLAN changes",
+                      sum(len(vlans) for vlans in changes.values()))
+
+            # Skip reconciliation if OVN connections are not available
+            if self.ovn_nb_idl is None or self.ovn_sb_idl is None:
+                LOG.error("OVN connections not available, cannot perform "
+                          "targeted reconciliation")
+                return
+
+            # Build OVN indexes and chassis cache once for all the VLANs
+            self._ovn_snapshot = OVNSnapshot(self.ovn_nb_idl,
+                                             self.ovn_sb_idl)
+            self._chassis_cache = self._build_chassis_cache()
+
+            # Ensure infrastructure networks exist (creates if missing),
+            # unless a full reconciliation verified them and nothing
+            # invalidated the desired state since
+            if self.desired_state.get() is None:
+                self._ensure_infrastructure_networks()
+
+            anchor_network_id = self._get_subport_anchor_network_id()
+            if not anchor_network_id:
+                LOG.error("Cannot reconcile VLANs without anchor network")
+                return
+
+            # Remove first, so that a VLAN removed from a network and added
+            # to another one gets the subport of the new network
+            for (physnet, action), vlans in sorted(
+                    changes.items(),
+                    key=lambda change: (change[0][1] != 'remove', change[0])):
+                try:
+                    self._reconcile_physnet_vlans(physnet, action, vlans,
+                                                  anchor_network_id)
+                except (sdkexc.SDKException, ovs_exc.OvsdbAppException):
+                    LOG.exception(
+                        "Failed targeted reconciliation to %s VLANs %s on "
+                        "physnet %s, will retry on next periodic "
+                        "reconciliation", action,
+                        ', '.join(str(vlan_id) for vlan_id in sorted(vlans)),
+                        physnet)
+
+        except (sdkexc.SDKException, ovs_exc.OvsdbAppException):
+            LOG.exception(
+                "Failed targeted reconciliation of VLAN changes, will retry "
+                "on next periodic reconciliation")
+        finally:
+            # Clear caches to free memory
+            self._chassis_cache = None
+            self._ovn_snapshot = None
+            self._trunk_cache = {}
+
+    def _reconcile_physnet_vlans(self, physnet, action, vlans,
+                                 anchor_network_id):
+        """Add or remove VLANs on the trunks of a physical network.
+
+        :param physnet: Physical network name
+        :param action: 'add' or 'remove'
+        :param vlans: dict {vlan_id: network_id}
+        :param anchor_network_id: Subport anchor network UUID
+        """
+        # Get VNI and segment_id for each network if adding
+        vlan_vni_map = {}
+        if action == 'add':
+            for vlan_id, network_id in sorted(vlans.items()):
+                vni, segment_id = self._get_vni_and_segment_for_network(
+                    network_id, physnet, vlan_id)
+                if not segment_id:
+                    LOG.error(
+                        "Cannot create subport: segment not found for "
+                        "network %s VLAN %d on physnet %s. Skipping "
+                        "reconciliation.", network_id, vlan_id, physnet)
+                    continue
+                if not vni:
+                    LOG.warning(
+                        "No VNI found for network %s, subport will "
+                        "not have L2VNI mapping configured", network_id)
+                vlan_vni_map[vlan_id] = {'vni': vni, 'segment_id': segment_id}
+            if not vlan_vni_map:
+                return
+
+        # Find all chassis that have this physnet
+        chassis_set = self._get_all_chassis_with_physnet(physnet)
+        if not chassis_set:
+            LOG.debug("No chassis found with physnet %s", physnet)
+            return
+
+        managed = sorted(system_id for system_id in chassis_set
+                         if self._should_manage_chassis(system_id))
+        for system_id in managed:
+            with self.trunk_locks.hold([(system_id, physnet)],
+                                       changes=True):
+                trunk_id = self._find_or_create_trunk(system_id, physnet)
+                if not trunk_id:
+                    LOG.error("Cannot reconcile VLANs for chassis %s: trunk "
+                              "not found/created", system_id)
+                    continue
+
+                if action == 'add':
+                    self._ensure_subports(trunk_id, system_id, physnet,
+                                          vlan_vni_map, anchor_network_id)
+                elif action == 'remove':
+                    self._remove_vlans(trunk_id, set(vlans))
+
+        # Keep the desired state up to date
+        keys = [(system_id, physnet) for system_id in managed]
+        if action == 'add':
+            for vlan_id, vlan_info in vlan_vni_map.items():
+                self.desired_state.add_vlan(keys, vlan_id, vlan_info)
+        elif action == 'remove':
+            for vlan_id in vlans:
+                self.desired_state.remove_vlan(physnet, vlan_id)
+
+        LOG.info("Completed targeted reconciliation to %s VLANs %s on "
+                 "physnet %s", action,
+                 ', '.join(str(vlan_id) for vlan_id in
+                           sorted(vlan_vni_map or vlans)),
+                 physnet)
 
     def _ensure_infrastructure_networks(self):
         """Ensure ha_chassis_group and subport anchor networks exist.
@@ -330,15 +1074,16 @@ class L2VNITrunkManager:
             LOG.debug("Auto-creation of L2VNI networks is disabled")
             return
 
-        # Ensure subport anchor network exists (for trunk subports)
-        self._ensure_subport_anchor_network()
+        with self._infrastructure_lock:
+            # Ensure subport anchor network exists (for trunk subports)
+            self._ensure_subport_anchor_network()
 
-        # Ensure network per ha_chassis_group (for trunk anchor ports),
-        # but only for groups that contain chassis we manage
-        for ha_group in self._get_ha_chassis_groups():
-            # Check if this group contains any chassis we manage
-            if self._ha_group_has_managed_chassis(ha_group):
-                self._ensure_ha_group_network(ha_group)
+            # Ensure network per ha_chassis_group (for trunk anchor ports),
+            # but only for groups that contain chassis we manage
+            for ha_group in self._get_ha_chassis_groups():
+                # Check if this group contains any chassis we manage
+                if self._ha_group_has_managed_chassis(ha_group):
+                    self._ensure_ha_group_network(ha_group)
 
     def _ha_group_has_managed_chassis(self, ha_group):
         """Check if HA group contains any chassis this agent manages.
@@ -363,9 +1108,9 @@ class L2VNITrunkManager:
         :raises: Exception if network creation fails
         """
         # Check if network exists
-        networks = self.neutron.network.networks(name=network_name)
-        for network in networks:
-            return network.id
+        network_id = self._find_network_id(network_name)
+        if network_id:
+            return network_id
 
         # Create network with configured type
         network_type = CONF.l2vni.l2vni_subport_anchor_network_type
@@ -382,6 +1127,8 @@ class L2VNITrunkManager:
             )
             LOG.info("Created L2VNI network '%s' (%s) with type '%s'",
                      network_name, network.id, network_type)
+            if self._neutron_snapshot is not None:
+                self._neutron_snapshot.networks[network_name] = network
             return network.id
         except sdkexc.BadRequestException as e:
             LOG.error(
@@ -393,6 +1140,24 @@ class L2VNITrunkManager:
                 network_name, network_type, network_type, e)
             raise
 
+    def _find_network_id(self, network_name):
+        """Find a network by name.
+
+        Uses the Neutron snapshot if available (during reconciliation),
+        otherwise queries Neutron.
+
+        :param network_name: Name of the network
+        :returns: Network ID or None
+        """
+        if self._neutron_snapshot is not None:
+            network = self._neutron_snapshot.networks.get(network_name)
+            return network.id if network else None
+
+        networks = self.neutron.network.networks(name=network_name)
+        for network in networks:
+            return network.id
+        return None
+
     def _ensure_subport_anchor_network(self):
         """Ensure the shared subport anchor network exists.
 
@@ -436,7 +1201,7 @@ class L2VNITrunkManager:
         # Access IDL tables: tables['TableName'].rows.values()
         return self.ovn_nb_idl.tables['HA_Chassis_Group'].rows.values()
 
-    def _discover_trunks(self):
+    def _discover_trunks(self, chassis=None):
         """Discover existing trunk ports for network nodes.
 
         Builds a map of (chassis_system_id, physnet) -> trunk_id by:
@@ -444,23 +1209,130 @@ class L2VNITrunkManager:
         2. Getting physnets from bridge-mappings
         3. Looking up or creating trunk ports
 
+        :param chassis: Only discover the trunks of these chassis
+                        system-ids. All managed chassis by default.
         :returns: dict {(system_id, physnet): trunk_id}
         """
-        trunk_map = {}
-
         # Get all chassis in ha_chassis_groups
         chassis_physnets = self._get_chassis_physnets()
 
-        for (system_id, physnet) in chassis_physnets:
-            # Skip chassis this agent doesn't manage (hash ring filtering)
-            if not self._should_manage_chassis(system_id):
-                continue
+        # Skip chassis this agent doesn't manage (hash ring filtering)
+        managed = [(system_id, physnet)
+                   for (system_id, physnet) in chassis_physnets
+                   if (chassis is None or system_id in chassis)
+                   and self._should_manage_chassis(system_id)]
+
+        # Fetch the Ironic ports of the chassis needing them together,
+        # instead of one after another while discovering their trunks
+        self._prefetch_ironic_data(
+            {system_id for system_id, physnet in managed
+             if self._needs_ironic_links(system_id, physnet)})
+
+        trunk_ids = self._run_per_trunk('discover', managed,
+                                        self._find_or_create_trunk)
+        return {key: trunk_id for key, trunk_id in trunk_ids.items()
+                if trunk_id}
+
+    def _run_per_trunk(self, action, keys, func):
+        """Run a function for each trunk, isolating failures.
+
+        Up to l2vni_reconciliation_workers trunks are handled concurrently.
+        An exception raised for a trunk is logged and does not affect the
+        other trunks. Trunks not started before the reconciliation deadline
+        are skipped, they are handled by the next reconciliation.
+
+        Each trunk is locked while handled. Trunks locked by a targeted
+        reconciliation are handled once the other trunks are done, and
+        trunks changed by a targeted reconciliation since this
+        reconciliation started are skipped.
+
+        :param action: Name of the action, for logging
+        :param keys: list of (system_id, physnet) of the trunks
+        :param func: Callable taking the system_id and the physnet
+        :returns: dict {(system_id, physnet): result} of the trunks for
+                  which func completed
+        """
+        deadline = self._reconcile_deadline
+        sequence = self._reconcile_sequence
+        results = {}
+        durations = {}
+        skipped = []
+        busy = []
+        changed = []
+
+        def run(key, blocking=False):
+            if deadline is not None and time.monotonic() >= deadline:
+                skipped.append(key)
+                return
+            with self.trunk_locks.hold([key], blocking=blocking) as held:
+                if not held:
+                    busy.append(key)
+                    return
+                if (sequence is not None
+                        and self.trunk_locks.changed_since(key, sequence)):
+                    changed.append(key)
+                    return
+                start = time.monotonic()
+                try:
+                    results[key] = func(*key)
+                except Exception:
+                    LOG.exception("Failed to %s trunk for chassis %s "
+                                  "physnet %s", action, *key)
+                finally:
+                    durations[key] = time.monotonic() - start
+                    LOG.debug("Trunk %s for chassis %s physnet %s took %.3f "
+                              "seconds", action, key[0], key[1],
+                              durations[key])
+
+        start = time.monotonic()
+        workers = min(CONF.l2vni.l2vni_reconciliation_workers, len(keys))
+        self._map_in_context(workers, run, keys)
+        if busy:
+            # Come back for the trunks locked by targeted reconciliations
+            LOG.debug("Waiting for %d trunks locked by targeted "
+                      "reconciliations", len(busy))
+            self._map_in_context(
+                min(workers, len(busy)),
+                functools.partial(run, blocking=True), list(busy))
+
+        if durations:
+            slowest = max(durations, key=durations.get)
+            LOG.debug("Trunk %s of %d trunks took %.3f seconds with %d "
+                      "workers, slowest was chassis %s physnet %s with %.3f "
+                      "seconds", action, len(durations),
+                      time.monotonic() - start, max(workers, 1),
+                      slowest[0], slowest[1], durations[slowest])
+        if changed:
+            LOG.debug("Skipped trunk %s for %d trunks changed by targeted "
+                      "reconciliations", action, len(changed))
+        if skipped:
+            LOG.warning("L2VNI reconciliation deadline reached, skipped "
+                        "trunk %s for %d of %d trunks until the next "
+                        "reconciliation", action, len(skipped), len(keys))
+        return results
+
+    def _map_in_context(self, workers, func, keys):
+        """Call a function for each key, in worker threads if several.
+
+        The worker threads share the reconciliation context of the caller.
+
+        :param workers: Number of worker threads
+        :param func: Callable taking a key
+        :param keys: list of keys
+        """
+        if workers <= 1:
+            for key in keys:
+                func(key)
+            return
+
+        context = dict(vars(self._context))
 
-            trunk_id = self._find_or_create_trunk(system_id, physnet)
-            if trunk_id:
-                trunk_map[(system_id, physnet)] = trunk_id
+        def run(key):
+            vars(self._context).update(context)
+            func(key)
 
-        return trunk_map
+        with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(run, keys))
 
     def _get_chassis_physnets(self):
         """Get all (chassis_system_id, physnet) combinations.
@@ -479,6 +1351,13 @@ class L2VNITrunkManager:
                 chassis_names.add(ha_chassis.chassis_name)
 
         # Get physnets for each chassis
+        if self._ovn_snapshot is not None:
+            for system_id in chassis_names:
+                for physnet in self._ovn_snapshot.bridge_mappings.get(
+                        system_id, ()):
+                    chassis_physnets.add((system_id, physnet))
+            return chassis_physnets
+
         for chassis in self.ovn_sb_idl.tables['Chassis'].rows.values():
             if chassis.name not in chassis_names:
                 continue
@@ -501,18 +1380,7 @@ class L2VNITrunkManager:
         :param bridge_mappings_str: String like "physnet1:br-ex,physnet2:br2"
         :returns: List of physical network names
         """
-        physnets = []
-        if not bridge_mappings_str:
-            return physnets
-
-        for mapping in bridge_mappings_str.split(','):
-            if ':' not in mapping:
-                continue
-            physnet = mapping.split(':')[0].strip()
-            if physnet:
-                physnets.append(physnet)
-
-        return physnets
+        return list(_parse_physnet_bridges(bridge_mappings_str))
 
     def _find_or_create_trunk(self, system_id, physnet):
         """Find existing trunk or create new one.
@@ -530,8 +1398,15 @@ class L2VNITrunkManager:
 
         # Try to find existing trunk
         trunk_name = _get_trunk_name(system_id, physnet)
-        trunks = self.neutron.network.trunks(name=trunk_name)
+        if self._neutron_snapshot is not None:
+            trunk = self._neutron_snapshot.trunks.get(trunk_name)
+            trunks = [trunk] if trunk else []
+        else:
+            trunks = self.neutron.network.trunks(name=trunk_name)
         for trunk in trunks:
+            # The listed trunk includes its subports, keep it for the
+            # subport reconciliation
+            self._trunk_cache[trunk.id] = trunk
             return trunk.id
 
         # Create trunk
@@ -546,6 +1421,9 @@ class L2VNITrunkManager:
                 admin_state_up=True
             )
             LOG.debug("Created trunk %s", trunk.id)
+            if self._neutron_snapshot is not None:
+                self._neutron_snapshot.trunks[trunk_name] = trunk
+            self._trunk_cache[trunk.id] = trunk
             return trunk.id
 
         except sdkexc.SDKException:
@@ -570,7 +1448,11 @@ class L2VNITrunkManager:
         port_name = _get_anchor_port_name(system_id, physnet)
 
         # Try to find existing port
-        ports = self.neutron.network.ports(name=port_name)
+        if self._neutron_snapshot is not None:
+            port = self._neutron_snapshot.anchor_ports.get(port_name)
+            ports = [port] if port else []
+        else:
+            ports = self.neutron.network.ports(name=port_name)
         for port in ports:
             binding_profile = port.binding_profile or {}
             current_local_link_info = binding_profile.get(
@@ -635,6 +1517,8 @@ class L2VNITrunkManager:
                 binding_profile=binding_profile
             )
             LOG.debug("Created anchor port %s", port.id)
+            if self._neutron_snapshot is not None:
+                self._neutron_snapshot.anchor_ports[port_name] = port
             return port.id
 
         except sdkexc.SDKException:
@@ -658,14 +1542,9 @@ class L2VNITrunkManager:
 
                 # Found the group, find its network
                 network_name = _get_ha_group_network_name(ha_group.name)
-                networks = self.neutron.network.networks(
-                    name=network_name)
-                # networks should be a list, because were asking the api
-                # for a list of networks matching the name with a single
-                # resulting entry if found, otherwise an empty list.
-                for network in networks:
-                    # If we have a match, return the first entry.
-                    return network.id
+                network_id = self._find_network_id(network_name)
+                if network_id:
+                    return network_id
 
         return None
 
@@ -681,6 +1560,8 @@ class L2VNITrunkManager:
         # Use cache if available (during reconciliation)
         if self._chassis_cache is not None:
             return self._chassis_cache.get(chassis_name)
+        if self._ovn_snapshot is not None:
+            return self._ovn_snapshot.chassis.get(chassis_name)
 
         # Fallback to direct lookup (outside reconciliation)
         for chassis in self.ovn_sb_idl.tables['Chassis'].rows.values():
@@ -695,6 +1576,9 @@ class L2VNITrunkManager:
         :param ls_name: Logical switch name
         :returns: Logical_Switch row or None
         """
+        if self._ovn_snapshot is not None:
+            return self._ovn_snapshot.logical_switches.get(ls_name)
+
         ls_table = self.ovn_nb_idl.tables['Logical_Switch']
         for ls in ls_table.rows.values():
             if ls.name == ls_name:
@@ -725,6 +1609,20 @@ class L2VNITrunkManager:
         chassis_vlan_vni_map = {}
 
         networks_with_segments = self._get_networks_with_segments()
+        if not networks_with_segments:
+            return chassis_vlan_vni_map
+
+        localnet_physnets, router_chassis = (
+            self._compile_switch_requirements())
+        # Managed chassis per physnet, and whether a chassis is managed,
+        # computed once instead of for every segment
+        physnet_chassis = {}
+        managed = {}
+
+        def _is_managed(system_id):
+            if system_id not in managed:
+                managed[system_id] = self._should_manage_chassis(system_id)
+            return managed[system_id]
 
         for network_id, segment_info in networks_with_segments.items():
             # Extract VNI from overlay segments
@@ -745,40 +1643,101 @@ class L2VNITrunkManager:
                         network_id, len(vni_segments), vni,
                         vni_segments[0].network_type)
 
+            ls_name = ovn_utils.ovn_name(network_id)
+            ls_physnets = localnet_physnets.get(ls_name, ())
+            ls_router_chassis = [
+                system_id for system_id in router_chassis.get(ls_name, ())
+                if _is_managed(system_id)]
+
             for segment in segment_info['vlan_segments']:
                 physnet = segment.physical_network
                 vlan_id = segment.segmentation_id
-                segment_id = segment.id
-
-                chassis_set = self._find_chassis_for_network(
-                    network_id, physnet)
+                vlan_info = {'vni': vni, 'segment_id': segment.id}
+
+                # A localnet port means all chassis with this physnet need
+                # the VLAN, router ports add the chassis hosting them.
+                chassis_set = set(ls_router_chassis)
+                if physnet in ls_physnets:
+                    if physnet not in physnet_chassis:
+                        physnet_chassis[physnet] = [
+                            system_id for system_id in
+                            self._get_all_chassis_with_physnet(physnet)
+                            if _is_managed(system_id)]
+                    chassis_set.update(physnet_chassis[physnet])
 
                 for system_id in chassis_set:
-                    if not self._should_manage_chassis(system_id):
-                        continue
-
-                    key = (system_id, physnet)
-                    if key not in chassis_vlan_vni_map:
-                        chassis_vlan_vni_map[key] = {}
-                    chassis_vlan_vni_map[key][vlan_id] = {
-                        'vni': vni,
-                        'segment_id': segment_id
-                    }
+                    chassis_vlan_vni_map.setdefault(
+                        (system_id, physnet), {})[vlan_id] = vlan_info
 
         return chassis_vlan_vni_map
 
+    def _compile_switch_requirements(self):
+        """Compile the VLAN requirements of every logical switch.
+
+        Walks the ports of every logical switch once, each
+        Logical_Switch_Port belonging to a single switch, and resolves the
+        chassis of each HA chassis group once.
+
+        :returns: tuple (localnet_physnets, router_chassis) where
+                  localnet_physnets is a dict {ls_name: set of physnets}
+                  of the localnet ports on each switch, and router_chassis
+                  is a dict {ls_name: set of system_ids} of the chassis
+                  hosting the router ports connected to each switch
+        """
+        if self._ovn_snapshot is not None:
+            switches = self._ovn_snapshot.logical_switches.values()
+        else:
+            switches = self.ovn_nb_idl.tables['Logical_Switch'].rows.values()
+        lrp_rows = self.ovn_nb_idl.tables['Logical_Router_Port'].rows
+
+        localnet_physnets = {}
+        router_chassis = {}
+        ha_group_chassis = {}
+        for ls in switches:
+            for lsp in ls.ports:
+                if lsp.type == 'localnet':
+                    physnet = lsp.options.get('network_name')
+                    if physnet:
+                        localnet_physnets.setdefault(ls.name, set()).add(
+                            physnet)
+                    continue
+
+                if lsp.type != 'router':
+                    continue
+                lrp = lrp_rows.get(lsp.options.get('router-port'))
+                if not lrp:
+                    continue
+                if lrp.ha_chassis_group:
+                    group_name = lrp.ha_chassis_group[0].name
+                    if group_name not in ha_group_chassis:
+                        ha_group_chassis[group_name] = (
+                            self._get_chassis_for_lrp(lrp))
+                    chassis_set = ha_group_chassis[group_name]
+                else:
+                    chassis_set = self._get_chassis_for_lrp(lrp)
+                router_chassis.setdefault(ls.name, set()).update(chassis_set)
+
+        return localnet_physnets, router_chassis
+
     def _get_networks_with_segments(self):
         """Get networks with their VLAN and overlay segments.
 
+        Only VLAN and overlay segments are listed, filtered by the Neutron
+        server. The segment cache is replaced with the result.
+
         :returns: dict {network_id: {
             'vlan_segments': [segment objects],
             'vni_segments': [segment objects]
         }}
         """
         networks = {}
+        # Read the network revisions before listing, so that cached
+        # segments are never tagged with a newer revision than theirs
+        revisions = self._get_network_revisions()
 
         try:
-            segments = self.neutron.network.segments()
+            segments = self.neutron.network.segments(
+                network_type=SEGMENT_NETWORK_TYPES)
             for segment in segments:
                 network_id = segment.network_id
                 if network_id not in networks:
@@ -789,16 +1748,77 @@ class L2VNITrunkManager:
 
                 if segment.network_type == n_const.TYPE_VLAN:
                     networks[network_id]['vlan_segments'].append(segment)
-                elif segment.network_type in [n_const.TYPE_VXLAN,
-                                              n_const.TYPE_GENEVE]:
+                elif segment.network_type in OVERLAY_NETWORK_TYPES:
                     networks[network_id]['vni_segments'].append(segment)
 
         except sdkexc.SDKException:
             LOG.exception("Failed to get networks with VLAN and overlay "
                           "segments")
+            return networks
 
+        self._segment_cache = {
+            network_id: dict(segment_info,
+                             revision=revisions.get(network_id))
+            for network_id, segment_info in networks.items()}
         return networks
 
+    def _get_network_revisions(self):
+        """Get the revision of the networks from their OVN logical switch.
+
+        :returns: dict {network_id: revision_number}
+        """
+        if self._ovn_snapshot is not None:
+            switches = self._ovn_snapshot.logical_switches.values()
+        else:
+            switches = self.ovn_nb_idl.tables['Logical_Switch'].rows.values()
+        prefix = ovn_utils.ovn_name('')
+        revisions = {}
+        for ls in switches:
+            if ls.name.startswith(prefix):
+                revisions[ls.name[len(prefix):]] = ls.external_ids.get(
+                    ovn_const.OVN_REV_NUM_EXT_ID_KEY)
+        return revisions
+
+    def _get_network_revision(self, network_id):
+        """Get the revision of a network from its OVN logical switch.
+
+        :param network_id: Neutron network UUID
+        :returns: revision_number, or None if unknown
+        """
+        ls = self._get_logical_switch_by_name(ovn_utils.ovn_name(network_id))
+        if not ls:
+            return None
+        return ls.external_ids.get(ovn_const.OVN_REV_NUM_EXT_ID_KEY)
+
+    def _get_network_segments(self, network_id):
+        """Get the VLAN and overlay segments of a network.
+
+        Served from the segment cache while the revision of the network in
+        OVN is unchanged, fetched from Neutron otherwise.
+
+        :param network_id: Neutron network UUID
+        :returns: dict {'vlan_segments': [segment objects],
+                        'vni_segments': [segment objects]}
+        :raises: SDKException if the segments cannot be fetched
+        """
+        revision = self._get_network_revision(network_id)
+        cached = self._segment_cache.get(network_id)
+        if (cached is not None and revision is not None
+                and cached['revision'] == revision):
+            return cached
+
+        segment_info = {'revision': revision,
+                        'vlan_segments': [],
+                        'vni_segments': []}
+        for segment in self.neutron.network.segments(
+                network_id=network_id, network_type=SEGMENT_NETWORK_TYPES):
+            if segment.network_type == n_const.TYPE_VLAN:
+                segment_info['vlan_segments'].append(segment)
+            elif segment.network_type in OVERLAY_NETWORK_TYPES:
+                segment_info['vni_segments'].append(segment)
+        self._segment_cache[network_id] = segment_info
+        return segment_info
+
     def _get_vni_and_segment_for_network(self, network_id, physnet, vlan_id):
         """Get VNI and segment_id for a network.
 
@@ -812,66 +1832,22 @@ class L2VNITrunkManager:
         segment_id = None
 
         try:
-            segments = self.neutron.network.segments(network_id=network_id)
-            for segment in segments:
-
-                # Extract VNI from overlay segment
-                if segment.network_type in [n_const.TYPE_VXLAN,
-                                            n_const.TYPE_GENEVE]:
-                    vni = segment.segmentation_id
-
-                # Extract segment_id from matching VLAN segment
-                if (segment.network_type == n_const.TYPE_VLAN
-                        and segment.physical_network == physnet
-                        and segment.segmentation_id == vlan_id):
-                    segment_id = segment.id
-
+            segment_info = self._get_network_segments(network_id)
         except sdkexc.SDKException:
             LOG.exception("Failed to get segments for network %s", network_id)
+            return vni, segment_id
 
-        return vni, segment_id
-
-    def _find_chassis_for_network(self, network_id, physnet):
-        """Find chassis that need a specific network's VLAN.
+        # Extract VNI from overlay segment
+        for segment in segment_info['vni_segments']:
+            vni = segment.segmentation_id
 
-        :param network_id: Neutron network UUID
-        :param physnet: Physical network name
-        :returns: set of system_ids
-        """
-        chassis_set = set()
-
-        # Check for localnet ports - if they exist, all chassis with
-        # this physnet need the VLAN
-        if self._has_localnet_port(network_id, physnet):
-            chassis_set.update(self._get_all_chassis_with_physnet(physnet))
-
-        # Check for router ports with ha_chassis_group
-        chassis_set.update(
-            self._get_chassis_for_router_ports(network_id, physnet))
-
-        return chassis_set
-
-    def _has_localnet_port(self, network_id, physnet):
-        """Check if network has a localnet port on physnet.
-
-        :param network_id: Neutron network UUID
-        :param physnet: Physical network name
-        :returns: bool
-        """
-        ls_name = ovn_utils.ovn_name(network_id)
-        target_ls = self._get_logical_switch_by_name(ls_name)
-        if not target_ls:
-            return False
-
-        # Check if any port on this switch is a localnet for physnet
-        for lsp in target_ls.ports:
-            if lsp.type != 'localnet':
-                continue
-
-            if lsp.options.get('network_name') == physnet:
-                return True
+        # Extract segment_id from matching VLAN segment
+        for segment in segment_info['vlan_segments']:
+            if (segment.physical_network == physnet
+                    and segment.segmentation_id == vlan_id):
+                segment_id = segment.id
 
-        return False
+        return vni, segment_id
 
     def _get_all_chassis_with_physnet(self, physnet):
         """Get all chassis that have a specific physnet.
@@ -879,6 +1855,9 @@ class L2VNITrunkManager:
         :param physnet: Physical network name
         :returns: set of system_ids (chassis names)
         """
+        if self._ovn_snapshot is not None:
+            return set(self._ovn_snapshot.physnet_chassis.get(physnet, ()))
+
         chassis_set = set()
 
         for chassis in self.ovn_sb_idl.tables['Chassis'].rows.values():
@@ -892,41 +1871,6 @@ class L2VNITrunkManager:
 
         return chassis_set
 
-    def _get_chassis_for_router_ports(self, network_id, physnet):
-        """Get chassis hosting router ports on this network.
-
-        :param network_id: Neutron network UUID
-        :param physnet: Physical network name
-        :returns: set of system_ids
-        """
-        chassis_set = set()
-
-        ls_name = ovn_utils.ovn_name(network_id)
-        target_ls = self._get_logical_switch_by_name(ls_name)
-        if not target_ls:
-            return chassis_set
-
-        lrp_table = self.ovn_nb_idl.tables['Logical_Router_Port']
-
-        # Build set of router-port LRP names on this switch
-        # by iterating through the switch's ports once
-        router_lrp_names = set()
-        for lsp in target_ls.ports:
-            if lsp.type != 'router':
-                continue
-
-            router_port_name = lsp.options.get('router-port')
-            if router_port_name:
-                router_lrp_names.add(router_port_name)
-
-        # Get chassis for each connected LRP
-        for lrp_name in router_lrp_names:
-            lrp = lrp_table.rows.get(lrp_name)
-            if lrp:
-                chassis_set.update(self._get_chassis_for_lrp(lrp))
-
-        return chassis_set
-
     def _get_chassis_for_lrp(self, lrp):
         """Get chassis assigned to a logical router port.
 
@@ -969,10 +1913,35 @@ class L2VNITrunkManager:
             LOG.error("Cannot reconcile subports without anchor network")
             return
 
-        for (system_id, physnet), trunk_id in trunk_map.items():
+        def reconcile_trunk(system_id, physnet):
             vlan_vni_map = required_vlans.get((system_id, physnet), {})
             self._reconcile_trunk_subports(
-                trunk_id, system_id, physnet, vlan_vni_map, subport_anchor_net)
+                trunk_map[(system_id, physnet)], system_id, physnet,
+                vlan_vni_map, subport_anchor_net)
+
+        # Only diff the trunks whose subports do not match the digest of
+        # their required VLANs
+        out_of_sync = [key for key, trunk_id in trunk_map.items()
+                       if not self._trunk_in_sync(trunk_id, key)]
+        LOG.debug("%d of %d trunks in sync with the desired state, "
+                  "reconciling %d", len(trunk_map) - len(out_of_sync),
+                  len(trunk_map), len(out_of_sync))
+        self._run_per_trunk('reconcile', out_of_sync, reconcile_trunk)
+
+    def _trunk_in_sync(self, trunk_id, key):
+        """Check if the subports of a listed trunk match its required VLANs.
+
+        :param trunk_id: Trunk UUID
+        :param key: (system_id, physnet) of the trunk
+        :returns: True if the digests of the current and the required
+                  VLANs of the trunk are equal
+        """
+        desired = self.desired_state.digest(key)
+        trunk = self._trunk_cache.get(trunk_id)
+        if desired is None or trunk is None:
+            return False
+        return desired == _trunk_digest(
+            sp['segmentation_id'] for sp in trunk.sub_ports)
 
     def _get_subport_anchor_network_id(self):
         """Get the subport anchor network ID.
@@ -980,10 +1949,7 @@ class L2VNITrunkManager:
         :returns: Network ID or None
         """
         network_name = CONF.l2vni.l2vni_subport_anchor_network
-        networks = self.neutron.network.networks(name=network_name)
-        for network in networks:
-            return network.id
-        return None
+        return self._find_network_id(network_name)
 
     def _reconcile_trunk_subports(self, trunk_id, system_id, physnet,
                                   vlan_vni_map, anchor_network_id):
@@ -996,17 +1962,71 @@ class L2VNITrunkManager:
                                               'segment_id': segment_id}}
         :param anchor_network_id: Subport anchor network UUID
         """
-        # Get current subports
+        # Get current subports, from the trunk listed during discovery
         try:
-            trunk = self.neutron.network.get_trunk(trunk_id)
-            current_subports = {sp['segmentation_id']: sp['port_id']
-                                for sp in trunk.sub_ports}
+            trunk = self._get_trunk(trunk_id)
+        except sdkexc.SDKException:
+            LOG.exception("Failed to get trunk %s", trunk_id)
+            return
+
+        if self._sync_trunk_subports(trunk, system_id, physnet,
+                                     vlan_vni_map, anchor_network_id):
+            return
+
+        # A subport change failed, the trunk may have been changed since it
+        # was listed. Fetch it again and retry with its current subports.
+        try:
+            current_trunk = self._get_trunk(trunk_id, refresh=True)
         except sdkexc.SDKException:
             LOG.exception("Failed to get trunk %s", trunk_id)
             return
+        if not _trunk_changed(trunk, current_trunk):
+            return
+        LOG.debug("Trunk %s changed since it was listed (revision %s, now "
+                  "%s), retrying subport reconciliation", trunk_id,
+                  getattr(trunk, 'revision_number', None),
+                  getattr(current_trunk, 'revision_number', None))
+        self._sync_trunk_subports(current_trunk, system_id, physnet,
+                                  vlan_vni_map, anchor_network_id)
+
+    def _get_trunk(self, trunk_id, refresh=False):
+        """Get a trunk with its subports.
+
+        Trunks listed or created during the current reconciliation are
+        reused, Neutron is only queried for other trunks or when refresh
+        is requested.
+
+        :param trunk_id: Trunk UUID
+        :param refresh: Fetch the trunk from Neutron even if it is known
+        :returns: Trunk
+        :raises: SDKException if the trunk cannot be fetched
+        """
+        trunk = None if refresh else self._trunk_cache.get(trunk_id)
+        if trunk is None:
+            trunk = self.neutron.network.get_trunk(trunk_id)
+            self._trunk_cache[trunk_id] = trunk
+        return trunk
+
+    def _sync_trunk_subports(self, trunk, system_id, physnet, vlan_vni_map,
+                             anchor_network_id):
+        """Add and remove subports of a trunk to match the required VLANs.
+
+        :param trunk: Trunk, with its subports
+        :param system_id: Chassis system-id
+        :param physnet: Physical network name
+        :param vlan_vni_map: dict {vlan_id: {'vni': vni,
+                                              'segment_id': segment_id}}
+        :param anchor_network_id: Subport anchor network UUID
+        :returns: True if all subport changes succeeded
+        """
+        trunk_id = trunk.id
+        current_subports = {sp['segmentation_id']: sp['port_id']
+                            for sp in trunk.sub_ports}
+        success = True
 
         # Add missing subports with VNI and segment_id
-        for vlan_id in vlan_vni_map.keys() - set(current_subports.keys()):
+        missing_subports = []
+        for vlan_id in sorted(vlan_vni_map.keys() - current_subports.keys()):
             vlan_info = vlan_vni_map.get(vlan_id)
             if isinstance(vlan_info, dict):
                 vni = vlan_info.get('vni')
@@ -1020,13 +2040,136 @@ class L2VNITrunkManager:
                     "This indicates a bug in _calculate_required_vlans().",
                     vlan_id)
                 continue
-            self._add_subport(trunk_id, system_id, physnet, vlan_id,
-                              anchor_network_id, segment_id, vni=vni)
+            missing_subports.append((vlan_id, segment_id, vni))
+        if missing_subports and not self._add_subports(
+                trunk_id, system_id, physnet, missing_subports,
+                anchor_network_id):
+            success = False
 
         # Remove extra subports
-        for vlan_id in set(current_subports.keys()) - vlan_vni_map.keys():
-            self._remove_subport(trunk_id, current_subports[vlan_id],
-                                 system_id, physnet, vlan_id)
+        extra_vlans = sorted(current_subports.keys() - vlan_vni_map.keys())
+        if extra_vlans and not self._remove_subports(
+                trunk_id, [(current_subports[vlan_id], vlan_id)
+                           for vlan_id in extra_vlans]):
+            success = False
+
+        return success
+
+    def _get_subport_attrs(self, system_id, physnet, vlan_id,
+                           anchor_network_id, segment_id, vni=None):
+        """Get the attributes of the port of a subport.
+
+        :param system_id: Chassis system-id
+        :param physnet: Physical network name
+        :param vlan_id: VLAN ID for segmentation
+        :param anchor_network_id: Subport anchor network UUID
+        :param segment_id: Neutron VLAN segment UUID
+        :param vni: VNI for L2VNI mapping (optional, None for pure VLAN
+                    networks)
+        :returns: dict of port attributes
+        """
+        # Build binding profile with segment_id and VNI
+        binding_profile = {
+            'physical_network': physnet,
+            'segment_id': segment_id
+        }
+        if vni:
+            binding_profile['vni'] = vni
+
+        return {
+            'name': _get_subport_name(system_id, physnet, vlan_id),
+            'network_id': anchor_network_id,
+            'device_owner': DEVICE_OWNER_L2VNI_SUBPORT,
+            'admin_state_up': True,
+            'binding_vnic_type': 'baremetal',
+            'binding_profile': binding_profile,
+        }
+
+    def _add_subports(self, trunk_id, system_id, physnet, subports,
+                      anchor_network_id):
+        """Add subports to a trunk in batches.
+
+        The ports of each batch of l2vni_subport_batch_size subports are
+        created with a single bulk request and attached to the trunk with
+        a single request. The subports of a batch that fails are retried
+        one at a time.
+
+        :param trunk_id: Trunk UUID
+        :param system_id: Chassis system-id
+        :param physnet: Physical network name
+        :param subports: list of (vlan_id, segment_id, vni) tuples
+        :param anchor_network_id: Subport anchor network UUID
+        :returns: True if all the subports were added
+        """
+        batch_size = CONF.l2vni.l2vni_subport_batch_size
+        success = True
+        for start in range(0, len(subports), batch_size):
+            batch = subports[start:start + batch_size]
+            if len(batch) > 1 and self._add_subport_batch(
+                    trunk_id, system_id, physnet, batch, anchor_network_id):
+                continue
+            for vlan_id, segment_id, vni in batch:
+                if not self._add_subport(trunk_id, system_id, physnet,
+                                         vlan_id, anchor_network_id,
+                                         segment_id, vni=vni):
+                    success = False
+        return success
+
+    def _add_subport_batch(self, trunk_id, system_id, physnet, batch,
+                           anchor_network_id):
+        """Create the ports of subports in bulk and attach them to a trunk.
+
+        Ports created for a batch that cannot be attached are deleted, so
+        that retrying the subports does not leave unattached ports behind.
+
+        :param trunk_id: Trunk UUID
+        :param system_id: Chassis system-id
+        :param physnet: Physical network name
+        :param batch: list of (vlan_id, segment_id, vni) tuples
+        :param anchor_network_id: Subport anchor network UUID
+        :returns: True if all the subports of the batch were added
+        """
+        # The trunk subports change, don't reuse the listed trunk
+        self._trunk_cache.pop(trunk_id, None)
+        vlan_by_name = {}
+        ports_attrs = []
+        for vlan_id, segment_id, vni in batch:
+            attrs = self._get_subport_attrs(system_id, physnet, vlan_id,
+                                            anchor_network_id, segment_id,
+                                            vni=vni)
+            vlan_by_name[attrs['name']] = vlan_id
+            ports_attrs.append(attrs)
+
+        LOG.debug("Creating %d subports for trunk %s (VLANs %d-%d)",
+                  len(batch), trunk_id, batch[0][0], batch[-1][0])
+        try:
+            ports = list(self.neutron.network.create_ports(ports_attrs))
+        except sdkexc.SDKException:
+            LOG.warning("Failed to create %d subports for trunk %s in bulk, "
+                        "retrying one at a time", len(batch), trunk_id,
+                        exc_info=True)
+            return False
+
+        try:
+            self.neutron.network.add_trunk_subports(
+                trunk_id,
+                [{'port_id': port.id,
+                  'segmentation_type': 'vlan',
+                  'segmentation_id': vlan_by_name[port.name]}
+                 for port in ports])
+        except sdkexc.SDKException:
+            LOG.warning("Failed to add %d subports to trunk %s, retrying "
+                        "one at a time", len(ports), trunk_id, exc_info=True)
+            for port in ports:
+                try:
+                    self.neutron.network.delete_port(port.id)
+                except sdkexc.SDKException:
+                    LOG.exception("Failed to delete unattached subport %s",
+                                  port.id)
+            return False
+
+        LOG.debug("Added %d subports to trunk %s", len(ports), trunk_id)
+        return True
 
     def _add_subport(self, trunk_id, system_id, physnet, vlan_id,
                      anchor_network_id, segment_id, vni=None):
@@ -1045,8 +2188,11 @@ class L2VNITrunkManager:
         :param segment_id: Neutron VLAN segment UUID
         :param vni: VNI for L2VNI mapping (optional, None for pure VLAN
                     networks)
+        :returns: True if the subport was added
         """
         port_name = _get_subport_name(system_id, physnet, vlan_id)
+        # The trunk subports change, don't reuse the listed trunk
+        self._trunk_cache.pop(trunk_id, None)
 
         try:
             # Create port
@@ -1054,22 +2200,10 @@ class L2VNITrunkManager:
                       "VNI: %s)", port_name, trunk_id, segment_id,
                       vni if vni else 'none')
 
-            # Build binding profile with segment_id and VNI
-            binding_profile = {
-                'physical_network': physnet,
-                'segment_id': segment_id
-            }
-            if vni:
-                binding_profile['vni'] = vni
-
             port = self.neutron.network.create_port(
-                name=port_name,
-                network_id=anchor_network_id,
-                device_owner=DEVICE_OWNER_L2VNI_SUBPORT,
-                admin_state_up=True,
-                binding_vnic_type='baremetal',
-                binding_profile=binding_profile
-            )
+                **self._get_subport_attrs(system_id, physnet, vlan_id,
+                                          anchor_network_id, segment_id,
+                                          vni=vni))
 
             # Add as subport
             self.neutron.network.add_trunk_subports(
@@ -1080,36 +2214,72 @@ class L2VNITrunkManager:
             )
             LOG.debug("Added subport %s (VLAN %d, VNI: %s) to trunk %s",
                       port.id, vlan_id, vni if vni else 'none', trunk_id)
+            return True
 
         except sdkexc.SDKException:
             LOG.exception("Failed to add subport for trunk %s VLAN %d",
                           trunk_id, vlan_id)
+            return False
+
+    def _remove_subports(self, trunk_id, subports):
+        """Remove subports from a trunk.
 
-    def _remove_subport(self, trunk_id, port_id, system_id, physnet, vlan_id):
-        """Remove a subport from a trunk.
+        The subports are detached from the trunk with a single request,
+        then their ports are deleted concurrently.
 
         :param trunk_id: Trunk UUID
-        :param port_id: Subport UUID
-        :param system_id: Chassis system-id
-        :param physnet: Physical network name
-        :param vlan_id: VLAN ID
+        :param subports: list of (port_id, vlan_id) tuples
+        :returns: True if all the subports were removed
         """
+        # The trunk subports change, don't reuse the listed trunk
+        self._trunk_cache.pop(trunk_id, None)
+        port_ids = [port_id for port_id, _vlan_id in subports]
         try:
-            LOG.debug("Removing subport %s (VLAN %d) from trunk %s",
-                      port_id, vlan_id, trunk_id)
+            LOG.debug("Removing subports %s (VLANs %s) from trunk %s",
+                      ', '.join(port_ids),
+                      ', '.join(str(vlan_id) for _port_id, vlan_id
+                                in subports),
+                      trunk_id)
 
             # Remove from trunk
             self.neutron.network.delete_trunk_subports(
-                trunk_id, [{'port_id': port_id}])
+                trunk_id, [{'port_id': port_id} for port_id in port_ids])
 
-            # Delete port
-            self.neutron.network.delete_port(port_id)
+        except sdkexc.SDKException:
+            LOG.exception("Failed to remove subports %s from trunk %s",
+                          ', '.join(port_ids), trunk_id)
+            return False
 
-            LOG.debug("Removed subport %s from trunk %s", port_id, trunk_id)
+        # Delete ports
+        if not self._delete_ports(port_ids):
+            return False
 
-        except sdkexc.SDKException:
-            LOG.exception("Failed to remove subport %s from trunk %s",
-                          port_id, trunk_id)
+        LOG.debug("Removed %d subports from trunk %s", len(port_ids),
+                  trunk_id)
+        return True
+
+    def _delete_ports(self, port_ids):
+        """Delete ports, up to l2vni_port_delete_workers concurrently.
+
+        :param port_ids: list of port UUIDs
+        :returns: True if all the ports were deleted
+        """
+        def delete(port_id):
+            try:
+                self.neutron.network.delete_port(port_id)
+                return True
+            except sdkexc.SDKException:
+                LOG.exception("Failed to delete port %s", port_id)
+                return False
+
+        workers = CONF.l2vni.l2vni_port_delete_workers
+        if workers > 1 and len(port_ids) > 1:
+            with futures.ThreadPoolExecutor(
+                    max_workers=min(workers, len(port_ids))) as executor:
+                results = list(executor.map(delete, port_ids))
+        else:
+            results = [delete(port_id) for port_id in port_ids]
+        return all(results)
 
     def _ensure_single_subport(self, trunk_id, system_id, physnet, vlan_id,
                                anchor_network_id, segment_id, vni=None):
@@ -1126,22 +2296,88 @@ class L2VNITrunkManager:
         :param vni: VNI for L2VNI mapping (optional, None for pure VLAN
                     networks)
         """
+        self._ensure_subports(
+            trunk_id, system_id, physnet,
+            {vlan_id: {'vni': vni, 'segment_id': segment_id}},
+            anchor_network_id)
+
+    def _ensure_subports(self, trunk_id, system_id, physnet, vlan_vni_map,
+                         anchor_network_id):
+        """Ensure subports exist on a trunk.
+
+        Idempotent - only creates the subports missing from the trunk.
+
+        :param trunk_id: Trunk UUID
+        :param system_id: Chassis system-id
+        :param physnet: Physical network name
+        :param vlan_vni_map: dict {vlan_id: {'vni': vni,
+                                              'segment_id': segment_id}}
+        :param anchor_network_id: Subport anchor network UUID
+        """
         try:
-            trunk = self.neutron.network.get_trunk(trunk_id)
-            existing_vlans = {sp['segmentation_id'] for sp in trunk.sub_ports}
+            trunk = self._get_trunk(trunk_id)
+            for attempt in range(2):
+                existing_vlans = {sp['segmentation_id']
+                                  for sp in trunk.sub_ports}
+                missing_subports = [
+                    (vlan_id, vlan_info['segment_id'], vlan_info['vni'])
+                    for vlan_id, vlan_info in sorted(vlan_vni_map.items())
+                    if vlan_id not in existing_vlans]
+
+                if not missing_subports:
+                    LOG.debug("Subports for VLANs %s already exist on trunk "
+                              "%s", ', '.join(str(vlan_id) for vlan_id
+                                              in sorted(vlan_vni_map)),
+                              trunk_id)
+                    return
 
-            if vlan_id in existing_vlans:
-                LOG.debug("Subport for VLAN %d already exists on trunk %s",
-                          vlan_id, trunk_id)
+                # Add the subports
+                if (self._add_subports(trunk_id, system_id, physnet,
+                                       missing_subports, anchor_network_id)
+                        or attempt):
+                    return
+
+                # Retry if the trunk changed since it was listed
+                current_trunk = self._get_trunk(trunk_id, refresh=True)
+                if not _trunk_changed(trunk, current_trunk):
+                    return
+                trunk = current_trunk
+
+        except sdkexc.SDKException:
+            LOG.exception("Failed to ensure subports for VLANs %s on trunk "
+                          "%s", ', '.join(str(vlan_id) for vlan_id
+                                          in sorted(vlan_vni_map)),
+                          trunk_id)
+
+    def _remove_vlans(self, trunk_id, vlan_ids):
+        """Remove the subports of VLANs from a trunk if they exist.
+
+        Idempotent - only removes the subports present on the trunk.
+
+        :param trunk_id: Trunk UUID
+        :param vlan_ids: set of VLAN IDs to remove
+        """
+        try:
+            trunk = self._get_trunk(trunk_id)
+            subports = sorted(
+                ((sp['port_id'], sp['segmentation_id'])
+                 for sp in trunk.sub_ports
+                 if sp['segmentation_id'] in vlan_ids),
+                key=lambda subport: subport[1])
+            if not subports:
+                LOG.debug("Subports for VLANs %s do not exist on trunk %s",
+                          ', '.join(str(vlan_id) for vlan_id
+                                    in sorted(vlan_ids)),
+                          trunk_id)
                 return
 
-            # Add the subport
-            self._add_subport(trunk_id, system_id, physnet, vlan_id,
-                              anchor_network_id, segment_id, vni=vni)
+            self._remove_subports(trunk_id, subports)
 
         except sdkexc.SDKException:
-            LOG.exception("Failed to ensure subport for VLAN %d on trunk %s",
-                          vlan_id, trunk_id)
+            LOG.exception("Failed to remove subports for VLANs %s from "
+                          "trunk %s", ', '.join(str(vlan_id) for vlan_id
+                                                in sorted(vlan_ids)),
+                          trunk_id)
 
     def _remove_single_subport(self, trunk_id, system_id, physnet, vlan_id):
         """Remove a single subport from a trunk if it exists.
@@ -1154,7 +2390,7 @@ class L2VNITrunkManager:
         :param vlan_id: VLAN ID to remove
         """
         try:
-            trunk = self.neutron.network.get_trunk(trunk_id)
+            trunk = self._get_trunk(trunk_id)
             subport_to_remove = None
 
             for sp in trunk.sub_ports:
@@ -1168,8 +2404,7 @@ class L2VNITrunkManager:
                 return
 
             # Remove the subport
-            self._remove_subport(trunk_id, subport_to_remove, system_id,
-                                 physnet, vlan_id)
+            self._remove_subports(trunk_id, [(subport_to_remove, vlan_id)])
 
         except sdkexc.SDKException:
             LOG.exception("Failed to remove subport for VLAN %d from "
@@ -1219,24 +2454,25 @@ class L2VNITrunkManager:
         """
         try:
             # Find the chassis - chassis name IS the system-id
-            chassis = None
-            for c in self.ovn_sb_idl.tables['Chassis'].rows.values():
-                if c.name == system_id:
-                    chassis = c
-                    break
+            if self._ovn_snapshot is not None:
+                chassis = self._ovn_snapshot.chassis.get(system_id)
+            else:
+                chassis = None
+                for c in self.ovn_sb_idl.tables['Chassis'].rows.values():
+                    if c.name == system_id:
+                        chassis = c
+                        break
 
             if not chassis:
                 return None
 
             # Find port on this chassis that maps to the physnet
-            bridge_mappings = chassis.other_config.get(
-                'ovn-bridge-mappings', '')
-            physnet_to_bridge = {}
-            for mapping in bridge_mappings.split(','):
-                if ':' not in mapping:
-                    continue
-                pnet, bridge = mapping.split(':', 1)
-                physnet_to_bridge[pnet.strip()] = bridge.strip()
+            if self._ovn_snapshot is not None:
+                physnet_to_bridge = self._ovn_snapshot.bridge_mappings[
+                    system_id]
+            else:
+                physnet_to_bridge = _parse_physnet_bridges(
+                    chassis.other_config.get('ovn-bridge-mappings', ''))
 
             bridge_name = physnet_to_bridge.get(physnet)
             if not bridge_name:
@@ -1244,51 +2480,28 @@ class L2VNITrunkManager:
 
             # Aggregate all ports on this chassis with LLDP for this bridge
             # Supports LAG/bonding with multiple ports to same bridge
-            local_links = []
-            for port in self.ovn_sb_idl.tables['Port'].rows.values():
-                # Check if port belongs to this chassis
-                if port.chassis != chassis:
-                    continue
-
-                # Check if this port is on the correct bridge
-                # Port.interfaces is a list of Interface objects
-                if not hasattr(port, 'interfaces') or not port.interfaces:
-                    continue
-
-                port_on_bridge = False
-                for iface in port.interfaces:
-                    # Interface.name typically matches the OVS interface
-                    # which should contain the bridge name for physical
-                    # interfaces (e.g., "br-physnet1", "eth0", etc.)
-                    if not hasattr(iface, 'name'):
-                        continue
-                    iface_name = iface.name
-                    # Check if interface name matches or is on bridge
-                    if (iface_name == bridge_name
-                            or iface_name.startswith(bridge_name)):
-                        port_on_bridge = True
-                        break
+            if self._ovn_snapshot is not None:
+                lldp_ports = self._ovn_snapshot.lldp_ports
+            else:
+                lldp_ports = _index_lldp_ports(
+                    self.ovn_sb_idl.tables['Port'].rows.values())
 
-                if not port_on_bridge:
+            local_links = []
+            for iface_names, local_link in lldp_ports.get(chassis.name, ()):
+                # Interface.name typically matches the OVS interface
+                # which should contain the bridge name for physical
+                # interfaces (e.g., "br-physnet1", "eth0", etc.)
+                if not any(iface_name.startswith(bridge_name)
+                           for iface_name in iface_names):
                     continue
 
-                # Get LLDP data from external_ids
-                lldp = port.external_ids
-                chassis_id = lldp.get('lldp_chassis_id')
-                port_id = lldp.get('lldp_port_id')
-                system_name = lldp.get('lldp_system_name')
-
-                if chassis_id and port_id:
-                    LOG.debug("Found LLDP data for chassis %s physnet %s "
-                              "bridge %s: switch_id=%s, port_id=%s, "
-                              "switch_info=%s",
-                              system_id, physnet, bridge_name, chassis_id,
-                              port_id, system_name)
-                    local_links.append({
-                        'switch_id': chassis_id,
-                        'port_id': port_id,
-                        'switch_info': system_name or ''
-                    })
+                LOG.debug("Found LLDP data for chassis %s physnet %s "
+                          "bridge %s: switch_id=%s, port_id=%s, "
+                          "switch_info=%s",
+                          system_id, physnet, bridge_name,
+                          local_link['switch_id'], local_link['port_id'],
+                          local_link['switch_info'])
+                local_links.append(dict(local_link))
 
             if local_links:
                 LOG.info("Found %d link(s) from LLDP for chassis %s "
@@ -1302,66 +2515,137 @@ class L2VNITrunkManager:
                           "physnet %s.", system_id, physnet)
             return None
 
-    def _fetch_ironic_data_for_system_id(self, system_id):
-        """Fetch node and ports for a specific system_id from Ironic.
+    def _get_node_uuid_for_system_id(self, system_id):
+        """Get the Ironic node of a system_id from the system_id index.
+
+        :param system_id: Chassis system-id
+        :returns: Node UUID, or None if no node has this system_id
+        :raises: SDKException if the index cannot be built
+        """
+        with self._system_id_index_lock:
+            age = time.time() - self._system_id_index_at
+            if (self._system_id_index is None
+                    or age >= CONF.l2vni.ironic_cache_ttl):
+                self._system_id_index = self._build_system_id_index()
+                self._system_id_index_at = time.time()
+            return self._system_id_index.get(system_id)
+
+    def _build_system_id_index(self):
+        """List the Ironic nodes once and index them by system_id.
 
         Queries Ironic efficiently by:
         1. Filtering nodes by conductor_group/shard if configured
         2. Requesting only minimal fields needed
-        3. Only fetching ports for the matched node
+        3. Listing all nodes once, in pages of the Ironic API page size
+
+        :returns: dict {system_id: node_uuid}
+        :raises: SDKException if the nodes cannot be listed
+        """
+        # Build query filters
+        query_params = {}
+        if CONF.l2vni.ironic_conductor_group:
+            query_params['conductor_group'] = (
+                CONF.l2vni.ironic_conductor_group)
+        if CONF.l2vni.ironic_shard:
+            query_params['shard'] = CONF.l2vni.ironic_shard
+
+        # Query nodes with minimal fields for performance
+        index = {}
+        for node in self.ironic.nodes(fields=['uuid', 'properties'],
+                                      **query_params):
+            system_id = (node.properties or {}).get('system_id')
+            if system_id:
+                index.setdefault(system_id, node.uuid)
+
+        LOG.debug("Indexed %d Ironic nodes by system_id", len(index))
+        return index
+
+    def _needs_ironic_links(self, system_id, physnet):
+        """Check if trunk discovery needs the Ironic links of a chassis.
+
+        :param system_id: Chassis system-id
+        :param physnet: Physical network name
+        :returns: True if the anchor port of the trunk lacks
+                  local_link_information and OVN has no LLDP data for it
+        """
+        if self._neutron_snapshot is None:
+            return False
+        port = self._neutron_snapshot.anchor_ports.get(
+            _get_anchor_port_name(system_id, physnet))
+        if port and (port.binding_profile or {}).get(
+                'local_link_information'):
+            return False
+        return not self._get_lldp_from_ovn(system_id, physnet)
+
+    def _prefetch_ironic_data(self, system_ids):
+        """Fetch and cache the Ironic data of several system_ids.
+
+        The system_ids not cached yet share one system_id index, then the
+        ports of their nodes are fetched with up to ironic_port_fetch_workers
+        concurrent requests.
+
+        :param system_ids: Iterable of chassis system-ids
+        """
+        missing = [system_id for system_id in system_ids
+                   if self._ironic_cache.get(system_id) is None]
+        if not missing:
+            return
+
+        LOG.debug("Fetching Ironic data for %d system_ids", len(missing))
+        workers = min(CONF.l2vni.ironic_port_fetch_workers, len(missing))
+        with futures.ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix='l2vni-ironic-fetch') as executor:
+            entries = executor.map(self._fetch_ironic_data_for_system_id,
+                                   missing)
+            for system_id, entry in zip(missing, entries):
+                if entry:
+                    self._ironic_cache.put(system_id, entry)
+
+    def _fetch_ironic_data_for_system_id(self, system_id):
+        """Fetch node and ports for a specific system_id from Ironic.
+
+        The node is found in the system_id index, then only the ports of
+        that node are fetched, with minimal fields.
 
         :param system_id: Chassis system-id
         :returns: dict with cached_at, node_uuid, and ports list, or None
         """
         try:
-            # Build query filters
-            query_params = {}
-            if CONF.l2vni.ironic_conductor_group:
-                query_params['conductor_group'] = (
-                    CONF.l2vni.ironic_conductor_group)
-            if CONF.l2vni.ironic_shard:
-                query_params['shard'] = CONF.l2vni.ironic_shard
-
-            # Query nodes with minimal fields for performance
-            nodes = self.ironic.nodes(
-                fields=['uuid', 'properties'],
-                **query_params
-            )
+            node_uuid = self._get_node_uuid_for_system_id(system_id)
+            if not node_uuid:
+                LOG.debug("No Ironic node found with system_id %s",
+                          system_id)
+                return None
 
-            # Find the node with matching system_id
-            for node in nodes:
-                if node.properties.get('system_id') == system_id:
-                    # Found the node - fetch its ports with minimal fields
-                    LOG.debug("Found Ironic node %s for system_id %s, "
-                              "fetching ports", node.uuid, system_id)
-
-                    ports = self.ironic.ports(
-                        node_uuid=node.uuid,
-                        fields=['physical_network', 'local_link_connection']
-                    )
-
-                    # Build cache entry
-                    cache_entry = {
-                        'cached_at': time.time(),
-                        'node_uuid': node.uuid,
-                        'ports': []
-                    }
+            # Found the node - fetch its ports with minimal fields
+            LOG.debug("Found Ironic node %s for system_id %s, "
+                      "fetching ports", node_uuid, system_id)
 
-                    for port in ports:
-                        if port.local_link_connection:
-                            cache_entry['ports'].append({
-                                'physnet': port.physical_network,
-                                'local_link': port.local_link_connection
-                            })
+            ports = self.ironic.ports(
+                node_uuid=node_uuid,
+                fields=['physical_network', 'local_link_connection']
+            )
 
-                    LOG.debug("Cached Ironic data for system_id %s: "
-                              "node %s with %d ports",
-                              system_id, node.uuid, len(cache_entry['ports']))
+            # Build cache entry
+            cache_entry = {
+                'cached_at': time.time(),
+                'node_uuid': node_uuid,
+                'ports': []
+            }
 
-                    return cache_entry
+            for port in ports:
+                if port.local_link_connection:
+                    cache_entry['ports'].append({
+                        'physnet': port.physical_network,
+                        'local_link': port.local_link_connection
+                    })
 
-            LOG.debug("No Ironic node found with system_id %s", system_id)
-            return None
+            LOG.debug("Cached Ironic data for system_id %s: "
+                      "node %s with %d ports",
+                      system_id, node_uuid, len(cache_entry['ports']))
+
+            return cache_entry
 
         except (sdkexc.SDKException, AttributeError, KeyError):
             LOG.exception("Failed to fetch Ironic data for system_id %s",
@@ -1397,9 +2681,9 @@ class L2VNITrunkManager:
     def _get_local_link_from_ironic(self, system_id, physnet):
         """Get local_link_information from Ironic, using per-record cache.
 
-        Uses a per-record cache with TTL and jitter to avoid thundering herd
-        issues when multiple agents are running. Each system_id is cached
-        independently and only refreshed when its TTL expires.
+        Uses a per-record cache, see IronicLinkCache. Each system_id is
+        cached independently and refreshed in the background before its
+        TTL expires.
 
         Aggregates all Ironic ports matching the physnet to support LAG/bonding
         configurations where multiple ports share the same physical_network.
@@ -1410,28 +2694,13 @@ class L2VNITrunkManager:
                   ports found
         """
         try:
-            # Check if we have a valid cached entry for this system_id
-            if system_id in self._ironic_cache:
-                cached_entry = self._ironic_cache[system_id]
-                age = time.time() - cached_entry['cached_at']
-
-                # Add jitter (10-20%) to TTL to spread refresh times
-                # across multiple agents and avoid thundering herd
-                jitter = 0.9 + random.random() * 0.2  # noqa: S311
-                ttl_with_jitter = CONF.l2vni.ironic_cache_ttl * jitter
-
-                if age < ttl_with_jitter:
-                    # Cache hit - use cached data
-                    LOG.debug("Using cached Ironic data for system_id %s "
-                              "(age: %.1fs, TTL: %.1fs)",
-                              system_id, age, ttl_with_jitter)
-
-                    return self._aggregate_ironic_ports_for_physnet(
-                        cached_entry, physnet, system_id, "Ironic cache")
-                else:
-                    LOG.debug("Ironic cache expired for system_id %s "
-                              "(age: %.1fs, TTL: %.1fs)",
-                              system_id, age, ttl_with_jitter)
+            cached_entry = self._ironic_cache.get(system_id)
+            if cached_entry is not None:
+                LOG.debug("Using cached Ironic data for system_id %s "
+                          "(age: %.1fs)", system_id,
+                          time.time() - cached_entry['cached_at'])
+                return self._aggregate_ironic_ports_for_physnet(
+                    cached_entry, physnet, system_id, "Ironic cache")
 
             # Cache miss or expired - fetch data for this system_id
             LOG.debug("Fetching Ironic data for system_id %s (cache miss)",
@@ -1440,7 +2709,7 @@ class L2VNITrunkManager:
 
             if cache_entry:
                 # Update cache with new entry
-                self._ironic_cache[system_id] = cache_entry
+                self._ironic_cache.put(system_id, cache_entry)
 
                 return self._aggregate_ironic_ports_for_physnet(
                     cache_entry, physnet, system_id, "Ironic")
@@ -1539,6 +2808,10 @@ class L2VNITrunkManager:
         :param system_id: Chassis system-id (UUID)
         :returns: Hostname string or None
         """
+        if self._ovn_snapshot is not None:
+            chassis = self._ovn_snapshot.chassis.get(system_id)
+            return getattr(chassis, 'hostname', None)
+
         for chassis in self.ovn_sb_idl.tables['Chassis'].rows.values():
             if chassis.name == system_id and hasattr(chassis, 'hostname'):
                 return chassis.hostname
@@ -1574,7 +2847,8 @@ class L2VNITrunkManager:
             self._cleanup_orphaned_trunks(valid_chassis_physnets)
 
             # Clean up orphaned ha_chassis_group networks
-            self._cleanup_orphaned_networks()
+            with self._infrastructure_lock:
+                self._cleanup_orphaned_networks()
 
         except (sdkexc.SDKException, AttributeError, KeyError):
             LOG.exception("Failed to clean up unused L2VNI infrastructure.")
@@ -1587,7 +2861,10 @@ class L2VNITrunkManager:
         """
         try:
             # Find all L2VNI trunks
-            trunks = self.neutron.network.trunks()
+            if self._neutron_snapshot is not None:
+                trunks = list(self._neutron_snapshot.trunks.values())
+            else:
+                trunks = self.neutron.network.trunks()
             for trunk in trunks:
                 if not trunk.name or not trunk.name.startswith(
                         'l2vni-trunk-'):
@@ -1604,48 +2881,63 @@ class L2VNITrunkManager:
                 physnet = parts[1]
 
                 # Check if this trunk should still exist
-                if (system_id, physnet) not in valid_chassis_physnets:
-                    LOG.info("Cleaning up orphaned trunk %s for chassis %s "
-                             "physnet %s", trunk.id, system_id, physnet)
+                if (system_id, physnet) in valid_chassis_physnets:
+                    continue
 
-                    # Get anchor port before deleting trunk
-                    anchor_port_id = trunk.port_id
-
-                    # Delete all subports first
-                    if trunk.sub_ports:
-                        for subport in trunk.sub_ports:
-                            try:
-                                port_id = subport['port_id']
-                                subport_spec = [{'port_id': port_id}]
-                                self.neutron.network.delete_trunk_subports(
-                                    trunk.id, subport_spec)
-                                self.neutron.network.delete_port(
-                                    subport['port_id'])
-                            except sdkexc.SDKException:
-                                LOG.warning("Failed to delete subport %s",
-                                            subport['port_id'])
-
-                    # Delete trunk
-                    try:
-                        self.neutron.network.delete_trunk(trunk.id)
-                        LOG.info("Deleted orphaned trunk %s", trunk.id)
-                    except sdkexc.SDKException:
-                        LOG.exception("Failed to delete trunk %s", trunk.id)
+                with self.trunk_locks.hold([(system_id, physnet)],
+                                           blocking=False) as held:
+                    if not held:
+                        LOG.debug("Trunk %s for chassis %s physnet %s is "
+                                  "being reconciled, not cleaning it up",
+                                  trunk.id, system_id, physnet)
                         continue
+                    LOG.info("Cleaning up orphaned trunk %s for chassis %s "
+                             "physnet %s", trunk.id, system_id, physnet)
 
-                    # Delete anchor port
-                    if anchor_port_id:
-                        try:
-                            self.neutron.network.delete_port(anchor_port_id)
-                            LOG.info("Deleted orphaned anchor port %s",
-                                     anchor_port_id)
-                        except sdkexc.SDKException:
-                            LOG.warning("Failed to delete anchor port %s",
-                                        anchor_port_id)
+                    self._delete_orphaned_trunk(trunk)
 
         except (sdkexc.SDKException, AttributeError):
             LOG.exception("Failed to cleanup orphaned trunks")
 
+    def _delete_orphaned_trunk(self, trunk):
+        """Delete a trunk with its subports and its anchor port.
+
+        All the subports are detached with a single request before the
+        trunk is deleted, then the subport ports and the anchor port are
+        deleted concurrently.
+
+        :param trunk: Trunk, with its subports
+        """
+        # Get anchor port before deleting trunk
+        anchor_port_id = trunk.port_id
+        port_ids = [subport['port_id'] for subport in trunk.sub_ports or []]
+
+        # Detach all subports first
+        if port_ids:
+            try:
+                self.neutron.network.delete_trunk_subports(
+                    trunk.id, [{'port_id': port_id} for port_id in port_ids])
+            except sdkexc.SDKException:
+                LOG.warning("Failed to remove subports from trunk %s",
+                            trunk.id)
+                port_ids = []
+
+        # Delete trunk
+        try:
+            self.neutron.network.delete_trunk(trunk.id)
+            LOG.info("Deleted orphaned trunk %s", trunk.id)
+        except sdkexc.SDKException:
+            LOG.exception("Failed to delete trunk %s", trunk.id)
+            # The anchor port is the trunk parent, keep it with the trunk
+            anchor_port_id = None
+
+        # Delete detached subports and the anchor port
+        if anchor_port_id:
+            port_ids.append(anchor_port_id)
+        if port_ids and self._delete_ports(port_ids):
+            LOG.info("Deleted %d ports of orphaned trunk %s",
+                     len(port_ids), trunk.id)
+
     def _cleanup_orphaned_networks(self):
         """Clean up ha_chassis_group networks that no longer have groups."""
         try:
@@ -1654,7 +2946,10 @@ class L2VNITrunkManager:
             valid_group_names = {group.name for group in ha_groups}
 
             # Find all L2VNI ha_chassis_group networks
-            networks = self.neutron.network.networks()
+            if self._neutron_snapshot is not None:
+                networks = list(self._neutron_snapshot.networks.values())
+            else:
+                networks = self.neutron.network.networks()
             for network in networks:
                 if not network.name or not network.name.startswith(
                         'l2vni-ha-group-'):
@@ -0,0 +1,154 @@
+# Copyright (c) 2026 Red Hat, Inc.
+# All Rights Reserved
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Hash ring of ironic-neutron-agent members.
+
+The ring is shared by the state reporting, the L2VNI trunk manager, the
+router HA binding manager and the OVN event handlers, which keep a
+reference to it. Membership changes therefore build a new tooz hash ring
+and swap it in place of the previous one, so the object referenced by
+those users never changes and lookups never see a half updated ring.
+
+Every ring has a version, and the owners of each key looked up are cached
+until the next version. Ownership of Ironic nodes, OVN chassis and
+networks is checked on every cycle and every OVN event, so between
+membership changes these lookups are dictionary hits.
+
+Listeners are called with the previous and the new tooz hash ring after
+each membership change, so users can act on the keys that moved.
+"""
+
+import collections
+import threading
+
+from oslo_log import log as logging
+from tooz import hashring
+
+LOG = logging.getLogger(__name__)
+
+# Maximum number of cached key owners, the cache is cleared when full
+OWNER_CACHE_SIZE = 100000
+
+# A tooz hash ring, its version and the (version, key) -> owners cache of
+# that version. Swapped as a whole so lookups always use a consistent set.
+_RingState = collections.namedtuple('_RingState',
+                                    ['ring', 'version', 'owners'])
+
+
+class MemberHashRing(object):
+    """Hash ring of agent IDs, rebuilt once per set of membership changes."""
+
+    def __init__(self, members=()):
+        """Initialize the member hash ring.
+
+        :param members: Initial agent IDs in the ring
+        """
+        self._lock = threading.Lock()
+        self._state = _RingState(hashring.HashRing(set(members)), 0, {})
+        self._listeners = []
+        self.hits = 0
+        self.misses = 0
+
+    def add_listener(self, callback):
+        """Call callback(old_ring, new_ring) on membership changes.
+
+        Listeners are called from the thread handling the membership
+        notification, they must not block.
+
+        :param callback: Callable taking the previous and the new tooz
+                         hash ring
+        """
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """Stop calling a listener added with add_listener."""
+        try:
+            self._listeners.remove(callback)
+        except ValueError:
+            pass
+
+    @property
+    def version(self):
+        """Ring version, incremented on every membership change."""
+        return self._state.version
+
+    @property
+    def nodes(self):
+        """Agent IDs in the ring."""
+        return set(self._state.ring.nodes)
+
+    def __getitem__(self, key):
+        ring, version, owners = self._state
+        try:
+            result = owners[(version, key)]
+            self.hits += 1
+            return result
+        except KeyError:
+            pass
+        self.misses += 1
+        result = frozenset(ring[key])
+        if len(owners) >= OWNER_CACHE_SIZE:
+            owners.clear()
+        owners[(version, key)] = result
+        return result
+
+    def get_nodes(self, data, ignore_nodes=None, replicas=1):
+        """Get the agent IDs owning some data, see tooz HashRing."""
+        return self._state.ring.get_nodes(
+            data, ignore_nodes=ignore_nodes, replicas=replicas)
+
+    def update(self, add=(), remove=()):
+        """Add and remove agent IDs with a single ring rebuild.
+
+        :param add: Agent IDs to add to the ring
+        :param remove: Agent IDs to remove from the ring, applied after
+                       ``add``
+        :returns: True if the ring membership changed
+        """
+        with self._lock:
+            state = self._state
+            members = set(state.ring.nodes)
+            new_members = (members | set(add)) - set(remove)
+            if new_members == members:
+                return False
+            new_state = _RingState(hashring.HashRing(new_members),
+                                   state.version + 1, {})
+            self._state = new_state
+        LOG.debug('Hash ring rebuilt with %d members, version %d',
+                  len(new_members), new_state.version)
+        for callback in list(self._listeners):
+            try:
+                callback(state.ring, new_state.ring)
+            except Exception:
+                LOG.exception('Hash ring listener %s failed', callback)
+        return True
+
+    def get_stats(self):
+        """Get the ownership cache statistics.
+
+        The counters are not updated under a lock, they are approximate
+        when lookups run concurrently.
+
+        :returns: dict with the ring version, the number of cached keys,
+                  the cache hits and misses and the hit rate
+        """
+        state = self._state
+        hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        return {'version': state.version,
+                'cached_keys': len(state.owners),
+                'hits': hits,
+                'misses': misses,
+                'hit_rate': hits / lookups if lookups else 0.0}
@@ -32,9 +32,14 @@ class LocalnetPortEvent(ovsdb_monitor.BaseEvent):
     Uses hash ring to filter events so only the agent responsible for the
     network processes the event.
 
+    The events are handled by the agent OVN event workers, see
+    ovn_event_workers.
+
     CREATE events trigger immediate reconciliation to add required subports.
     DELETE events trigger immediate reconciliation to remove obsolete subports,
     ensuring fast cleanup for security and resource isolation.
+    Events received within l2vni_event_coalesce_window are reconciled
+    together.
     """
 
     table = 'Logical_Switch_Port'
@@ -135,7 +140,8 @@ class LocalnetPortEvent(ovsdb_monitor.BaseEvent):
                     "(network_id=%s, physnet=%s, vlan_id=%s), falling "
                     "back to full reconciliation",
                     network_id, physnet, vlan_id)
-                self.agent._reconcile_l2vni_trunks()
+                self.agent._submit_ovn_event(
+                    self.agent._reconcile_l2vni_trunks)
                 return
 
             action = 'add' if event == self.ROW_CREATE else 'remove'
@@ -143,15 +149,16 @@ class LocalnetPortEvent(ovsdb_monitor.BaseEvent):
                      "triggering targeted reconciliation",
                      action, network_id, physnet, vlan_id)
 
-            # Call targeted reconciliation (blocks until lock available)
-            self.agent._reconcile_single_vlan_blocking(
+            # Queue targeted reconciliation, coalesced with the other
+            # events received within l2vni_event_coalesce_window
+            self.agent._queue_l2vni_vlan_change(
                 network_id, physnet, vlan_id, action)
 
         except AttributeError:
             LOG.exception(
                 "Malformed OVN row data in localnet port event, falling "
                 "back to full reconciliation")
-            self.agent._reconcile_l2vni_trunks()
+            self.agent._submit_ovn_event(self.agent._reconcile_l2vni_trunks)
 
     def _extract_network_id(self, port_name):
         """Extract network UUID from localnet port name.
@@ -185,6 +192,9 @@ class HAChassisGroupNetworkEvent(ovsdb_monitor.BaseEvent):
     Fixes LP#2144458 by enabling immediate router interface binding instead
     of waiting for periodic reconciliation. Related to LP#1995078
     (networking-baremetal side of the solution).
+
+    The router interfaces are bound by the agent OVN event workers, see
+    ovn_event_workers.
     """
 
     table = 'HA_Chassis_Group'
@@ -268,7 +278,8 @@ class HAChassisGroupNetworkEvent(ovsdb_monitor.BaseEvent):
             if hasattr(self.agent, 'router_ha_binding') and \
                     self.agent.router_ha_binding:
                 binding = self.agent.router_ha_binding
-                binding.bind_router_interfaces_for_network(
+                self.agent._submit_ovn_event(
+                    binding.bind_router_interfaces_for_network,
                     network_id, ha_chassis_group)
             else:
                 LOG.warning("Router HA binding manager not available, "
@@ -278,3 +289,190 @@ class HAChassisGroupNetworkEvent(ovsdb_monitor.BaseEvent):
         except (AttributeError, KeyError):
             LOG.exception("Failed to process HA chassis group event for "
                           "row %s", row.uuid)
+
+
+class L2VNIRouterPortEvent(ovsdb_monitor.BaseEvent):
+    """Invalidate the L2VNI desired state on router port HA changes.
+
+    Watches the Logical_Router_Port table for router ports created or
+    deleted with HA chassis, and for changes of the ha_chassis_group or
+    gateway_chassis of a router port. The chassis hosting a router port
+    need the VLANs of the networks it is connected to.
+    """
+
+    table = 'Logical_Router_Port'
+    events = (row_event.RowEvent.ROW_CREATE, row_event.RowEvent.ROW_UPDATE,
+              row_event.RowEvent.ROW_DELETE)
+
+    def __init__(self, trunk_manager):
+        """Initialize L2VNIRouterPortEvent.
+
+        :param trunk_manager: L2VNITrunkManager instance
+        """
+        self.desired_state = trunk_manager.desired_state
+        super().__init__()
+
+    def match_fn(self, event, row, old=None):
+        """Filter for changes of the HA chassis of router ports.
+
+        :param event: Event type (ROW_CREATE, ROW_UPDATE or ROW_DELETE)
+        :param row: OVN Logical_Router_Port row
+        :param old: Previous row state, with the updated columns only
+        :returns: True if event should be processed, False otherwise
+        """
+        if event == self.ROW_UPDATE:
+            return (hasattr(old, 'ha_chassis_group')
+                    or hasattr(old, 'gateway_chassis'))
+        return bool(getattr(row, 'ha_chassis_group', None)
+                    or getattr(row, 'gateway_chassis', None))
+
+    def run(self, event, row, old):
+        """Invalidate the L2VNI desired state.
+
+        :param event: Event type (ROW_CREATE, ROW_UPDATE or ROW_DELETE)
+        :param row: OVN Logical_Router_Port row
+        :param old: Previous row state
+        """
+        self.desired_state.invalidate(
+            f'{event} of router port {row.name} HA chassis')
+
+
+class L2VNIHAChassisGroupEvent(ovsdb_monitor.BaseEvent):
+    """Invalidate the L2VNI desired state on HA chassis group changes.
+
+    Watches the HA_Chassis_Group table for groups created or deleted with
+    chassis, and for changes of the ha_chassis of a group. The members of
+    the HA chassis group of a router port host that router port.
+    """
+
+    table = 'HA_Chassis_Group'
+    events = (row_event.RowEvent.ROW_CREATE, row_event.RowEvent.ROW_UPDATE,
+              row_event.RowEvent.ROW_DELETE)
+
+    def __init__(self, trunk_manager):
+        """Initialize L2VNIHAChassisGroupEvent.
+
+        :param trunk_manager: L2VNITrunkManager instance
+        """
+        self.desired_state = trunk_manager.desired_state
+        super().__init__()
+
+    def match_fn(self, event, row, old=None):
+        """Filter for changes of the chassis of HA chassis groups.
+
+        :param event: Event type (ROW_CREATE, ROW_UPDATE or ROW_DELETE)
+        :param row: OVN HA_Chassis_Group row
+        :param old: Previous row state, with the updated columns only
+        :returns: True if event should be processed, False otherwise
+        """
+        if event == self.ROW_UPDATE:
+            return hasattr(old, 'ha_chassis')
+        return bool(getattr(row, 'ha_chassis', None))
+
+    def run(self, event, row, old):
+        """Invalidate the L2VNI desired state.
+
+        :param event: Event type (ROW_CREATE, ROW_UPDATE or ROW_DELETE)
+        :param row: OVN HA_Chassis_Group row
+        :param old: Previous row state
+        """
+        self.desired_state.invalidate(
+            f'{event} of HA chassis group {row.name} chassis')
+
+
+class L2VNIHAChassisEvent(ovsdb_monitor.BaseEvent):
+    """Invalidate the L2VNI desired state on HA chassis changes.
+
+    Watches the HA_Chassis table for HA chassis created or deleted, and
+    for changes of the chassis_name of a HA chassis.
+    """
+
+    table = 'HA_Chassis'
+    events = (row_event.RowEvent.ROW_CREATE, row_event.RowEvent.ROW_UPDATE,
+              row_event.RowEvent.ROW_DELETE)
+
+    def __init__(self, trunk_manager):
+        """Initialize the HA chassis event.
+
+        :param trunk_manager: L2VNITrunkManager instance
+        """
+        self.desired_state = trunk_manager.desired_state
+        super().__init__()
+
+    def match_fn(self, event, row, old=None):
+        """Filter for changes of the chassis name of HA chassis.
+
+        :param event: Event type (ROW_CREATE, ROW_UPDATE or ROW_DELETE)
+        :param row: OVN HA chassis row
+        :param old: Previous row state, with the updated columns only
+        :returns: True if event should be processed, False otherwise
+        """
+        if event == self.ROW_UPDATE:
+            return hasattr(old, 'chassis_name')
+        return True
+
+    def run(self, event, row, old):
+        """Invalidate the L2VNI desired state.
+
+        :param event: Event type (ROW_CREATE, ROW_UPDATE or ROW_DELETE)
+        :param row: OVN HA chassis row
+        :param old: Previous row state
+        """
+        self.desired_state.invalidate(
+            f'{event} of {self.table} {row.chassis_name}')
+
+
+class L2VNIGatewayChassisEvent(L2VNIHAChassisEvent):
+    """Invalidate the L2VNI desired state on gateway chassis changes.
+
+    Watches the legacy Gateway_Chassis table of router ports without a
+    HA chassis group, in the same way as the HA_Chassis table.
+    """
+
+    table = 'Gateway_Chassis'
+
+
+class L2VNIChassisEvent(ovsdb_monitor.BaseEvent):
+    """Invalidate the L2VNI desired state on chassis bridge mapping changes.
+
+    Watches the OVN Southbound Chassis table for chassis created or deleted
+    and for changes of their ovn-bridge-mappings, which define the physical
+    networks of the chassis.
+    """
+
+    table = 'Chassis'
+    events = (row_event.RowEvent.ROW_CREATE, row_event.RowEvent.ROW_UPDATE,
+              row_event.RowEvent.ROW_DELETE)
+
+    def __init__(self, trunk_manager):
+        """Initialize L2VNIChassisEvent.
+
+        :param trunk_manager: L2VNITrunkManager instance
+        """
+        self.desired_state = trunk_manager.desired_state
+        super().__init__()
+
+    def match_fn(self, event, row, old=None):
+        """Filter for changes of the bridge mappings of chassis.
+
+        :param event: Event type (ROW_CREATE, ROW_UPDATE or ROW_DELETE)
+        :param row: OVN Chassis row
+        :param old: Previous row state, with the updated columns only
+        :returns: True if event should be processed, False otherwise
+        """
+        if event != self.ROW_UPDATE:
+            return True
+        if not hasattr(old, 'other_config'):
+            return False
+        key = 'ovn-bridge-mappings'
+        return old.other_config.get(key) != row.other_config.get(key)
+
+    def run(self, event, row, old):
+        """Invalidate the L2VNI desired state.
+
+        :param event: Event type (ROW_CREATE, ROW_UPDATE or ROW_DELETE)
+        :param row: OVN Chassis row
+        :param old: Previous row state
+        """
+        self.desired_state.invalidate(
+            f'{event} of chassis {row.name} bridge mappings')
@@ -0,0 +1,65 @@
+# Copyright (c) 2026 Red Hat, Inc.
+# All Rights Reserved
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Thread safe token bucket rate limiter."""
+
+import threading
+import time
+
+
+class TokenBucket(object):
+    """Token bucket shared by several threads.
+
+    Tokens are added at ``rate`` per second, up to ``capacity``. Each call
+    to :meth:`consume` takes one token, blocking until one is available.
+    """
+
+    def __init__(self, rate, capacity=None):
+        """Initialize the token bucket.
+
+        :param rate: Number of tokens added per second, must be positive.
+        :param capacity: Maximum number of tokens in the bucket, which is
+                         the size of the burst allowed after an idle
+                         period. Defaults to ``rate``, with a minimum of 1.
+        """
+        if rate <= 0:
+            raise ValueError('Token bucket rate must be positive')
+        self.rate = float(rate)
+        self.capacity = float(capacity or max(rate, 1))
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity,
+                           self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def consume(self):
+        """Take one token, waiting until one is available.
+
+        :returns: Time in seconds spent waiting for the token.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
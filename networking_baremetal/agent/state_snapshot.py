@@ -0,0 +1,107 @@
+# Copyright (c) 2026 Red Hat, Inc.
+# All Rights Reserved
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""On-disk snapshot of the ironic-neutron-agent reported node state.
+
+The snapshot holds the agent ID, which is the agent's member ID in the
+hash ring, and the digest of the configuration last reported for each
+node. Loading it at startup lets a restarted agent keep its position in
+the hash ring and only re-announce the nodes whose configuration changed
+while it was down.
+"""
+
+import json
+import os
+import tempfile
+
+from oslo_log import log as logging
+
+LOG = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+
+def load(path):
+    """Load a state snapshot.
+
+    :param path: Path of the snapshot file
+    :returns: dict with the keys 'agent_id', 'host' and 'reported_nodes',
+              or None if there is no usable snapshot.
+    """
+    try:
+        with open(path, 'r') as f:
+            snapshot = json.load(f)
+    except FileNotFoundError:
+        LOG.info('No state snapshot found at %s', path)
+        return None
+    except (OSError, ValueError):
+        LOG.warning('Failed to read state snapshot %s, ignoring it', path,
+                    exc_info=True)
+        return None
+
+    if (not isinstance(snapshot, dict)
+            or snapshot.get('version') != SNAPSHOT_VERSION):
+        LOG.warning('Ignoring state snapshot %s with unsupported version %s',
+                    path, snapshot.get('version')
+                    if isinstance(snapshot, dict) else None)
+        return None
+
+    try:
+        result = {'agent_id': str(snapshot['agent_id']),
+                  'host': str(snapshot['host']),
+                  'reported_nodes': dict(snapshot['reported_nodes'])}
+    except (KeyError, TypeError, ValueError):
+        LOG.warning('Ignoring malformed state snapshot %s', path)
+        return None
+
+    LOG.info('Loaded state snapshot %s with %d reported nodes', path,
+             len(result['reported_nodes']))
+    return result
+
+
+def save(path, agent_id, host, reported_nodes):
+    """Atomically write a state snapshot.
+
+    The snapshot is written to a temporary file in the same directory,
+    which then replaces the previous snapshot, so a crash never leaves a
+    partially written snapshot behind.
+
+    :param path: Path of the snapshot file
+    :param agent_id: Agent ID
+    :param host: Host the agent runs on
+    :param reported_nodes: dict {node_uuid: configuration digest}
+    :returns: True if the snapshot was written
+    """
+    snapshot = {'version': SNAPSHOT_VERSION,
+                'agent_id': agent_id,
+                'host': host,
+                'reported_nodes': reported_nodes}
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=directory, prefix='.%s.' % os.path.basename(path))
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(snapshot, f, separators=(',', ':'))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        LOG.exception('Failed to write state snapshot %s', path)
+        return False
+    return True
@@ -17,6 +17,8 @@ import enum
 BAREMETAL_AGENT_TYPE = "Baremetal Node"
 BAREMETAL_BINARY = 'ironic-neutron-agent'
 BAREMETAL_NONE = 'baremetal:none'  # External baremetal port device_owner
+# Topic of the bulk baremetal agent state report RPC API
+BAREMETAL_STATE_REPORT_TOPIC = 'baremetal-agent-state-reports'
 
 LOCAL_LINK_INFO = 'local_link_information'
 LOCAL_GROUP_INFO = 'local_group_information'
@@ -19,6 +19,7 @@ from neutron_lib.api.definitions import provider_net
 from neutron_lib.callbacks import resources
 from neutron_lib import constants as n_const
 from neutron_lib.plugins.ml2 import api
+from neutron_lib import rpc as n_rpc
 from oslo_config import cfg
 from oslo_log import log as logging
 
@@ -26,6 +27,7 @@ from networking_baremetal import common
 from networking_baremetal import config
 from networking_baremetal import constants
 from networking_baremetal import exceptions
+from networking_baremetal import state_report_rpc
 
 CONF = cfg.CONF
 LOG = logging.getLogger(__name__)
@@ -55,6 +57,25 @@ class BaremetalMechanismDriver(mech_agent.SimpleAgentMechanismDriverBase):
                 LOG.exception("Failed to validate device driver %s",
                               device_id)
 
+        self._state_report_conn = None
+
+    def start_rpc_listeners(self):
+        """Consume the bulk baremetal agent state report RPC API.
+
+        Called in the RPC workers only. ironic-neutron-agent falls back to
+        one report_state RPC per node when nothing consumes this topic.
+
+        :returns: The RPC server threads
+        """
+        self._state_report_conn = n_rpc.Connection()
+        self._state_report_conn.create_consumer(
+            constants.BAREMETAL_STATE_REPORT_TOPIC,
+            [state_report_rpc.BaremetalStateReportCallback()],
+            fanout=False)
+        LOG.debug("Consuming bulk baremetal agent state reports on topic %s",
+                  constants.BAREMETAL_STATE_REPORT_TOPIC)
+        return self._state_report_conn.consume_in_threads()
+
     @property
     def connectivity(self):
         return portbindings.CONNECTIVITY_L2
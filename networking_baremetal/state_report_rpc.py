@@ -0,0 +1,102 @@
+# Copyright (c) 2026 Red Hat, Inc.
+# All Rights Reserved
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Bulk baremetal agent state report RPC API.
+
+Every Ironic node is reported as a separate agent in Neutron. Instead of
+sending one ``report_state`` RPC per node, ironic-neutron-agent can send
+the state of many nodes in a single ``report_states`` RPC. The server side
+is consumed by the RPC workers of the baremetal mechanism driver, which
+process each state like ``report_state`` does, one database transaction
+per batch.
+"""
+
+from neutron.db import agents_db
+from neutron_lib import constants as n_const
+from neutron_lib.db import api as db_api
+from neutron_lib import rpc as n_rpc
+from oslo_log import log as logging
+import oslo_messaging
+from oslo_utils import timeutils
+
+LOG = logging.getLogger(__name__)
+
+# Number of agents upserted per database transaction
+DB_BATCH_SIZE = 100
+
+
+class BaremetalStateReportAPI(object):
+    """Client side of the bulk baremetal agent state report RPC API.
+
+    API version history:
+        1.0 - Initial version.
+    """
+
+    def __init__(self, topic):
+        target = oslo_messaging.Target(topic=topic, version='1.0')
+        self.client = n_rpc.get_client(target)
+
+    def report_states(self, context, agent_states):
+        """Report the state of several baremetal agents.
+
+        :param context: Request context
+        :param agent_states: List of agent states, as sent by report_state
+        :returns: Number of agents reported
+        """
+        cctxt = self.client.prepare()
+        return cctxt.call(
+            context, 'report_states', agent_states=agent_states,
+            time=timeutils.utcnow().strftime(n_const.ISO8601_TIME_FORMAT))
+
+
+class BaremetalStateReportCallback(object):
+    """Server side of the bulk baremetal agent state report RPC API."""
+
+    target = oslo_messaging.Target(version='1.0')
+
+    def __init__(self):
+        self._state_callback = agents_db.AgentExtRpcCallback()
+
+    def report_states(self, context, agent_states, time):
+        """Create or update the agents of a bulk state report.
+
+        Each agent state is processed by the report_state RPC callback of
+        the Neutron server, in a savepoint, so that a failed agent does not
+        roll back the other agents of its batch.
+
+        :param context: Request context
+        :param agent_states: List of agent states
+        :param time: Time of the report on the agent, in ISO 8601 format
+        :returns: Number of agents reported
+        """
+        reported = 0
+        for i in range(0, len(agent_states), DB_BATCH_SIZE):
+            with db_api.CONTEXT_WRITER.using(context):
+                for agent_state in agent_states[i:i + DB_BATCH_SIZE]:
+                    try:
+                        with db_api.CONTEXT_WRITER.savepoint.using(context):
+                            self._state_callback.report_state(
+                                context, agent_state={
+                                    'agent_state': agent_state},
+                                time=time)
+                        reported += 1
+                    except Exception:
+                        LOG.exception('Failed to report state for '
+                                      'baremetal agent %s',
+                                      agent_state.get('host'))
+        LOG.debug('Bulk state report for %(reported)d of %(total)d '
+                  'baremetal agents processed',
+                  {'reported': reported, 'total': len(agent_states)})
+        return reported
@@ -0,0 +1,129 @@
+# Copyright (c) 2026 Red Hat, Inc.
+# All Rights Reserved
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+from unittest import mock
+
+from oslotest import base
+
+from networking_baremetal.agent import event_executor
+
+
+class TestBoundedExecutor(base.BaseTestCase):
+    """Test cases for the bounded executor."""
+
+    def setUp(self):
+        super(TestBoundedExecutor, self).setUp()
+        self.executor = event_executor.BoundedExecutor(1, 1, 'test')
+        self.addCleanup(self.executor.shutdown)
+
+    def test_submit(self):
+        func = mock.Mock()
+
+        self.executor.submit(func, 'a', 'b').result(timeout=10)
+
+        func.assert_called_once_with('a', 'b')
+        self.assertEqual(
+            {'submitted': 1, 'completed': 1, 'failed': 0, 'blocked': 0,
+             'pending': 0, 'max_pending': 1, 'blocked_time': 0.0},
+            self.executor.stats())
+
+    def test_submit_task_failure(self):
+        func = mock.Mock(side_effect=Exception('boom'))
+
+        self.executor.submit(func).result(timeout=10)
+        self.executor.submit(func).result(timeout=10)
+
+        self.assertEqual(2, func.call_count)
+        stats = self.executor.stats()
+        self.assertEqual(2, stats['completed'])
+        self.assertEqual(2, stats['failed'])
+
+    @mock.patch.object(event_executor.LOG, 'warning', autospec=True)
+    def test_submit_blocks_when_queue_full(self, mock_warning):
+        release = threading.Event()
+        running = threading.Event()
+
+        def block():
+            running.set()
+            release.wait(10)
+
+        first = self.executor.submit(block)
+        self.assertTrue(running.wait(10))
+        # Queued behind the running task
+        second = self.executor.submit(mock.Mock())
+        self.assertEqual(2, self.executor.stats()['pending'])
+
+        third = []
+        submitter = threading.Thread(
+            target=lambda: third.append(self.executor.submit(mock.Mock())))
+        submitter.start()
+        submitter.join(0.2)
+        # The queue is full, the submission waits for a free slot
+        self.assertTrue(submitter.is_alive())
+
+        release.set()
+        submitter.join(10)
+        self.assertFalse(submitter.is_alive())
+        for future in (first, second, third[0]):
+            future.result(timeout=10)
+
+        stats = self.executor.stats()
+        self.assertEqual(3, stats['completed'])
+        self.assertEqual(1, stats['blocked'])
+        self.assertEqual(2, stats['max_pending'])
+        self.assertGreater(stats['blocked_time'], 0)
+        mock_warning.assert_called_once()
+
+    def test_submit_after_shutdown(self):
+        self.executor.shutdown()
+
+        self.assertRaises(RuntimeError, self.executor.submit, mock.Mock())
+        self.assertEqual(0, self.executor.stats()['pending'])
+
+    @mock.patch.object(event_executor.LOG, 'warning', autospec=True)
+    def test_shutdown_while_submit_blocked(self, mock_warning):
+        release = threading.Event()
+        running = threading.Event()
+        self.addCleanup(release.set)
+
+        def block():
+            running.set()
+            release.wait(10)
+
+        self.executor.submit(block)
+        self.assertTrue(running.wait(10))
+        # Queued behind the running task, cancelled by the shutdown
+        self.executor.submit(mock.Mock())
+
+        errors = []
+
+        def submit():
+            try:
+                self.executor.submit(mock.Mock())
+            except RuntimeError as e:
+                errors.append(e)
+
+        submitter = threading.Thread(target=submit)
+        submitter.start()
+        submitter.join(0.2)
+        self.assertTrue(submitter.is_alive())
+
+        self.executor.shutdown()
+        submitter.join(10)
+
+        self.assertFalse(submitter.is_alive())
+        self.assertEqual(1, len(errors))
+        mock_warning.assert_called_once()
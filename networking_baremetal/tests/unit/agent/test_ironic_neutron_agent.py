@@ -14,6 +14,7 @@
 #    under the License.
 
 import datetime
+import threading
 from unittest import mock
 
 from neutron.tests import base as tests_base
@@ -24,6 +25,7 @@ from tooz import hashring
 
 from networking_baremetal.agent import agent_config
 from networking_baremetal.agent import ironic_neutron_agent
+from networking_baremetal.agent import ovn_events
 from networking_baremetal import constants
 
 
@@ -286,6 +288,21 @@ class TestHAChassisGroupAlignment(tests_base.BaseTestCase):
         # Verify - should not query Neutron at all
         mock_neutron.network.ports.assert_not_called()
 
+    @mock.patch('networking_baremetal.agent.ovn_client.get_ovn_nb_idl',
+                autospec=True)
+    def test_reconcile_networks_waits_for_lock(self, mock_get_ovn_nb):
+        """Test targeted reconciliation waits for a running one."""
+        mock_neutron = mock.MagicMock()
+        mock_neutron.network.ports.return_value = []
+        self.agent._get_neutron_client.return_value = mock_neutron
+
+        self.agent._reconcile_ha_chassis_group_alignment(
+            network_ids={'net-1'})
+
+        self.agent._ha_alignment_lock.acquire.assert_called_once_with(
+            blocking=True)
+        self.agent._ha_alignment_lock.release.assert_called_once()
+
     @mock.patch('networking_baremetal.agent.ovn_client.get_ovn_nb_idl',
                 autospec=True)
     def test_reconcile_ovn_connection_failure(self, mock_get_ovn_nb):
@@ -465,8 +482,12 @@ class TestHAChassisGroupAlignment(tests_base.BaseTestCase):
 class TestL2VNITargetedReconciliation(tests_base.BaseTestCase):
     """Tests for targeted single-VLAN reconciliation in agent."""
 
-    def test_reconcile_single_vlan_blocking_acquires_lock(self):
-        """Test wrapper method acquires lock and calls trunk manager."""
+    def test_reconcile_single_vlan_blocking(self):
+        """Test wrapper method calls trunk manager.
+
+        The trunk manager locks the trunks, the periodic reconciliation
+        lock is not taken.
+        """
         agent = mock.Mock(spec=ironic_neutron_agent.BaremetalNeutronAgent)
         agent.trunk_manager = mock.Mock()
         agent._l2vni_reconciliation_lock = mock.MagicMock()
@@ -475,7 +496,7 @@ class TestL2VNITargetedReconciliation(tests_base.BaseTestCase):
             _reconcile_single_vlan_blocking(
                 agent, 'net-1', 'physnet1', 100, 'add')
 
-        agent._l2vni_reconciliation_lock.__enter__.assert_called_once()
+        agent._l2vni_reconciliation_lock.__enter__.assert_not_called()
         agent.trunk_manager.reconcile_single_vlan.assert_called_once_with(
             'net-1', 'physnet1', 100, 'add')
 
@@ -491,6 +512,265 @@ class TestL2VNITargetedReconciliation(tests_base.BaseTestCase):
             _reconcile_single_vlan_blocking(
                 agent, 'net-1', 'physnet1', 100, 'add')
 
+    def _create_queue_agent(self):
+        agent_config.register_agent_opts(CONF)
+        agent = mock.Mock(spec=ironic_neutron_agent.BaremetalNeutronAgent)
+        agent.trunk_manager = mock.Mock()
+        agent._l2vni_reconciliation_lock = mock.MagicMock()
+        agent._l2vni_pending_lock = mock.MagicMock()
+        agent._l2vni_pending_vlans = {}
+        agent._l2vni_flush_timer = None
+        return agent
+
+    @mock.patch.object(ironic_neutron_agent.threading, 'Timer', autospec=True)
+    def test_queue_l2vni_vlan_change_coalesces(self, mock_timer):
+        """Test VLAN changes of a window are reconciled together."""
+        CONF.set_override('l2vni_event_coalesce_window', 0.5, group='l2vni')
+        agent = self._create_queue_agent()
+        queue = ironic_neutron_agent.BaremetalNeutronAgent.\
+            _queue_l2vni_vlan_change
+
+        queue(agent, 'net-1', 'physnet1', 100, 'add')
+        queue(agent, 'net-2', 'physnet1', 200, 'add')
+        queue(agent, 'net-3', 'physnet2', 300, 'remove')
+        # Only the last change of a VLAN is kept
+        queue(agent, 'net-1', 'physnet1', 100, 'remove')
+
+        # The flush runs in an OVN event worker
+        mock_timer.assert_called_once_with(
+            0.5, agent._submit_ovn_event,
+            args=(agent._flush_l2vni_vlan_changes,))
+        mock_timer.return_value.start.assert_called_once_with()
+        agent._reconcile_single_vlan_blocking.assert_not_called()
+
+        ironic_neutron_agent.BaremetalNeutronAgent.\
+            _flush_l2vni_vlan_changes(agent)
+
+        agent._l2vni_reconciliation_lock.__enter__.assert_not_called()
+        agent.trunk_manager.reconcile_vlans.assert_called_once_with({
+            ('physnet1', 'add'): {200: 'net-2'},
+            ('physnet1', 'remove'): {100: 'net-1'},
+            ('physnet2', 'remove'): {300: 'net-3'}})
+        self.assertEqual({}, agent._l2vni_pending_vlans)
+        self.assertIsNone(agent._l2vni_flush_timer)
+
+    @mock.patch.object(ironic_neutron_agent.threading, 'Timer', autospec=True)
+    def test_queue_l2vni_vlan_change_other_network(self, mock_timer):
+        """Test a VLAN moving to another network keeps its removal."""
+        CONF.set_override('l2vni_event_coalesce_window', 0.5, group='l2vni')
+        agent = self._create_queue_agent()
+        queue = ironic_neutron_agent.BaremetalNeutronAgent.\
+            _queue_l2vni_vlan_change
+
+        queue(agent, 'net-1', 'physnet1', 100, 'remove')
+        queue(agent, 'net-2', 'physnet1', 100, 'add')
+        queue(agent, 'net-3', 'physnet1', 200, 'add')
+        queue(agent, 'net-3', 'physnet1', 200, 'remove')
+        queue(agent, 'net-4', 'physnet1', 200, 'add')
+
+        ironic_neutron_agent.BaremetalNeutronAgent.\
+            _flush_l2vni_vlan_changes(agent)
+
+        agent.trunk_manager.reconcile_vlans.assert_called_once_with({
+            ('physnet1', 'add'): {100: 'net-2', 200: 'net-4'},
+            ('physnet1', 'remove'): {100: 'net-1', 200: 'net-3'}})
+
+    @mock.patch.object(ironic_neutron_agent.threading, 'Timer', autospec=True)
+    def test_queue_l2vni_vlan_change_without_window(self, mock_timer):
+        """Test VLAN changes are reconciled immediately without window."""
+        CONF.set_override('l2vni_event_coalesce_window', 0, group='l2vni')
+        agent = self._create_queue_agent()
+
+        ironic_neutron_agent.BaremetalNeutronAgent.\
+            _queue_l2vni_vlan_change(agent, 'net-1', 'physnet1', 100, 'add')
+
+        agent._submit_ovn_event.assert_called_once_with(
+            agent._reconcile_single_vlan_blocking,
+            'net-1', 'physnet1', 100, 'add')
+        mock_timer.assert_not_called()
+
+    def test_submit_ovn_event(self):
+        """Test OVN events are handled by the OVN event executor."""
+        agent = mock.Mock(spec=ironic_neutron_agent.BaremetalNeutronAgent)
+        agent._ovn_event_executor = mock.Mock()
+        func = mock.Mock()
+
+        ironic_neutron_agent.BaremetalNeutronAgent._submit_ovn_event(
+            agent, func, 'net-1', 100)
+
+        agent._ovn_event_executor.submit.assert_called_once_with(
+            func, 'net-1', 100)
+        func.assert_not_called()
+
+    def test_submit_ovn_event_agent_stopping(self):
+        """Test OVN events are dropped once the executor is shut down."""
+        agent = mock.Mock(spec=ironic_neutron_agent.BaremetalNeutronAgent)
+        agent._ovn_event_executor = mock.Mock()
+        agent._ovn_event_executor.submit.side_effect = RuntimeError
+
+        ironic_neutron_agent.BaremetalNeutronAgent._submit_ovn_event(
+            agent, mock.Mock())
+
+    def test_register_l2vni_desired_state_events(self):
+        """Test the desired state is tracked once its events are watched."""
+        agent = mock.Mock(spec=ironic_neutron_agent.BaremetalNeutronAgent)
+        agent.trunk_manager = mock.Mock()
+        agent.trunk_manager.desired_state.tracked = False
+
+        ironic_neutron_agent.BaremetalNeutronAgent.\
+            _register_l2vni_desired_state_events(agent)
+
+        nb_handler = agent.trunk_manager.ovn_nb_idl.idl.notify_handler
+        sb_handler = agent.trunk_manager.ovn_sb_idl.idl.notify_handler
+        self.assertEqual(
+            [ovn_events.L2VNIRouterPortEvent,
+             ovn_events.L2VNIHAChassisGroupEvent,
+             ovn_events.L2VNIHAChassisEvent,
+             ovn_events.L2VNIGatewayChassisEvent],
+            [type(call[0][0])
+             for call in nb_handler.watch_event.call_args_list])
+        self.assertIsInstance(sb_handler.watch_event.call_args[0][0],
+                              ovn_events.L2VNIChassisEvent)
+        self.assertTrue(agent.trunk_manager.desired_state.tracked)
+
+    def test_register_l2vni_desired_state_events_without_ovn(self):
+        """Test the desired state is not tracked without OVN connections."""
+        agent = mock.Mock(spec=ironic_neutron_agent.BaremetalNeutronAgent)
+        agent.trunk_manager = mock.Mock()
+        agent.trunk_manager.desired_state.tracked = False
+        agent.trunk_manager.ovn_sb_idl = None
+
+        ironic_neutron_agent.BaremetalNeutronAgent.\
+            _register_l2vni_desired_state_events(agent)
+
+        self.assertFalse(agent.trunk_manager.desired_state.tracked)
+
+
+class TestHashRingRebalance(tests_base.BaseTestCase):
+    """Tests for targeted reconciliation on hash ring membership change."""
+
+    def setUp(self):
+        super(TestHashRingRebalance, self).setUp()
+        agent_config.register_agent_opts(CONF)
+        CONF.set_override('enable_ha_chassis_group_alignment', False,
+                          group='baremetal_agent')
+        self.agent = mock.MagicMock(
+            spec=ironic_neutron_agent.BaremetalNeutronAgent)
+        self.agent.agent_id = 'agent-2'
+        self.agent.trunk_manager = None
+        self.agent.router_ha_binding = None
+        self.agent.reported_nodes = {}
+        self.agent._reported_nodes_lock = threading.Lock()
+        self.agent._rebalance_executor = mock.Mock()
+        self.agent._node_physnets = {
+            'node-%d' % i: {'physnet1'} for i in range(20)}
+        for method in ('_get_moved_keys', '_rebalance',
+                       '_on_hashring_change'):
+            setattr(self.agent, method, getattr(
+                ironic_neutron_agent.BaremetalNeutronAgent,
+                method).__get__(self.agent))
+        self.old_ring = hashring.HashRing(['agent-1'])
+        self.new_ring = hashring.HashRing(['agent-1', 'agent-2'])
+        self.moved = {
+            node for node in self.agent._node_physnets
+            if 'agent-2' in self.new_ring[node.encode('utf-8')]}
+
+    def test_get_moved_keys(self):
+        gained, lost = self.agent._get_moved_keys(
+            self.agent._node_physnets, self.old_ring, self.new_ring)
+        self.assertEqual(self.moved, gained)
+        self.assertEqual(set(), lost)
+
+        self.agent.agent_id = 'agent-1'
+        gained, lost = self.agent._get_moved_keys(
+            self.agent._node_physnets, self.old_ring, self.new_ring)
+        self.assertEqual(set(), gained)
+        self.assertEqual(self.moved, lost)
+
+    def test_on_hashring_change_initial_membership(self):
+        self.agent._on_hashring_change(hashring.HashRing([]), self.new_ring)
+        self.agent._rebalance_executor.submit.assert_not_called()
+
+    def test_on_hashring_change(self):
+        self.agent._on_hashring_change(self.old_ring, self.new_ring)
+        self.agent._rebalance_executor.submit.assert_called_once_with(
+            self.agent._rebalance, self.old_ring, self.new_ring)
+
+    def test_rebalance_gained_nodes(self):
+        self.agent._rebalance(self.old_ring, self.new_ring)
+        self.agent._send_node_states.assert_called_once_with(mock.ANY)
+        node_states = self.agent._send_node_states.call_args[0][0]
+        self.assertEqual(self.moved, set(node_states))
+
+    def test_rebalance_lost_nodes(self):
+        self.agent.agent_id = 'agent-1'
+        self.agent.reported_nodes = {
+            node: 'digest' for node in self.agent._node_physnets}
+
+        self.agent._rebalance(self.old_ring, self.new_ring)
+        self.agent._send_node_states.assert_not_called()
+        # Lost nodes are not deleted as stale by the next report cycle
+        self.assertEqual(set(self.agent._node_physnets) - self.moved,
+                         set(self.agent.reported_nodes))
+
+    def test_rebalance_waits_for_state_report(self):
+        self.agent._reported_nodes_lock.acquire()
+        rebalance = threading.Thread(
+            target=self.agent._rebalance,
+            args=(self.old_ring, self.new_ring))
+        rebalance.start()
+        rebalance.join(0.2)
+        self.assertTrue(rebalance.is_alive())
+        self.agent._send_node_states.assert_not_called()
+
+        self.agent._reported_nodes_lock.release()
+        rebalance.join(10)
+        self.assertFalse(rebalance.is_alive())
+        self.agent._send_node_states.assert_called_once_with(mock.ANY)
+
+    def test_rebalance_gained_chassis(self):
+        CONF.set_override('enable_l2vni_trunk_reconciliation', True,
+                          group='l2vni')
+        self.agent._node_physnets = {}
+        self.agent.trunk_manager = mock.Mock()
+        chassis = [mock.Mock() for i in range(20)]
+        for i, row in enumerate(chassis):
+            row.name = 'chassis-%d' % i
+        self.agent.trunk_manager.ovn_sb_idl.tables = {
+            'Chassis': mock.Mock(rows={row.name: row for row in chassis})}
+        gained = {
+            row.name for row in chassis
+            if 'agent-2' in self.new_ring[row.name.encode('utf-8')]}
+
+        self.agent._rebalance(self.old_ring, self.new_ring)
+        self.agent._reconcile_l2vni_trunks.assert_called_once_with(
+            chassis=gained)
+
+    def test_rebalance_invalidates_l2vni_desired_state(self):
+        self.agent.trunk_manager = mock.Mock()
+        self.agent.trunk_manager.ovn_sb_idl = None
+
+        self.agent._rebalance(self.old_ring, self.new_ring)
+        self.agent.trunk_manager.desired_state.invalidate\
+            .assert_called_once_with(mock.ANY)
+
+    def test_rebalance_gained_networks(self):
+        self.agent._node_physnets = {}
+        self.agent.router_ha_binding = mock.Mock()
+        networks = {'net-%d' % i: 'group-%d' % i for i in range(20)}
+        self.agent.router_ha_binding._get_networks_with_ha_chassis_groups\
+            .return_value = networks
+        gained = {
+            net for net in networks
+            if 'agent-2' in self.new_ring[net.encode('utf-8')]}
+
+        self.agent._rebalance(self.old_ring, self.new_ring)
+        bind = self.agent.router_ha_binding.bind_router_interfaces_for_network
+        bind.assert_has_calls(
+            [mock.call(net, networks[net]) for net in gained],
+            any_order=True)
+        self.assertEqual(len(gained), bind.call_count)
+
 
 class TestBaremetalAgentConfig(tests_base.BaseTestCase):
     """Test cases for baremetal agent configuration options."""
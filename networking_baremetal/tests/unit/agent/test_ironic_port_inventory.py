@@ -0,0 +1,97 @@
+# Copyright (c) 2026 Red Hat, Inc.
+# All Rights Reserved
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from oslotest import base
+
+from networking_baremetal.agent import ironic_port_inventory
+
+
+class FakeIronicPort:
+    """Fake Ironic Port object."""
+
+    def __init__(self, port_id, node_id, physical_network):
+        self.id = port_id
+        self.node_id = node_id
+        self.physical_network = physical_network
+
+
+class TestIronicPortInventory(base.BaseTestCase):
+    """Test cases for the Ironic port inventory."""
+
+    def setUp(self):
+        super(TestIronicPortInventory, self).setUp()
+        self.inventory = ironic_port_inventory.IronicPortInventory(
+            full_resync_cycles=2)
+
+    def test_needs_full_resync_when_empty(self):
+        self.assertTrue(self.inventory.needs_full_resync)
+
+    def test_resync(self):
+        count = self.inventory.resync([
+            FakeIronicPort('port-1', 'node-1', 'physnet1'),
+            FakeIronicPort('port-2', 'node-1', 'physnet2'),
+            FakeIronicPort('port-3', 'node-2', None)])
+
+        self.assertEqual(3, count)
+        self.assertEqual('port-3', self.inventory.marker)
+        self.assertFalse(self.inventory.needs_full_resync)
+        self.assertEqual({'node-1': {'physnet1', 'physnet2'},
+                          'node-2': set()},
+                         self.inventory.get_node_physnets())
+
+    def test_resync_failure_keeps_previous_inventory(self):
+        self.inventory.resync([FakeIronicPort('port-1', 'node-1',
+                                              'physnet1')])
+
+        def failing_listing():
+            yield FakeIronicPort('port-2', 'node-2', 'physnet1')
+            raise RuntimeError()
+
+        self.assertRaises(RuntimeError, self.inventory.resync,
+                          failing_listing())
+        self.assertEqual({'node-1': {'physnet1'}},
+                         self.inventory.get_node_physnets())
+        self.assertEqual('port-1', self.inventory.marker)
+
+    def test_apply_delta(self):
+        self.inventory.resync([FakeIronicPort('port-1', 'node-1',
+                                              'physnet1')])
+
+        applied = self.inventory.apply_delta(
+            [FakeIronicPort('port-2', 'node-2', 'physnet2')])
+
+        self.assertEqual(1, applied)
+        self.assertEqual('port-2', self.inventory.marker)
+        self.assertEqual({'node-1': {'physnet1'}, 'node-2': {'physnet2'}},
+                         self.inventory.get_node_physnets())
+
+    def test_full_resync_after_configured_cycles(self):
+        self.inventory.resync([FakeIronicPort('port-1', 'node-1',
+                                              'physnet1')])
+        self.inventory.apply_delta([])
+        self.assertFalse(self.inventory.needs_full_resync)
+        self.inventory.apply_delta([])
+        self.assertTrue(self.inventory.needs_full_resync)
+
+    def test_empty_listing_needs_full_resync(self):
+        # Without any port there is no marker to list from
+        self.inventory.resync([])
+        self.assertTrue(self.inventory.needs_full_resync)
+
+    def test_invalidate(self):
+        self.inventory.resync([FakeIronicPort('port-1', 'node-1',
+                                              'physnet1')])
+        self.inventory.invalidate()
+        self.assertTrue(self.inventory.needs_full_resync)
@@ -12,6 +12,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import threading
+import time
 from unittest import mock
 
 from neutron.tests import base as tests_base
@@ -99,14 +101,23 @@ class FakePort:
     """Fake Neutron Port object."""
 
     def __init__(self, port_id, device_owner, binding_profile=None,
-                 device_id=None):
+                 device_id=None, name=None):
         self.id = port_id
+        self.name = name
         self.device_owner = device_owner
         self.binding_profile = binding_profile or {}
         self.binding = {'profile': binding_profile or {}}
         self.device_id = device_id
 
 
+def fake_create_ports(ports_attrs):
+    """Fake bulk port creation returning a port per set of attributes."""
+    return [FakePort('port-%s' % attrs['name'], attrs['device_owner'],
+                     binding_profile=attrs['binding_profile'],
+                     name=attrs['name'])
+            for attrs in ports_attrs]
+
+
 class FakeTrunk:
     """Fake Neutron Trunk object."""
 
@@ -189,6 +200,11 @@ class TestL2VNITrunkManager(tests_base.BaseTestCase):
                 rows=mock.Mock(values=mock.Mock(return_value=[]))),
         }
 
+        # Neutron listings prefetched by reconcile()
+        self.mock_neutron.network.trunks.return_value = []
+        self.mock_neutron.network.ports.return_value = []
+        self.mock_neutron.network.networks.return_value = []
+
         # Note: member_manager is None, so _should_manage_chassis returns True
         # for all chassis (single agent mode)
         self.manager = l2vni_trunk_manager.L2VNITrunkManager(
@@ -234,6 +250,32 @@ class TestL2VNITrunkManager(tests_base.BaseTestCase):
         mock_reconcile_subports.assert_called_once()
         mock_cleanup.assert_called_once()
 
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_ensure_infrastructure_networks', autospec=True)
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_discover_trunks', autospec=True)
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_calculate_required_vlans', autospec=True)
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_reconcile_subports', autospec=True)
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_cleanup_unused_infrastructure', autospec=True)
+    def test_reconcile_chassis(self, mock_cleanup, mock_reconcile_subports,
+                               mock_calculate_vlans, mock_discover_trunks,
+                               mock_ensure_infra):
+        """Test reconciliation limited to some chassis."""
+        mock_discover_trunks.return_value = {
+            ('chassis-1', 'physnet1'): 'trunk-1'}
+        mock_calculate_vlans.return_value = {}
+
+        self.manager.reconcile(chassis={'chassis-1'})
+
+        mock_discover_trunks.assert_called_once_with(
+            self.manager, {'chassis-1'})
+        mock_reconcile_subports.assert_called_once_with(
+            self.manager, {('chassis-1', 'physnet1'): 'trunk-1'}, {})
+        mock_cleanup.assert_not_called()
+
     def test_ensure_infrastructure_networks_auto_create_enabled(self):
         """Test infrastructure network creation when auto-create enabled."""
         cfg.CONF.set_override('l2vni_auto_create_networks', True,
@@ -442,6 +484,23 @@ class TestL2VNITrunkManager(tests_base.BaseTestCase):
         self.assertIn(('system-1', 'physnet1'), result)
         self.assertEqual('trunk-id-1', result[('system-1', 'physnet1')])
 
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_find_or_create_trunk', autospec=True)
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_get_chassis_physnets', autospec=True)
+    def test_discover_trunks_chassis(self, mock_chassis_physnets,
+                                     mock_find_trunk):
+        """Test trunk discovery limited to some chassis."""
+        mock_chassis_physnets.return_value = {('system-1', 'physnet1'),
+                                              ('system-2', 'physnet1')}
+        mock_find_trunk.return_value = 'trunk-id-1'
+
+        result = self.manager._discover_trunks({'system-1'})
+
+        self.assertEqual({('system-1', 'physnet1'): 'trunk-id-1'}, result)
+        mock_find_trunk.assert_called_once_with(
+            self.manager, 'system-1', 'physnet1')
+
     def test_discover_trunks_ignores_non_l2vni_trunks(self):
         """Test trunk discovery ignores non-L2VNI device owners."""
         # Mock port with wrong device owner
@@ -584,6 +643,72 @@ class TestL2VNITrunkManager(tests_base.BaseTestCase):
         self.assertEqual(5000, vlan_info['vni'])
         self.assertEqual('segment-network-id-1-100', vlan_info['segment_id'])
 
+    def test_calculate_required_vlans_at_scale(self):
+        """Test VLAN calculation with 5000 networks and 200 chassis.
+
+        The logical switches are walked once and the chassis of each HA
+        chassis group are resolved once, however many router ports use it.
+        """
+        chassis = [
+            FakeChassis(f'chassis-{i}', f'system-id-{i}',
+                        other_config={'ovn-bridge-mappings':
+                                      f'physnet1:br-ex,physnet{i % 4 + 2}:br'})
+            for i in range(200)]
+        self.mock_ovn_sb.tables['Chassis'].rows.values.return_value = chassis
+        ha_groups = [
+            FakeHAChassisGroup(f'group-{g}', [FakeHAChassis(
+                f'system-id-{(g * 3 + k) % 200}') for k in range(3)])
+            for g in range(50)]
+
+        switches = []
+        lrps = {}
+        segments = []
+        for n in range(5000):
+            ls = FakeLogicalSwitch(f'neutron-network-{n}')
+            ls.ports = [FakeLogicalSwitchPort(f'port-{n}', '')]
+            if n % 2 == 0:
+                ls.ports.append(FakeLogicalSwitchPort(
+                    f'provnet-{n}', 'localnet',
+                    options={'network_name': 'physnet1'}))
+            if n % 5 == 0:
+                lrps[f'lrp-{n}'] = FakeLogicalRouterPort(
+                    f'lrp-{n}', [], ha_chassis_group=ha_groups[n % 50])
+                ls.ports.append(FakeLogicalSwitchPort(
+                    f'router-{n}', 'router',
+                    options={'router-port': f'lrp-{n}'}))
+            switches.append(ls)
+            segments.append(FakeSegment(f'network-{n}', n_const.TYPE_VLAN,
+                                        n + 1, 'physnet1'))
+        self.mock_ovn_nb.tables['Logical_Switch'].rows.values\
+            .return_value = switches
+        self.mock_ovn_nb.tables['Logical_Router_Port'] = mock.Mock(
+            rows=lrps)
+        self.mock_neutron.network.segments.return_value = segments
+        self.manager._ovn_snapshot = l2vni_trunk_manager.OVNSnapshot(
+            self.mock_ovn_nb, self.mock_ovn_sb)
+
+        with mock.patch.object(
+                self.manager, '_get_chassis_for_lrp', autospec=True,
+                side_effect=self.manager._get_chassis_for_lrp) as mock_lrp:
+            result = self.manager._calculate_required_vlans()
+            # 1000 router ports on 10 HA chassis groups
+            self.assertEqual(10, mock_lrp.call_count)
+
+        # Every chassis has physnet1, so needs the VLAN of every network
+        # with a localnet port, plus those of its routers' networks.
+        self.assertEqual(200, len(result))
+        self.assertEqual(
+            {'vni': None, 'segment_id': 'segment-network-0-1'},
+            result[('system-id-0', 'physnet1')][1])
+        localnet_vlans = {n + 1 for n in range(0, 5000, 2)}
+        for key, vlans in result.items():
+            self.assertTrue(localnet_vlans.issubset(vlans), key)
+        # network-5 has no localnet port, only a router port on group-5
+        self.assertEqual(
+            {('system-id-15', 'physnet1'), ('system-id-16', 'physnet1'),
+             ('system-id-17', 'physnet1')},
+            {key for key, vlans in result.items() if 6 in vlans})
+
     def test_reconcile_subports_adds_missing_subports(self):
         """Test subport reconciliation adds missing subports."""
         # Setup trunk with no subports
@@ -609,11 +734,9 @@ class TestL2VNITrunkManager(tests_base.BaseTestCase):
         anchor_network = FakeNetwork('anchor-net-id', 'anchor-network')
         self.mock_neutron.network.networks.return_value = [anchor_network]
 
-        # Mock port creation
-        self.mock_neutron.network.create_port.return_value = FakePort(
-            'new-port-id',
-            l2vni_trunk_manager.DEVICE_OWNER_L2VNI_SUBPORT
-        )
+        # Mock bulk port creation
+        self.mock_neutron.network.create_ports.side_effect = (
+            fake_create_ports)
 
         # Mock local link connection discovery
         with mock.patch.object(
@@ -624,13 +747,15 @@ class TestL2VNITrunkManager(tests_base.BaseTestCase):
                               'port_id': 'Ethernet1'}):
             self.manager._reconcile_subports(trunk_map, required_vlans)
 
-        # Should create 2 subports
-        self.assertEqual(2, self.mock_neutron.network.create_port.call_count)
+        # Should create 2 subports with a single bulk request
+        self.mock_neutron.network.create_port.assert_not_called()
+        self.mock_neutron.network.create_ports.assert_called_once_with(
+            mock.ANY)
 
         # Verify binding_profile contains segment_id and VNI for both subports
-        calls = self.mock_neutron.network.create_port.call_args_list
-        for call in calls:
-            kwargs = call[1]
+        ports_attrs = self.mock_neutron.network.create_ports.call_args[0][0]
+        self.assertEqual(2, len(ports_attrs))
+        for kwargs in ports_attrs:
             self.assertIn('binding_profile', kwargs)
             binding_profile = kwargs['binding_profile']
             self.assertIn('physical_network', binding_profile)
@@ -643,9 +768,13 @@ class TestL2VNITrunkManager(tests_base.BaseTestCase):
             # VNI should be either 5000 or 5001
             self.assertIn(binding_profile['vni'], [5000, 5001])
 
-        # Should add subports to trunk (one call per VLAN)
-        add_subports = self.mock_neutron.network.add_trunk_subports
-        self.assertEqual(2, add_subports.call_count)
+        # Should add both subports to trunk with a single call
+        self.mock_neutron.network.add_trunk_subports.assert_called_once_with(
+            'trunk-id',
+            [{'port_id': 'port-l2vni-subport-system-1-physnet1-vlan100',
+              'segmentation_type': 'vlan', 'segmentation_id': 100},
+             {'port_id': 'port-l2vni-subport-system-1-physnet1-vlan200',
+              'segmentation_type': 'vlan', 'segmentation_id': 200}])
 
     def test_reconcile_subports_removes_extra_subports(self):
         """Test subport reconciliation removes extra subports."""
@@ -709,11 +838,9 @@ class TestL2VNITrunkManager(tests_base.BaseTestCase):
         anchor_network = FakeNetwork('anchor-net-id', 'anchor-network')
         self.mock_neutron.network.networks.return_value = [anchor_network]
 
-        # Mock port creation
-        self.mock_neutron.network.create_port.return_value = FakePort(
-            'new-port-id',
-            l2vni_trunk_manager.DEVICE_OWNER_L2VNI_SUBPORT
-        )
+        # Mock bulk port creation
+        self.mock_neutron.network.create_ports.side_effect = (
+            fake_create_ports)
 
         # Mock local link connection discovery
         with mock.patch.object(
@@ -724,14 +851,16 @@ class TestL2VNITrunkManager(tests_base.BaseTestCase):
                               'port_id': 'Ethernet1'}):
             self.manager._reconcile_subports(trunk_map, required_vlans)
 
-        # Should create 2 subports
-        self.assertEqual(2, self.mock_neutron.network.create_port.call_count)
+        # Should create 2 subports with a single bulk request
+        self.mock_neutron.network.create_port.assert_not_called()
+        self.mock_neutron.network.create_ports.assert_called_once_with(
+            mock.ANY)
 
         # Verify binding_profile contains segment_id but NOT VNI for pure
         # VLAN networks
-        calls = self.mock_neutron.network.create_port.call_args_list
-        for call in calls:
-            kwargs = call[1]
+        ports_attrs = self.mock_neutron.network.create_ports.call_args[0][0]
+        self.assertEqual(2, len(ports_attrs))
+        for kwargs in ports_attrs:
             self.assertIn('binding_profile', kwargs)
             binding_profile = kwargs['binding_profile']
             self.assertIn('physical_network', binding_profile)
@@ -742,6 +871,286 @@ class TestL2VNITrunkManager(tests_base.BaseTestCase):
             # VNI should NOT be in binding_profile when it's None
             self.assertNotIn('vni', binding_profile)
 
+    def test_run_per_trunk_isolates_failures(self):
+        """Test a failing trunk does not stop the other trunks."""
+        def func(system_id, physnet):
+            if system_id == 'system-2':
+                raise sdkexc.SDKException('fail')
+            return 'trunk-%s' % system_id
+
+        results = self.manager._run_per_trunk(
+            'discover', [('system-1', 'physnet1'), ('system-2', 'physnet1'),
+                         ('system-3', 'physnet1')], func)
+
+        self.assertEqual({('system-1', 'physnet1'): 'trunk-system-1',
+                          ('system-3', 'physnet1'): 'trunk-system-3'},
+                         results)
+
+    def test_run_per_trunk_concurrent(self):
+        """Test trunks are handled concurrently with several workers."""
+        cfg.CONF.set_override('l2vni_reconciliation_workers', 2,
+                              group='l2vni')
+        # Both trunks must run at the same time to pass the barrier
+        barrier = threading.Barrier(2, timeout=10)
+
+        def func(system_id, physnet):
+            barrier.wait()
+            return system_id
+
+        results = self.manager._run_per_trunk(
+            'reconcile', [('system-1', 'physnet1'), ('system-2', 'physnet1')],
+            func)
+
+        self.assertEqual({('system-1', 'physnet1'): 'system-1',
+                          ('system-2', 'physnet1'): 'system-2'}, results)
+
+    def test_run_per_trunk_deadline_reached(self):
+        """Test trunks are skipped once the deadline is reached."""
+        self.manager._reconcile_deadline = time.monotonic() - 1
+        func = mock.Mock()
+
+        results = self.manager._run_per_trunk(
+            'reconcile', [('system-1', 'physnet1')], func)
+
+        self.assertEqual({}, results)
+        func.assert_not_called()
+
+    def test_run_per_trunk_comes_back_for_locked_trunks(self):
+        """Test trunks locked elsewhere are handled after the others."""
+        locked = threading.Event()
+        release = threading.Event()
+
+        def hold_lock():
+            with self.manager.trunk_locks.hold([('system-1', 'physnet1')]):
+                locked.set()
+                release.wait(10)
+
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        self.addCleanup(holder.join, 10)
+        self.assertTrue(locked.wait(10))
+        handled = []
+
+        def func(system_id, physnet):
+            handled.append(system_id)
+            release.set()
+            return system_id
+
+        results = self.manager._run_per_trunk(
+            'reconcile', [('system-1', 'physnet1'), ('system-2', 'physnet1')],
+            func)
+
+        self.assertEqual(['system-2', 'system-1'], handled)
+        self.assertEqual({('system-1', 'physnet1'): 'system-1',
+                          ('system-2', 'physnet1'): 'system-2'}, results)
+
+    def test_run_per_trunk_skips_trunks_changed_since_start(self):
+        """Test trunks changed by targeted reconciliations are skipped."""
+        self.manager._reconcile_sequence = self.manager.trunk_locks.sequence
+        with self.manager.trunk_locks.hold([('system-1', 'physnet1')],
+                                           changes=True):
+            pass
+        func = mock.Mock(return_value='trunk')
+
+        results = self.manager._run_per_trunk(
+            'reconcile', [('system-1', 'physnet1'), ('system-2', 'physnet1')],
+            func)
+
+        self.assertEqual({('system-2', 'physnet1'): 'trunk'}, results)
+        func.assert_called_once_with('system-2', 'physnet1')
+
+    def test_run_per_trunk_workers_share_context(self):
+        """Test the workers use the snapshots of the reconciliation."""
+        cfg.CONF.set_override('l2vni_reconciliation_workers', 2,
+                              group='l2vni')
+        snapshot = mock.Mock()
+        self.manager._ovn_snapshot = snapshot
+
+        results = self.manager._run_per_trunk(
+            'reconcile', [('system-1', 'physnet1'), ('system-2', 'physnet1')],
+            lambda system_id, physnet: self.manager._ovn_snapshot)
+
+        self.assertEqual({('system-1', 'physnet1'): snapshot,
+                          ('system-2', 'physnet1'): snapshot}, results)
+        # Other threads have their own reconciliation context
+        other = []
+        thread = threading.Thread(
+            target=lambda: other.append(self.manager._ovn_snapshot))
+        thread.start()
+        thread.join(10)
+        self.assertEqual([None], other)
+
+    def test_trunk_locks(self):
+        """Test trunk locks are held together, or not at all."""
+        locks = l2vni_trunk_manager.TrunkLocks()
+        key1 = ('system-1', 'physnet1')
+        key2 = ('system-2', 'physnet1')
+        sequence = locks.sequence
+
+        with locks.hold([key2, key1], changes=True) as held:
+            self.assertTrue(held)
+            result = []
+            thread = threading.Thread(target=lambda: result.append(
+                locks._get(key1).locked()))
+            thread.start()
+            thread.join(10)
+            self.assertEqual([True], result)
+
+            def try_hold():
+                with locks.hold([('system-0', 'physnet1'), key2],
+                                blocking=False) as held:
+                    result.append(held)
+
+            thread = threading.Thread(target=try_hold)
+            thread.start()
+            thread.join(10)
+            self.assertFalse(result[1])
+            # The lock acquired before the busy one was released
+            self.assertFalse(locks._get(('system-0', 'physnet1')).locked())
+
+        self.assertFalse(locks._get(key1).locked())
+        self.assertFalse(locks._get(key2).locked())
+        self.assertTrue(locks.changed_since(key1, sequence))
+        self.assertTrue(locks.changed_since(key2, sequence))
+        self.assertFalse(locks.changed_since(key1, locks.sequence))
+
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_reconcile_trunk_subports', autospec=True)
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_get_subport_anchor_network_id', autospec=True,
+                       return_value='anchor-net-id')
+    def test_reconcile_subports_with_workers(self, mock_anchor,
+                                             mock_reconcile_trunk):
+        """Test every trunk is reconciled with several workers."""
+        cfg.CONF.set_override('l2vni_reconciliation_workers', 4,
+                              group='l2vni')
+        trunk_map = {('system-%d' % i, 'physnet1'): 'trunk-%d' % i
+                     for i in range(10)}
+        required_vlans = {('system-1', 'physnet1'): {100: mock.sentinel.v}}
+
+        self.manager._reconcile_subports(trunk_map, required_vlans)
+
+        self.assertEqual(10, mock_reconcile_trunk.call_count)
+        mock_reconcile_trunk.assert_any_call(
+            self.manager, 'trunk-1', 'system-1', 'physnet1',
+            {100: mock.sentinel.v}, 'anchor-net-id')
+        mock_reconcile_trunk.assert_any_call(
+            self.manager, 'trunk-2', 'system-2', 'physnet1', {},
+            'anchor-net-id')
+
+    def test_remove_subports_detaches_at_once(self):
+        """Test subports are detached together and deleted concurrently."""
+        cfg.CONF.set_override('l2vni_port_delete_workers', 2, group='l2vni')
+        network_api = self.mock_neutron.network
+        self.manager._trunk_cache['trunk-id'] = mock.sentinel.trunk
+
+        self.assertTrue(self.manager._remove_subports(
+            'trunk-id', [('port-100', 100), ('port-200', 200),
+                         ('port-300', 300)]))
+
+        network_api.delete_trunk_subports.assert_called_once_with(
+            'trunk-id', [{'port_id': 'port-100'}, {'port_id': 'port-200'},
+                         {'port_id': 'port-300'}])
+        network_api.delete_port.assert_has_calls(
+            [mock.call('port-100'), mock.call('port-200'),
+             mock.call('port-300')], any_order=True)
+        self.assertNotIn('trunk-id', self.manager._trunk_cache)
+
+    def test_remove_subports_detach_failure(self):
+        """Test ports are not deleted when they cannot be detached."""
+        network_api = self.mock_neutron.network
+        network_api.delete_trunk_subports.side_effect = (
+            sdkexc.SDKException('fail'))
+
+        self.assertFalse(self.manager._remove_subports(
+            'trunk-id', [('port-100', 100), ('port-200', 200)]))
+
+        network_api.delete_port.assert_not_called()
+
+    def test_remove_subports_delete_failure(self):
+        """Test a failed port delete does not stop the other deletes."""
+        network_api = self.mock_neutron.network
+        network_api.delete_port.side_effect = [
+            sdkexc.SDKException('fail'), None]
+
+        self.assertFalse(self.manager._remove_subports(
+            'trunk-id', [('port-100', 100), ('port-200', 200)]))
+
+        self.assertEqual(2, network_api.delete_port.call_count)
+
+    def _subports(self, vlan_ids):
+        return [(vlan_id, 'segment-%d' % vlan_id, None)
+                for vlan_id in vlan_ids]
+
+    def test_add_subports_in_batches(self):
+        """Test subports are created and attached in batches."""
+        cfg.CONF.set_override('l2vni_subport_batch_size', 2, group='l2vni')
+        network_api = self.mock_neutron.network
+        network_api.create_ports.side_effect = fake_create_ports
+        network_api.create_port.return_value = FakePort(
+            'port-500', l2vni_trunk_manager.DEVICE_OWNER_L2VNI_SUBPORT)
+
+        self.assertTrue(self.manager._add_subports(
+            'trunk-id', 'system-1', 'physnet1',
+            self._subports([100, 200, 300, 400, 500]), 'anchor-net-id'))
+
+        # Two full batches in bulk, the last single subport on its own
+        self.assertEqual(2, network_api.create_ports.call_count)
+        self.assertEqual(
+            ['l2vni-subport-system-1-physnet1-vlan300',
+             'l2vni-subport-system-1-physnet1-vlan400'],
+            [attrs['name']
+             for attrs in network_api.create_ports.call_args[0][0]])
+        network_api.create_port.assert_called_once_with(
+            name='l2vni-subport-system-1-physnet1-vlan500',
+            network_id='anchor-net-id',
+            device_owner=l2vni_trunk_manager.DEVICE_OWNER_L2VNI_SUBPORT,
+            admin_state_up=True,
+            binding_vnic_type='baremetal',
+            binding_profile={'physical_network': 'physnet1',
+                             'segment_id': 'segment-500'})
+        self.assertEqual(3, network_api.add_trunk_subports.call_count)
+
+    def test_add_subports_bulk_create_failure_retries_individually(self):
+        """Test subports of a failed bulk create are retried one by one."""
+        network_api = self.mock_neutron.network
+        network_api.create_ports.side_effect = sdkexc.SDKException('fail')
+        network_api.create_port.return_value = FakePort(
+            'port-id', l2vni_trunk_manager.DEVICE_OWNER_L2VNI_SUBPORT)
+
+        self.assertTrue(self.manager._add_subports(
+            'trunk-id', 'system-1', 'physnet1', self._subports([100, 200]),
+            'anchor-net-id'))
+
+        self.assertEqual(2, network_api.create_port.call_count)
+        network_api.add_trunk_subports.assert_has_calls([
+            mock.call('trunk-id', [{'port_id': 'port-id',
+                                    'segmentation_type': 'vlan',
+                                    'segmentation_id': 100}]),
+            mock.call('trunk-id', [{'port_id': 'port-id',
+                                    'segmentation_type': 'vlan',
+                                    'segmentation_id': 200}])])
+
+    def test_add_subports_attach_failure_deletes_ports_and_retries(self):
+        """Test ports of a batch that cannot be attached are deleted."""
+        network_api = self.mock_neutron.network
+        network_api.create_ports.side_effect = fake_create_ports
+        network_api.create_port.return_value = FakePort(
+            'port-id', l2vni_trunk_manager.DEVICE_OWNER_L2VNI_SUBPORT)
+        # The batch fails, VLAN 100 succeeds on retry, VLAN 200 fails again
+        network_api.add_trunk_subports.side_effect = [
+            sdkexc.SDKException('fail'), None, sdkexc.SDKException('fail')]
+
+        self.assertFalse(self.manager._add_subports(
+            'trunk-id', 'system-1', 'physnet1', self._subports([100, 200]),
+            'anchor-net-id'))
+
+        network_api.delete_port.assert_has_calls([
+            mock.call('port-l2vni-subport-system-1-physnet1-vlan100'),
+            mock.call('port-l2vni-subport-system-1-physnet1-vlan200')])
+        self.assertEqual(2, network_api.create_port.call_count)
+        self.assertEqual(3, network_api.add_trunk_subports.call_count)
+
     def test_get_local_link_from_ovn_lldp_success(self):
         """Test local_link_information retrieval from OVN LLDP data."""
         # Mock chassis with bridge mappings
@@ -1071,39 +1480,107 @@ class TestL2VNITrunkManager(tests_base.BaseTestCase):
         self.assertEqual(1, self.mock_ironic.nodes.call_count)
         self.assertEqual(1, self.mock_ironic.ports.call_count)
 
-    def test_get_local_link_from_ironic_cache_expires(self):
-        """Test that Ironic cache expires after TTL."""
-        import time
+    def test_get_local_link_from_ironic_cache_refreshed_ahead(self):
+        """Test that stale Ironic cache entries are refreshed in background.
 
-        # Manually inject an expired cache entry to test expiration
-        # (we can't set TTL < 300 due to config validation)
+        The stale entry is used until the refresh lands.
+        """
         local_link_conn = {
             'switch_id': 'aa:bb:cc:dd:ee:ff',
             'port_id': 'GigabitEthernet1/0/1',
         }
+        new_link_conn = {
+            'switch_id': 'aa:bb:cc:dd:ee:ff',
+            'port_id': 'GigabitEthernet1/0/2',
+        }
         ironic_port = FakeIronicPort(
-            'node-id-1', 'physnet1', local_link_conn)
+            'node-id-1', 'physnet1', new_link_conn)
         ironic_node = FakeIronicNode('node-id-1', 'system-id-1')
 
         self.mock_ironic.nodes.return_value = [ironic_node]
         self.mock_ironic.ports.return_value = [ironic_port]
 
-        # Manually create an expired cache entry (timestamped in the past)
-        self.manager._ironic_cache['system-id-1'] = {
+        # Manually create a stale cache entry (timestamped in the past)
+        # (we can't set TTL < 300 due to config validation)
+        self.manager._ironic_cache.put('system-id-1', {
             'cached_at': time.time() - 4000,  # Expired (> 3600s default)
             'node_uuid': 'node-id-1',
             'ports': [{'physnet': 'physnet1', 'local_link': local_link_conn}]
-        }
+        })
 
-        # Call should detect expired cache and refresh
+        # The stale entry is used while it is refreshed
         result = self.manager._get_local_link_from_ironic(
             'system-id-1', 'physnet1')
-        self.assertIsNotNone(result)
+        self.assertEqual([local_link_conn], result)
 
-        # Should have queried Ironic to refresh expired cache
+        # Wait for the background refresh
+        self.manager._ironic_cache._executor.shutdown(wait=True)
         self.assertEqual(1, self.mock_ironic.nodes.call_count)
         self.assertEqual(1, self.mock_ironic.ports.call_count)
 
+        result = self.manager._get_local_link_from_ironic(
+            'system-id-1', 'physnet1')
+        self.assertEqual([new_link_conn], result)
+        self.assertEqual(
+            {'entries': 1, 'hits': 1, 'stale_hits': 1, 'misses': 0,
+             'refreshes': 1, 'refresh_failures': 0, 'evictions': 0},
+            self.manager._ironic_cache.stats())
+
+    def test_get_local_link_from_ironic_cache_expired(self):
+        """Test entries older than twice the TTL are fetched inline."""
+        local_link_conn = {
+            'switch_id': 'aa:bb:cc:dd:ee:ff',
+            'port_id': 'GigabitEthernet1/0/1',
+        }
+        self.mock_ironic.nodes.return_value = [
+            FakeIronicNode('node-id-1', 'system-id-1')]
+        self.mock_ironic.ports.return_value = [
+            FakeIronicPort('node-id-1', 'physnet1', local_link_conn)]
+        self.manager._ironic_cache.put('system-id-1', {
+            'cached_at': time.time() - 8000,
+            'node_uuid': 'node-id-1',
+            'ports': []
+        })
+
+        result = self.manager._get_local_link_from_ironic(
+            'system-id-1', 'physnet1')
+
+        self.assertEqual([local_link_conn], result)
+        self.assertEqual(1, self.mock_ironic.ports.call_count)
+        self.assertEqual(1, self.manager._ironic_cache.stats()['misses'])
+
+    def test_ironic_cache_evicts_least_recently_used(self):
+        """Test the Ironic cache is bounded by ironic_cache_size."""
+        cfg.CONF.set_override('ironic_cache_size', 2, group='l2vni')
+        cache = self.manager._ironic_cache
+        for system_id in ('system-id-1', 'system-id-2'):
+            cache.put(system_id, {'cached_at': time.time(), 'ports': []})
+        # Use system-id-1 so system-id-2 is the least recently used
+        self.assertIsNotNone(cache.get('system-id-1'))
+
+        cache.put('system-id-3', {'cached_at': time.time(), 'ports': []})
+
+        self.assertEqual(2, len(cache))
+        self.assertIsNotNone(cache.get('system-id-1'))
+        self.assertIsNone(cache.get('system-id-2'))
+        self.assertIsNotNone(cache.get('system-id-3'))
+        self.assertEqual(1, cache.stats()['evictions'])
+
+    def test_ironic_cache_failed_refresh_keeps_entry(self):
+        """Test a failed background refresh keeps the stale entry."""
+        mock_fetch = mock.Mock(return_value=None)
+        cache = l2vni_trunk_manager.IronicLinkCache(mock_fetch)
+        entry = {'cached_at': time.time() - 4000, 'ports': []}
+        cache.put('system-id-1', entry)
+
+        self.assertEqual(entry, cache.get('system-id-1'))
+        cache._executor.shutdown(wait=True)
+
+        mock_fetch.assert_called_once_with('system-id-1')
+        self.assertEqual({'system-id-1': entry}, cache._entries)
+        self.assertEqual(1, cache.stats()['refresh_failures'])
+        self.assertEqual(set(), cache._refreshing)
+
     def test_get_local_link_from_ironic_with_conductor_group_filter(self):
         """Test Ironic query uses conductor_group filter when configured."""
         cfg.CONF.set_override('ironic_conductor_group',
@@ -1121,6 +1598,118 @@ class TestL2VNITrunkManager(tests_base.BaseTestCase):
             fields=['uuid', 'properties'],
             conductor_group='group1')
 
+    def test_fetch_ironic_data_uses_system_id_index(self):
+        """Test Ironic nodes are listed once for all system_ids."""
+        self.mock_ironic.nodes.return_value = [
+            FakeIronicNode('node-id-%d' % i, 'system-id-%d' % i)
+            for i in range(3)]
+        self.mock_ironic.ports.return_value = []
+
+        for system_id in ('system-id-0', 'system-id-1', 'unknown'):
+            self.manager._fetch_ironic_data_for_system_id(system_id)
+
+        self.mock_ironic.nodes.assert_called_once_with(
+            fields=['uuid', 'properties'])
+        self.mock_ironic.ports.assert_has_calls([
+            mock.call(node_uuid='node-id-0',
+                      fields=['physical_network', 'local_link_connection']),
+            mock.call(node_uuid='node-id-1',
+                      fields=['physical_network', 'local_link_connection'])])
+        self.assertEqual(2, self.mock_ironic.ports.call_count)
+
+    def test_prefetch_ironic_data(self):
+        """Test the Ironic data of uncached system_ids is fetched."""
+        self.mock_ironic.nodes.return_value = [
+            FakeIronicNode('node-id-%d' % i, 'system-id-%d' % i)
+            for i in range(3)]
+        self.mock_ironic.ports.return_value = []
+        self.manager._ironic_cache.put(
+            'system-id-0', {'cached_at': time.time(), 'node_uuid': 'node-id-0',
+                            'ports': []})
+
+        self.manager._prefetch_ironic_data(
+            {'system-id-0', 'system-id-1', 'system-id-2', 'unknown'})
+
+        self.mock_ironic.nodes.assert_called_once_with(
+            fields=['uuid', 'properties'])
+        self.mock_ironic.ports.assert_has_calls([
+            mock.call(node_uuid='node-id-1',
+                      fields=['physical_network', 'local_link_connection']),
+            mock.call(node_uuid='node-id-2',
+                      fields=['physical_network', 'local_link_connection'])],
+            any_order=True)
+        self.assertEqual(2, self.mock_ironic.ports.call_count)
+        self.assertEqual(
+            'node-id-1',
+            self.manager._ironic_cache.get('system-id-1')['node_uuid'])
+        self.assertIsNone(self.manager._ironic_cache.get('unknown'))
+
+    def test_needs_ironic_links(self):
+        """Test only anchor ports lacking links and LLDP need Ironic."""
+        configured = FakePort(
+            'anchor-1', l2vni_trunk_manager.DEVICE_OWNER_L2VNI_ANCHOR,
+            binding_profile={'local_link_information': [{'port_id': 'p'}]})
+        self.manager._neutron_snapshot = mock.Mock(anchor_ports={
+            'l2vni-anchor-system-id-1-physnet1': configured})
+
+        with mock.patch.object(self.manager, '_get_lldp_from_ovn',
+                               autospec=True) as mock_lldp:
+            mock_lldp.return_value = None
+            self.assertFalse(self.manager._needs_ironic_links(
+                'system-id-1', 'physnet1'))
+            self.assertTrue(self.manager._needs_ironic_links(
+                'system-id-2', 'physnet1'))
+            mock_lldp.return_value = [{'port_id': 'p'}]
+            self.assertFalse(self.manager._needs_ironic_links(
+                'system-id-2', 'physnet1'))
+
+        # Outside a reconciliation nothing is prefetched
+        self.manager._neutron_snapshot = None
+        self.assertFalse(self.manager._needs_ironic_links(
+            'system-id-2', 'physnet1'))
+
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_prefetch_ironic_data', autospec=True)
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_needs_ironic_links', autospec=True)
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_find_or_create_trunk', autospec=True)
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_get_chassis_physnets', autospec=True)
+    def test_discover_trunks_prefetches_ironic_data(
+            self, mock_chassis_physnets, mock_find_trunk, mock_needs_links,
+            mock_prefetch):
+        """Test trunk discovery fetches the needed Ironic data together."""
+        mock_chassis_physnets.return_value = {('system-1', 'physnet1'),
+                                              ('system-2', 'physnet1')}
+        mock_needs_links.side_effect = (
+            lambda manager, system_id, physnet: system_id == 'system-2')
+        mock_find_trunk.return_value = 'trunk-id'
+
+        self.manager._discover_trunks()
+
+        mock_prefetch.assert_called_once_with(self.manager, {'system-2'})
+
+    def test_system_id_index_refreshed_after_ttl(self):
+        """Test the system_id index is rebuilt once per ironic_cache_ttl."""
+        self.mock_ironic.nodes.return_value = [
+            FakeIronicNode('node-id-1', 'system-id-1')]
+
+        self.assertEqual(
+            'node-id-1',
+            self.manager._get_node_uuid_for_system_id('system-id-1'))
+        self.mock_ironic.nodes.return_value = [
+            FakeIronicNode('node-id-2', 'system-id-1')]
+        self.assertEqual(
+            'node-id-1',
+            self.manager._get_node_uuid_for_system_id('system-id-1'))
+
+        self.manager._system_id_index_at -= CONF.l2vni.ironic_cache_ttl
+        self.assertEqual(
+            'node-id-2',
+            self.manager._get_node_uuid_for_system_id('system-id-1'))
+        self.assertEqual(2, self.mock_ironic.nodes.call_count)
+
     def test_get_local_link_from_ironic_with_shard_filter(self):
         """Test Ironic query uses shard filter when configured."""
         cfg.CONF.set_override('ironic_shard', 'shard1', group='l2vni')
@@ -1299,6 +1888,45 @@ network_nodes:
         self.mock_neutron.network.delete_port.assert_called_once_with(
             'orphan-port-id')
 
+    def test_cleanup_orphaned_trunks_detaches_subports_at_once(self):
+        """Test orphaned trunk subports are detached with one request."""
+        subports = [{'port_id': 'subport-%d' % vlan_id,
+                     'segmentation_id': vlan_id,
+                     'segmentation_type': 'vlan'}
+                    for vlan_id in (100, 200, 300)]
+        trunk = FakeTrunk('orphan-trunk-id', 'orphan-port-id',
+                          sub_ports=subports,
+                          name='l2vni-trunk-deleted-system-physnet1')
+        self.mock_neutron.network.trunks.return_value = [trunk]
+
+        self.manager._cleanup_orphaned_trunks(set())
+
+        network_api = self.mock_neutron.network
+        network_api.delete_trunk_subports.assert_called_once_with(
+            'orphan-trunk-id', [{'port_id': 'subport-100'},
+                                {'port_id': 'subport-200'},
+                                {'port_id': 'subport-300'}])
+        network_api.delete_trunk.assert_called_once_with('orphan-trunk-id')
+        self.assertEqual(
+            {'subport-100', 'subport-200', 'subport-300', 'orphan-port-id'},
+            {call.args[0] for call in network_api.delete_port.call_args_list})
+
+    def test_cleanup_orphaned_trunks_keeps_anchor_port_of_trunk(self):
+        """Test the anchor port is kept when the trunk is not deleted."""
+        trunk = FakeTrunk('orphan-trunk-id', 'orphan-port-id',
+                          sub_ports=[{'port_id': 'subport-100',
+                                      'segmentation_id': 100,
+                                      'segmentation_type': 'vlan'}],
+                          name='l2vni-trunk-deleted-system-physnet1')
+        self.mock_neutron.network.trunks.return_value = [trunk]
+        self.mock_neutron.network.delete_trunk.side_effect = (
+            sdkexc.SDKException('fail'))
+
+        self.manager._cleanup_orphaned_trunks(set())
+
+        self.mock_neutron.network.delete_port.assert_called_once_with(
+            'subport-100')
+
     def test_cleanup_orphaned_networks_removes_unused_ha_networks(self):
         """Test cleanup removes ha_chassis_group networks with no groups."""
         # Mock network with l2vni-ha prefix
@@ -1577,6 +2205,331 @@ network_nodes:
         # Together they should cover all chassis
         self.assertEqual(4, len(agent1_chassis | agent2_chassis))
 
+    def test_ovn_snapshot_indexes(self):
+        """Test the OVN snapshot indexes switches and chassis."""
+        chassis1 = FakeChassis(
+            'chassis-1', 'system-id-1',
+            other_config={'ovn-bridge-mappings':
+                          'physnet1:br-ex, physnet2:br-data'},
+            hostname='host-1')
+        chassis2 = FakeChassis(
+            'chassis-2', 'system-id-2',
+            other_config={'ovn-bridge-mappings': 'physnet1:br-ex'})
+        self.mock_ovn_sb.tables['Chassis'].rows.values.return_value = [
+            chassis1, chassis2]
+        ls = FakeLogicalSwitch('neutron-network-id-1')
+        self.mock_ovn_nb.tables['Logical_Switch'].rows.values\
+            .return_value = [ls]
+
+        snapshot = l2vni_trunk_manager.OVNSnapshot(self.mock_ovn_nb,
+                                                   self.mock_ovn_sb)
+
+        self.assertEqual({'neutron-network-id-1': ls},
+                         snapshot.logical_switches)
+        self.assertEqual({'system-id-1': chassis1, 'system-id-2': chassis2},
+                         snapshot.chassis)
+        self.assertEqual({'physnet1': 'br-ex', 'physnet2': 'br-data'},
+                         snapshot.bridge_mappings['system-id-1'])
+        self.assertEqual({'physnet1': {'system-id-1', 'system-id-2'},
+                          'physnet2': {'system-id-1'}},
+                         snapshot.physnet_chassis)
+
+    def test_lookups_use_ovn_snapshot(self):
+        """Test lookups are served from the OVN snapshot."""
+        chassis1 = FakeChassis(
+            'chassis-1', 'system-id-1',
+            other_config={'ovn-bridge-mappings': 'physnet1:br-ex'},
+            hostname='host-1')
+        self.mock_ovn_sb.tables['Chassis'].rows.values.return_value = [
+            chassis1]
+        ls = FakeLogicalSwitch('neutron-network-id-1')
+        self.mock_ovn_nb.tables['Logical_Switch'].rows.values\
+            .return_value = [ls]
+        self.manager._ovn_snapshot = l2vni_trunk_manager.OVNSnapshot(
+            self.mock_ovn_nb, self.mock_ovn_sb)
+        self.assertEqual(1, len(self.manager._ovn_snapshot.logical_switches))
+        self.mock_ovn_sb.tables['Chassis'].rows.values.reset_mock()
+        self.mock_ovn_nb.tables['Logical_Switch'].rows.values.reset_mock()
+
+        self.assertEqual(
+            ls,
+            self.manager._get_logical_switch_by_name('neutron-network-id-1'))
+        self.assertIsNone(self.manager._get_logical_switch_by_name('other'))
+        self.assertEqual(
+            {'system-id-1'},
+            self.manager._get_all_chassis_with_physnet('physnet1'))
+        self.assertEqual(
+            set(), self.manager._get_all_chassis_with_physnet('physnet2'))
+        self.assertEqual('host-1',
+                         self.manager._get_chassis_hostname('system-id-1'))
+        self.assertIsNone(self.manager._get_chassis_hostname('other'))
+        self.assertEqual(chassis1,
+                         self.manager._get_chassis_by_name('system-id-1'))
+
+        self.mock_ovn_sb.tables['Chassis'].rows.values.assert_not_called()
+        self.mock_ovn_nb.tables['Logical_Switch'].rows.values\
+            .assert_not_called()
+
+    def test_lldp_lookups_use_ovn_snapshot_port_index(self):
+        """Test LLDP lookups read the Port table once per snapshot."""
+        chassis1 = FakeChassis(
+            'chassis-1', 'system-id-1',
+            other_config={'ovn-bridge-mappings':
+                          'physnet1:br-ex,physnet2:br-data'})
+        chassis2 = FakeChassis(
+            'chassis-2', 'system-id-2',
+            other_config={'ovn-bridge-mappings': 'physnet1:br-ex'})
+        self.mock_ovn_sb.tables['Chassis'].rows.values.return_value = [
+            chassis1, chassis2]
+
+        def _port(chassis, iface_name, switch_id, port_id):
+            port = mock.Mock()
+            port.chassis = chassis
+            port.external_ids = {'lldp_chassis_id': switch_id,
+                                 'lldp_port_id': port_id}
+            iface = mock.Mock()
+            iface.name = iface_name
+            port.interfaces = [iface]
+            return port
+
+        no_lldp = _port(chassis1, 'br-ex-eth2', None, None)
+        self.mock_ovn_sb.tables['Port'].rows.values.return_value = [
+            _port(chassis1, 'br-ex-eth0', 'sw-1', 'Eth1/1'),
+            _port(chassis1, 'br-data-eth1', 'sw-2', 'Eth1/2'),
+            _port(chassis2, 'br-ex-eth0', 'sw-1', 'Eth1/3'),
+            no_lldp]
+        self.manager._ovn_snapshot = l2vni_trunk_manager.OVNSnapshot(
+            self.mock_ovn_nb, self.mock_ovn_sb)
+
+        self.assertEqual(
+            [{'switch_id': 'sw-1', 'port_id': 'Eth1/1', 'switch_info': ''}],
+            self.manager._get_lldp_from_ovn('system-id-1', 'physnet1'))
+        self.assertEqual(
+            [{'switch_id': 'sw-2', 'port_id': 'Eth1/2', 'switch_info': ''}],
+            self.manager._get_lldp_from_ovn('system-id-1', 'physnet2'))
+        self.assertEqual(
+            [{'switch_id': 'sw-1', 'port_id': 'Eth1/3', 'switch_info': ''}],
+            self.manager._get_lldp_from_ovn('system-id-2', 'physnet1'))
+        self.assertIsNone(
+            self.manager._get_lldp_from_ovn('system-id-2', 'physnet2'))
+
+        self.mock_ovn_sb.tables['Port'].rows.values.assert_called_once_with()
+        self.assertEqual(
+            {'system-id-1', 'system-id-2'},
+            set(self.manager._ovn_snapshot.lldp_ports))
+
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_ensure_infrastructure_networks', autospec=True)
+    def test_ovn_snapshot_cleared_after_reconcile(self, mock_ensure_infra):
+        """Test the OVN snapshot only lives for one reconciliation."""
+        mock_ensure_infra.side_effect = Exception("Test error")
+
+        with self.assertLogs(level='ERROR'):
+            self.manager.reconcile()
+
+        self.assertIsNone(self.manager._ovn_snapshot)
+
+    def test_neutron_snapshot(self):
+        """Test the Neutron snapshot lists L2VNI resources once."""
+        trunk = FakeTrunk('trunk-1', 'anchor-1',
+                          name='l2vni-trunk-system-id-1-physnet1')
+        other_trunk = FakeTrunk('trunk-2', 'port-2', name='tenant-trunk')
+        anchor_port = FakePort('anchor-1',
+                               l2vni_trunk_manager.DEVICE_OWNER_L2VNI_ANCHOR)
+        anchor_port.name = 'l2vni-anchor-system-id-1-physnet1'
+        ha_network = FakeNetwork('net-1', name='l2vni-ha-group-group1')
+        anchor_network = FakeNetwork(
+            'net-2', name=CONF.l2vni.l2vni_subport_anchor_network)
+        tenant_network = FakeNetwork('net-3', name='tenant')
+        self.mock_neutron.network.trunks.return_value = [trunk, other_trunk]
+        self.mock_neutron.network.ports.return_value = [anchor_port]
+        self.mock_neutron.network.networks.return_value = [
+            ha_network, anchor_network, tenant_network]
+
+        snapshot = l2vni_trunk_manager.NeutronSnapshot(self.mock_neutron)
+
+        self.assertEqual({trunk.name: trunk}, snapshot.trunks)
+        self.assertEqual({anchor_port.name: anchor_port},
+                         snapshot.anchor_ports)
+        self.assertEqual({ha_network.name: ha_network,
+                          anchor_network.name: anchor_network},
+                         snapshot.networks)
+        # Subports are not listed, they are read from their trunk
+        self.mock_neutron.network.ports.assert_called_once_with(
+            device_owner=l2vni_trunk_manager.DEVICE_OWNER_L2VNI_ANCHOR)
+
+    def test_discover_trunks_uses_neutron_snapshot(self):
+        """Test trunk discovery does not query Neutron per chassis."""
+        chassis1 = FakeChassis(
+            'chassis-1', 'system-id-1',
+            other_config={'ovn-bridge-mappings': 'physnet1:br-ex'})
+        self.mock_ovn_sb.tables['Chassis'].rows.values.return_value = [
+            chassis1]
+        ha_group = FakeHAChassisGroup('group1',
+                                      [FakeHAChassis('system-id-1')])
+        self.mock_ovn_nb.tables['HA_Chassis_Group'].rows.values\
+            .return_value = [ha_group]
+
+        trunk = FakeTrunk('trunk-1', 'anchor-1',
+                          name='l2vni-trunk-system-id-1-physnet1')
+        anchor_port = FakePort(
+            'anchor-1', l2vni_trunk_manager.DEVICE_OWNER_L2VNI_ANCHOR,
+            binding_profile={'local_link_information': [{'port_id': 'p'}]})
+        anchor_port.name = 'l2vni-anchor-system-id-1-physnet1'
+        self.mock_neutron.network.trunks.return_value = [trunk]
+        self.mock_neutron.network.ports.return_value = [anchor_port]
+        self.manager._neutron_snapshot = l2vni_trunk_manager.NeutronSnapshot(
+            self.mock_neutron)
+        self.mock_neutron.reset_mock()
+
+        result = self.manager._discover_trunks()
+
+        self.assertEqual({('system-id-1', 'physnet1'): 'trunk-1'}, result)
+        self.mock_neutron.network.trunks.assert_not_called()
+        self.mock_neutron.network.ports.assert_not_called()
+        self.mock_neutron.network.create_trunk.assert_not_called()
+
+    def test_find_or_create_trunk_adds_to_neutron_snapshot(self):
+        """Test created trunks are found later in the same cycle."""
+        self.manager._neutron_snapshot = l2vni_trunk_manager.NeutronSnapshot(
+            self.mock_neutron)
+        self.mock_neutron.network.create_trunk.return_value = FakeTrunk(
+            'trunk-1', 'anchor-1')
+
+        with mock.patch.object(self.manager, '_find_or_create_anchor_port',
+                               autospec=True, return_value='anchor-1'):
+            self.assertEqual('trunk-1', self.manager._find_or_create_trunk(
+                'system-id-1', 'physnet1'))
+            self.assertEqual('trunk-1', self.manager._find_or_create_trunk(
+                'system-id-1', 'physnet1'))
+
+        self.mock_neutron.network.create_trunk.assert_called_once()
+        self.assertIn('l2vni-trunk-system-id-1-physnet1',
+                      self.manager._neutron_snapshot.trunks)
+
+    def test_desired_state(self):
+        """Test the desired state is only reused when tracked and fresh."""
+        state = l2vni_trunk_manager.DesiredState()
+        required_vlans = {('system-1', 'physnet1'): {100: {}}}
+        state.update(required_vlans, state.generation)
+        self.assertIsNone(state.get())
+        self.assertEqual(frozenset([100]),
+                         state.digest(('system-1', 'physnet1')))
+        self.assertEqual(frozenset(), state.digest(('system-2', 'physnet1')))
+
+        state.tracked = True
+        self.assertIs(required_vlans, state.get())
+
+        CONF.set_override('l2vni_desired_state_max_age', 0, group='l2vni')
+        self.assertIsNone(state.get())
+        CONF.set_override('l2vni_desired_state_max_age', 60, group='l2vni')
+        with mock.patch.object(time, 'monotonic', autospec=True,
+                               return_value=time.monotonic() + 61):
+            self.assertIsNone(state.get())
+
+        state.invalidate('test')
+        self.assertIsNone(state.get())
+        self.assertIsNone(state.digest(('system-1', 'physnet1')))
+
+    def test_desired_state_invalidated_while_computed(self):
+        """Test required VLANs computed before an invalidation are dropped."""
+        state = l2vni_trunk_manager.DesiredState()
+        state.tracked = True
+        generation = state.generation
+        state.invalidate('test')
+
+        state.update({('system-1', 'physnet1'): {100: {}}}, generation)
+
+        self.assertIsNone(state.get())
+
+    def test_desired_state_changed_while_computed(self):
+        """Test required VLANs computed before a targeted change are dropped.
+
+        The computed VLANs may not include the change.
+        """
+        state = l2vni_trunk_manager.DesiredState()
+        state.tracked = True
+        generation = state.generation
+        state.add_vlan([('system-1', 'physnet1')], 200, {})
+
+        state.update({('system-1', 'physnet1'): {100: {}}}, generation)
+
+        self.assertIsNone(state.get())
+
+    def test_desired_state_add_and_remove_vlan(self):
+        """Test localnet port events update the desired state."""
+        state = l2vni_trunk_manager.DesiredState()
+        state.update({('system-1', 'physnet1'): {100: {}},
+                      ('system-1', 'physnet2'): {200: {}}}, state.generation)
+
+        state.add_vlan([('system-1', 'physnet1'), ('system-2', 'physnet1')],
+                       300, {'vni': 5000, 'segment_id': 'segment-300'})
+        self.assertEqual(frozenset([100, 300]),
+                         state.digest(('system-1', 'physnet1')))
+        self.assertEqual(frozenset([300]),
+                         state.digest(('system-2', 'physnet1')))
+
+        state.remove_vlan('physnet1', 100)
+        self.assertEqual(frozenset([300]),
+                         state.digest(('system-1', 'physnet1')))
+        self.assertEqual(frozenset([200]),
+                         state.digest(('system-1', 'physnet2')))
+
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_cleanup_unused_infrastructure', autospec=True)
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_reconcile_subports', autospec=True)
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_calculate_required_vlans', autospec=True)
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_discover_trunks', autospec=True)
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_ensure_infrastructure_networks', autospec=True)
+    def test_reconcile_reuses_desired_state(
+            self, mock_ensure_infra, mock_discover, mock_calculate,
+            mock_reconcile_subports, mock_cleanup):
+        """Test required VLANs are computed again only once invalidated."""
+        required_vlans = {('system-1', 'physnet1'): {100: {}}}
+        mock_discover.return_value = {}
+        mock_calculate.return_value = required_vlans
+        self.manager.desired_state.tracked = True
+
+        self.manager.reconcile()
+        self.manager.reconcile()
+        mock_calculate.assert_called_once_with(self.manager)
+        mock_reconcile_subports.assert_called_with(
+            self.manager, {}, required_vlans)
+
+        self.manager.desired_state.invalidate('test')
+        self.manager.reconcile()
+        self.assertEqual(2, mock_calculate.call_count)
+
+    def test_reconcile_subports_skips_trunks_in_sync(self):
+        """Test only trunks not matching the desired digest are diffed."""
+        in_sync = FakeTrunk('trunk-1', 'anchor-1', sub_ports=[
+            {'port_id': 'p1', 'segmentation_id': 100,
+             'segmentation_type': 'vlan'}])
+        out_of_sync = FakeTrunk('trunk-2', 'anchor-2', sub_ports=[])
+        self.manager._trunk_cache = {'trunk-1': in_sync,
+                                     'trunk-2': out_of_sync}
+        required_vlans = {('system-1', 'physnet1'): {100: {}},
+                          ('system-2', 'physnet1'): {100: {}}}
+        self.manager.desired_state.update(
+            required_vlans, self.manager.desired_state.generation)
+        trunk_map = {('system-1', 'physnet1'): 'trunk-1',
+                     ('system-2', 'physnet1'): 'trunk-2'}
+
+        with (
+            mock.patch.object(self.manager, '_get_subport_anchor_network_id',
+                              autospec=True, return_value='anchor-net-id'),
+            mock.patch.object(self.manager, '_reconcile_trunk_subports',
+                              autospec=True) as mock_reconcile_trunk
+        ):
+            self.manager._reconcile_subports(trunk_map, required_vlans)
+
+        mock_reconcile_trunk.assert_called_once_with(
+            'trunk-2', 'system-2', 'physnet1', {100: {}}, 'anchor-net-id')
+
 
 class TestL2VNITrunkManagerEdgeCases(tests_base.BaseTestCase):
     """Test edge cases and error handling."""
@@ -2052,6 +3005,65 @@ class TestL2VNITrunkManagerEdgeCases(tests_base.BaseTestCase):
         self.assertIsNone(vni)
         self.assertIsNone(segment_id)
 
+    def _set_logical_switch_revision(self, network_id, revision):
+        ls = FakeLogicalSwitch(
+            f'neutron-{network_id}',
+            external_ids={'neutron:revision_number': revision})
+        self.mock_ovn_nb.tables['Logical_Switch'].rows.values\
+            .return_value = [ls]
+
+    def test_get_networks_with_segments_filters_and_caches(self):
+        """Test segments are filtered by type and cached with revisions."""
+        self._set_logical_switch_revision('network-id-1', '7')
+        vlan_segment = FakeSegment('network-id-1', n_const.TYPE_VLAN, 100,
+                                   'physnet1', segment_id='seg-vlan-100')
+        self.mock_neutron.network.segments.return_value = [vlan_segment]
+
+        networks = self.manager._get_networks_with_segments()
+
+        self.mock_neutron.network.segments.assert_called_once_with(
+            network_type=[n_const.TYPE_VLAN, n_const.TYPE_VXLAN,
+                          n_const.TYPE_GENEVE])
+        self.assertEqual([vlan_segment],
+                         networks['network-id-1']['vlan_segments'])
+        self.assertEqual('7',
+                         self.manager._segment_cache['network-id-1'][
+                             'revision'])
+
+        # Events for the network are served from the cache
+        self.mock_neutron.network.segments.reset_mock()
+        vni, segment_id = self.manager._get_vni_and_segment_for_network(
+            'network-id-1', 'physnet1', 100)
+
+        self.assertIsNone(vni)
+        self.assertEqual('seg-vlan-100', segment_id)
+        self.mock_neutron.network.segments.assert_not_called()
+
+    def test_get_vni_and_segment_for_network_revision_changed(self):
+        """Test segments are fetched again when the network changed."""
+        self._set_logical_switch_revision('network-id-1', '8')
+        self.manager._segment_cache = {
+            'network-id-1': {'revision': '7', 'vlan_segments': [],
+                             'vni_segments': []}}
+        vlan_segment = FakeSegment('network-id-1', n_const.TYPE_VLAN, 100,
+                                   'physnet1', segment_id='seg-vlan-100')
+        vxlan_segment = FakeSegment('network-id-1', n_const.TYPE_VXLAN, 5000,
+                                    None)
+        self.mock_neutron.network.segments.return_value = [vlan_segment,
+                                                           vxlan_segment]
+
+        vni, segment_id = self.manager._get_vni_and_segment_for_network(
+            'network-id-1', 'physnet1', 100)
+
+        self.assertEqual(5000, vni)
+        self.assertEqual('seg-vlan-100', segment_id)
+        self.mock_neutron.network.segments.assert_called_once_with(
+            network_id='network-id-1',
+            network_type=[n_const.TYPE_VLAN, n_const.TYPE_VXLAN,
+                          n_const.TYPE_GENEVE])
+        self.assertEqual('8', self.manager._segment_cache['network-id-1'][
+            'revision'])
+
     def test_reconcile_trunk_subports_skips_when_segment_id_missing(self):
         """Test subport creation is skipped when segment_id is missing."""
         trunk_id = 'trunk-id'
@@ -2072,6 +3084,63 @@ class TestL2VNITrunkManagerEdgeCases(tests_base.BaseTestCase):
         # Should NOT create port when segment_id is missing
         self.mock_neutron.network.create_port.assert_not_called()
 
+    def test_reconcile_trunk_subports_uses_listed_trunk(self):
+        """Test the trunk listed during discovery is not fetched again."""
+        trunk = FakeTrunk('trunk-id', 'anchor-port-id', sub_ports=[
+            {'port_id': 'subport-1', 'segmentation_id': 100}])
+        self.manager._trunk_cache = {'trunk-id': trunk}
+
+        self.manager._reconcile_trunk_subports(
+            'trunk-id', 'system-1', 'physnet1',
+            {100: {'vni': 5000, 'segment_id': 'segment-id-100'}},
+            'anchor-net-id')
+
+        self.mock_neutron.network.get_trunk.assert_not_called()
+        self.mock_neutron.network.create_port.assert_not_called()
+        self.mock_neutron.network.delete_trunk_subports.assert_not_called()
+
+    def test_reconcile_trunk_subports_refetches_changed_trunk(self):
+        """Test a failed change re-fetches a trunk changed meanwhile."""
+        trunk = FakeTrunk('trunk-id', 'anchor-port-id', sub_ports=[])
+        trunk.revision_number = 1
+        current_trunk = FakeTrunk('trunk-id', 'anchor-port-id', sub_ports=[
+            {'port_id': 'subport-1', 'segmentation_id': 100}])
+        current_trunk.revision_number = 2
+        self.manager._trunk_cache = {'trunk-id': trunk}
+        self.mock_neutron.network.get_trunk.return_value = current_trunk
+        self.mock_neutron.network.create_port.return_value = FakePort(
+            'new-port-id', l2vni_trunk_manager.DEVICE_OWNER_L2VNI_SUBPORT)
+        self.mock_neutron.network.add_trunk_subports.side_effect = (
+            sdkexc.ConflictException())
+
+        self.manager._reconcile_trunk_subports(
+            'trunk-id', 'system-1', 'physnet1',
+            {100: {'vni': 5000, 'segment_id': 'segment-id-100'}},
+            'anchor-net-id')
+
+        self.mock_neutron.network.get_trunk.assert_called_once_with(
+            'trunk-id')
+        # The VLAN was added meanwhile, nothing left to add on retry
+        self.mock_neutron.network.create_port.assert_called_once()
+
+    def test_reconcile_trunk_subports_no_retry_unchanged_trunk(self):
+        """Test a failed change is not retried on an unchanged trunk."""
+        trunk = FakeTrunk('trunk-id', 'anchor-port-id', sub_ports=[])
+        trunk.revision_number = 1
+        self.manager._trunk_cache = {'trunk-id': trunk}
+        self.mock_neutron.network.get_trunk.return_value = trunk
+        self.mock_neutron.network.create_port.side_effect = (
+            sdkexc.SDKException())
+
+        self.manager._reconcile_trunk_subports(
+            'trunk-id', 'system-1', 'physnet1',
+            {100: {'vni': 5000, 'segment_id': 'segment-id-100'}},
+            'anchor-net-id')
+
+        self.mock_neutron.network.get_trunk.assert_called_once_with(
+            'trunk-id')
+        self.mock_neutron.network.create_port.assert_called_once()
+
 
 class TestL2VNITrunkManagerTargetedReconciliation(tests_base.BaseTestCase):
     """Tests for targeted single-VLAN reconciliation."""
@@ -2184,6 +3253,47 @@ class TestL2VNITrunkManagerTargetedReconciliation(tests_base.BaseTestCase):
         mock_remove_subport.assert_called_once_with(
             manager, 'trunk-1', 'chassis-1', 'physnet1', 200)
 
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_ensure_infrastructure_networks', autospec=True)
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_get_subport_anchor_network_id', autospec=True)
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_get_all_chassis_with_physnet', autospec=True)
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_find_or_create_trunk', autospec=True)
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_ensure_single_subport', autospec=True)
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_remove_single_subport', autospec=True)
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_get_vni_and_segment_for_network', autospec=True)
+    def test_reconcile_single_vlan_updates_desired_state(
+            self, mock_get_vni_segment, mock_remove_subport,
+            mock_ensure_subport, mock_find_trunk, mock_get_chassis,
+            mock_get_anchor, mock_ensure_infra):
+        """Test targeted reconciliation keeps the desired state current."""
+        manager = self._create_manager()
+        manager.desired_state.tracked = True
+        manager.desired_state.update({('chassis-1', 'physnet1'): {200: {}}},
+                                     manager.desired_state.generation)
+        mock_get_anchor.return_value = 'anchor-net-id'
+        mock_get_chassis.return_value = {'chassis-1', 'chassis-2'}
+        mock_get_vni_segment.return_value = (5000, 'segment-id-1')
+        mock_find_trunk.return_value = 'trunk-1'
+
+        manager.reconcile_single_vlan('net-1', 'physnet1', 100, action='add')
+        manager.reconcile_single_vlan('net-2', 'physnet1', 200,
+                                      action='remove')
+
+        # The infrastructure was verified by the last full reconciliation
+        mock_ensure_infra.assert_not_called()
+        self.assertEqual(
+            {('chassis-1', 'physnet1'): {
+                100: {'vni': 5000, 'segment_id': 'segment-id-1'}},
+             ('chassis-2', 'physnet1'): {
+                100: {'vni': 5000, 'segment_id': 'segment-id-1'}}},
+            manager.desired_state.get())
+
     @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
                        '_ensure_infrastructure_networks', autospec=True)
     @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
@@ -2337,7 +3447,7 @@ class TestL2VNITrunkManagerTargetedReconciliation(tests_base.BaseTestCase):
         mock_add.assert_not_called()
 
     @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
-                       '_remove_subport', autospec=True)
+                       '_remove_subports', autospec=True)
     def test_remove_single_subport_removes_when_exists(self, mock_remove):
         """Test _remove_single_subport removes existing subport."""
         manager = self._create_manager()
@@ -2352,10 +3462,10 @@ class TestL2VNITrunkManagerTargetedReconciliation(tests_base.BaseTestCase):
         manager._remove_single_subport('trunk-1', 'chassis-1', 'physnet1', 100)
 
         mock_remove.assert_called_once_with(
-            manager, 'trunk-1', 'port-1', 'chassis-1', 'physnet1', 100)
+            manager, 'trunk-1', [('port-1', 100)])
 
     @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
-                       '_remove_subport', autospec=True)
+                       '_remove_subports', autospec=True)
     def test_remove_single_subport_skips_if_not_exists(self, mock_remove):
         """Test _remove_single_subport is idempotent."""
         manager = self._create_manager()
@@ -2369,3 +3479,110 @@ class TestL2VNITrunkManagerTargetedReconciliation(tests_base.BaseTestCase):
         manager._remove_single_subport('trunk-1', 'chassis-1', 'physnet1', 200)
 
         mock_remove.assert_not_called()
+
+    @mock.patch.object(l2vni_trunk_manager, 'OVNSnapshot', autospec=True)
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_build_chassis_cache', autospec=True)
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_ensure_infrastructure_networks', autospec=True)
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_get_subport_anchor_network_id', autospec=True)
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_get_all_chassis_with_physnet', autospec=True)
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_find_or_create_trunk', autospec=True)
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_ensure_subports', autospec=True)
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_remove_vlans', autospec=True)
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_get_vni_and_segment_for_network', autospec=True)
+    def test_reconcile_vlans_batches_changes(
+            self, mock_get_vni_segment, mock_remove_vlans,
+            mock_ensure_subports, mock_find_trunk, mock_get_chassis,
+            mock_get_anchor, mock_ensure_infra, mock_chassis_cache,
+            mock_snapshot):
+        """Test coalesced VLAN changes share one snapshot and trunk lookup."""
+        manager = self._create_manager()
+        manager.desired_state.tracked = True
+        manager.desired_state.update({('chassis-1', 'physnet1'): {300: {}}},
+                                     manager.desired_state.generation)
+        mock_get_anchor.return_value = 'anchor-net-id'
+        mock_get_chassis.return_value = {'chassis-1'}
+        mock_find_trunk.return_value = 'trunk-1'
+        mock_get_vni_segment.side_effect = [
+            (5000, 'segment-id-1'), (None, None)]
+        actions = []
+        mock_remove_vlans.side_effect = (
+            lambda *args: actions.append('remove'))
+        mock_ensure_subports.side_effect = (
+            lambda *args: actions.append('add'))
+
+        manager.reconcile_vlans({
+            ('physnet1', 'add'): {100: 'net-1', 200: 'net-2'},
+            ('physnet1', 'remove'): {300: 'net-3'}})
+
+        mock_snapshot.assert_called_once_with(
+            manager.ovn_nb_idl, manager.ovn_sb_idl)
+        mock_chassis_cache.assert_called_once_with(manager)
+        # The desired state was computed, the networks were verified
+        mock_ensure_infra.assert_not_called()
+        mock_get_anchor.assert_called_once_with(manager)
+        self.assertEqual(2, mock_find_trunk.call_count)
+        # VLAN 200 has no segment and is skipped
+        mock_ensure_subports.assert_called_once_with(
+            manager, 'trunk-1', 'chassis-1', 'physnet1',
+            {100: {'vni': 5000, 'segment_id': 'segment-id-1'}},
+            'anchor-net-id')
+        mock_remove_vlans.assert_called_once_with(manager, 'trunk-1', {300})
+        # Removals are reconciled before additions
+        self.assertEqual(['remove', 'add'], actions)
+        # The periodic reconciliation leaves the changed trunk alone
+        self.assertTrue(manager.trunk_locks.changed_since(
+            ('chassis-1', 'physnet1'), 0))
+        self.assertEqual(
+            {('chassis-1', 'physnet1'): {
+                100: {'vni': 5000, 'segment_id': 'segment-id-1'}}},
+            manager.desired_state.get())
+        self.assertIsNone(manager._ovn_snapshot)
+
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_add_subports', autospec=True)
+    def test_ensure_subports_adds_missing_in_batch(self, mock_add):
+        """Test _ensure_subports adds the missing subports together."""
+        manager = self._create_manager()
+
+        trunk = mock.Mock()
+        trunk.sub_ports = [{'port_id': 'port-1', 'segmentation_id': 100}]
+        manager.neutron.network.get_trunk.return_value = trunk
+
+        manager._ensure_subports(
+            'trunk-1', 'chassis-1', 'physnet1',
+            {300: {'vni': 5300, 'segment_id': 'segment-3'},
+             100: {'vni': 5100, 'segment_id': 'segment-1'},
+             200: {'vni': None, 'segment_id': 'segment-2'}},
+            'anchor-net-id')
+
+        mock_add.assert_called_once_with(
+            manager, 'trunk-1', 'chassis-1', 'physnet1',
+            [(200, 'segment-2', None), (300, 'segment-3', 5300)],
+            'anchor-net-id')
+
+    @mock.patch.object(l2vni_trunk_manager.L2VNITrunkManager,
+                       '_remove_subports', autospec=True)
+    def test_remove_vlans_removes_existing_together(self, mock_remove):
+        """Test _remove_vlans removes the existing subports together."""
+        manager = self._create_manager()
+
+        trunk = mock.Mock()
+        trunk.sub_ports = [
+            {'port_id': 'port-3', 'segmentation_id': 300},
+            {'port_id': 'port-1', 'segmentation_id': 100},
+            {'port_id': 'port-2', 'segmentation_id': 200}
+        ]
+        manager.neutron.network.get_trunk.return_value = trunk
+
+        manager._remove_vlans('trunk-1', {100, 300, 400})
+
+        mock_remove.assert_called_once_with(
+            manager, 'trunk-1', [('port-1', 100), ('port-3', 300)])
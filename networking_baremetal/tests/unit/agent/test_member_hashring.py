@@ -0,0 +1,97 @@
+# Copyright (c) 2026 Red Hat, Inc.
+# All Rights Reserved
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest import mock
+
+from oslotest import base
+from tooz import hashring
+
+from networking_baremetal.agent import member_hashring
+
+
+class TestMemberHashRing(base.BaseTestCase):
+    """Test cases for the member hash ring."""
+
+    def test_lookup(self):
+        ring = member_hashring.MemberHashRing(['agent-1', 'agent-2'])
+        expected = hashring.HashRing(['agent-1', 'agent-2'])
+        for key in (b'node-1', b'node-2', b'node-3'):
+            self.assertEqual(expected[key], ring[key])
+
+    def test_update(self):
+        ring = member_hashring.MemberHashRing(['agent-1', 'agent-2'])
+        self.assertTrue(ring.update(add=['agent-3', 'agent-4'],
+                                    remove=['agent-1']))
+        self.assertEqual({'agent-2', 'agent-3', 'agent-4'}, ring.nodes)
+
+    @mock.patch.object(member_hashring.hashring, 'HashRing',
+                       autospec=True)
+    def test_update_rebuilds_once(self, mock_hashring):
+        mock_hashring.return_value.nodes = {}
+        ring = member_hashring.MemberHashRing()
+        mock_hashring.reset_mock()
+
+        ring.update(add=['agent-1', 'agent-2', 'agent-3'])
+        mock_hashring.assert_called_once_with(
+            {'agent-1', 'agent-2', 'agent-3'})
+
+    def test_update_no_change(self):
+        ring = member_hashring.MemberHashRing(['agent-1'])
+        previous = ring._state
+        self.assertFalse(ring.update(add=['agent-1'], remove=['agent-2']))
+        self.assertIs(previous, ring._state)
+        self.assertEqual(0, ring.version)
+
+    def test_ownership_cache(self):
+        ring = member_hashring.MemberHashRing(['agent-1', 'agent-2'])
+        owners = ring[b'node-1']
+        self.assertEqual(owners, ring[b'node-1'])
+        self.assertEqual({'version': 0, 'cached_keys': 1, 'hits': 1,
+                          'misses': 1, 'hit_rate': 0.5}, ring.get_stats())
+
+    def test_ownership_cache_invalidated_on_update(self):
+        ring = member_hashring.MemberHashRing(['agent-1'])
+        self.assertEqual({'agent-1'}, ring[b'node-1'])
+        ring.update(add=['agent-2'], remove=['agent-1'])
+        self.assertEqual(1, ring.version)
+        self.assertEqual({'agent-2'}, ring[b'node-1'])
+        self.assertEqual(2, ring.get_stats()['misses'])
+
+    def test_listeners(self):
+        ring = member_hashring.MemberHashRing(['agent-1'])
+        listener = mock.Mock()
+        ring.add_listener(listener)
+        old_ring = ring._state.ring
+
+        ring.update(add=['agent-2'])
+        listener.assert_called_once_with(old_ring, ring._state.ring)
+
+        listener.reset_mock()
+        ring.update(add=['agent-2'])
+        listener.assert_not_called()
+
+        ring.remove_listener(listener)
+        ring.update(remove=['agent-2'])
+        listener.assert_not_called()
+
+    def test_listener_failure(self):
+        ring = member_hashring.MemberHashRing(['agent-1'])
+        failing = mock.Mock(side_effect=Exception)
+        listener = mock.Mock()
+        ring.add_listener(failing)
+        ring.add_listener(listener)
+
+        self.assertTrue(ring.update(add=['agent-2']))
+        listener.assert_called_once_with(mock.ANY, mock.ANY)
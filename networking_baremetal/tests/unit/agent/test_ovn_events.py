@@ -33,6 +33,9 @@ class TestLocalnetPortEvent(tests_base.BaseTestCase):
         # Create mock agent with required attributes
         self.mock_agent = mock.MagicMock()
         self.mock_agent.agent_id = 'test-agent-id'
+        # Handle the events inline instead of in an OVN event worker
+        self.mock_agent._submit_ovn_event.side_effect = (
+            lambda func, *args: func(*args))
 
         # Create mock member manager with hash ring
         self.mock_member_manager = mock.MagicMock()
@@ -175,7 +178,7 @@ class TestLocalnetPortEvent(tests_base.BaseTestCase):
         self.event.run(row_event.RowEvent.ROW_CREATE, row, None)
 
         # Verify targeted reconciliation was triggered
-        mock_reconcile = self.mock_agent._reconcile_single_vlan_blocking
+        mock_reconcile = self.mock_agent._queue_l2vni_vlan_change
         mock_reconcile.assert_called_once_with(
             network_id, 'physnet1', 105, 'add'
         )
@@ -193,7 +196,7 @@ class TestLocalnetPortEvent(tests_base.BaseTestCase):
         self.event.run(row_event.RowEvent.ROW_DELETE, row, None)
 
         # Verify targeted reconciliation was triggered with 'remove' action
-        mock_reconcile = self.mock_agent._reconcile_single_vlan_blocking
+        mock_reconcile = self.mock_agent._queue_l2vni_vlan_change
         mock_reconcile.assert_called_once_with(
             network_id, 'physnet1', 105, 'remove'
         )
@@ -212,7 +215,7 @@ class TestLocalnetPortEvent(tests_base.BaseTestCase):
 
         # Should fall back to full reconciliation
         self.mock_agent._reconcile_l2vni_trunks.assert_called_once()
-        self.mock_agent._reconcile_single_vlan_blocking.assert_not_called()
+        self.mock_agent._queue_l2vni_vlan_change.assert_not_called()
 
     def test_run_falls_back_to_full_reconciliation_on_missing_physnet(self):
         """Test run() falls back to full reconciliation if physnet missing."""
@@ -228,7 +231,7 @@ class TestLocalnetPortEvent(tests_base.BaseTestCase):
 
         # Should fall back to full reconciliation
         self.mock_agent._reconcile_l2vni_trunks.assert_called_once()
-        self.mock_agent._reconcile_single_vlan_blocking.assert_not_called()
+        self.mock_agent._queue_l2vni_vlan_change.assert_not_called()
 
     def test_run_handles_attribute_error_gracefully(self):
         """Test run() handles AttributeError.
@@ -283,3 +286,128 @@ class TestLocalnetPortEvent(tests_base.BaseTestCase):
         result = self.event._extract_network_id(port_name)
         # Returns empty string (after replacing 'neutron-' from 'neutron-')
         self.assertEqual(result, '')
+
+
+class TestL2VNIDesiredStateEvents(tests_base.BaseTestCase):
+    """Test cases for the events invalidating the L2VNI desired state."""
+
+    def setUp(self):
+        super().setUp()
+        self.trunk_manager = mock.MagicMock()
+        self.desired_state = self.trunk_manager.desired_state
+
+    def _row(self, table, **kwargs):
+        row = mock.Mock(spec=['_table', 'name'] + list(kwargs))
+        row._table.name = table
+        row.name = 'row-name'
+        for key, value in kwargs.items():
+            setattr(row, key, value)
+        return row
+
+    def test_router_port_ha_chassis_group_update(self):
+        event = ovn_events.L2VNIRouterPortEvent(self.trunk_manager)
+        row = self._row('Logical_Router_Port', ha_chassis_group=['group'])
+        old = self._row('Logical_Router_Port', ha_chassis_group=[])
+
+        self.assertTrue(event.matches(event.ROW_UPDATE, row, old))
+        event.run(event.ROW_UPDATE, row, old)
+        self.desired_state.invalidate.assert_called_once_with(mock.ANY)
+
+    def test_router_port_other_update_ignored(self):
+        event = ovn_events.L2VNIRouterPortEvent(self.trunk_manager)
+        row = self._row('Logical_Router_Port', ha_chassis_group=['group'],
+                        networks=['10.0.0.1/24'])
+        old = self._row('Logical_Router_Port', networks=[])
+
+        self.assertFalse(event.matches(event.ROW_UPDATE, row, old))
+
+    def test_router_port_create_without_ha_chassis_ignored(self):
+        event = ovn_events.L2VNIRouterPortEvent(self.trunk_manager)
+        row = self._row('Logical_Router_Port', ha_chassis_group=[],
+                        gateway_chassis=[])
+
+        self.assertFalse(event.matches(event.ROW_CREATE, row))
+
+    def test_router_port_delete_with_gateway_chassis(self):
+        event = ovn_events.L2VNIRouterPortEvent(self.trunk_manager)
+        row = self._row('Logical_Router_Port', ha_chassis_group=[],
+                        gateway_chassis=['gw-chassis'])
+
+        self.assertTrue(event.matches(event.ROW_DELETE, row))
+
+    def test_ha_chassis_group_members_update(self):
+        event = ovn_events.L2VNIHAChassisGroupEvent(self.trunk_manager)
+        row = self._row('HA_Chassis_Group', ha_chassis=['ha-1', 'ha-2'])
+        old = self._row('HA_Chassis_Group', ha_chassis=['ha-1'])
+
+        self.assertTrue(event.matches(event.ROW_UPDATE, row, old))
+        event.run(event.ROW_UPDATE, row, old)
+        self.desired_state.invalidate.assert_called_once_with(mock.ANY)
+
+    def test_ha_chassis_group_other_update_ignored(self):
+        event = ovn_events.L2VNIHAChassisGroupEvent(self.trunk_manager)
+        row = self._row('HA_Chassis_Group', ha_chassis=['ha-1'],
+                        external_ids={'key': 'value'})
+        old = self._row('HA_Chassis_Group', external_ids={})
+
+        self.assertFalse(event.matches(event.ROW_UPDATE, row, old))
+
+    def test_ha_chassis_group_create_without_chassis_ignored(self):
+        event = ovn_events.L2VNIHAChassisGroupEvent(self.trunk_manager)
+        row = self._row('HA_Chassis_Group', ha_chassis=[])
+
+        self.assertFalse(event.matches(event.ROW_CREATE, row))
+        self.assertTrue(event.matches(
+            event.ROW_DELETE,
+            self._row('HA_Chassis_Group', ha_chassis=['ha-1'])))
+
+    def test_ha_chassis_delete(self):
+        event = ovn_events.L2VNIHAChassisEvent(self.trunk_manager)
+        row = self._row('HA_Chassis', chassis_name='chassis-1', priority=1)
+
+        self.assertTrue(event.matches(event.ROW_DELETE, row))
+        event.run(event.ROW_DELETE, row, None)
+        self.desired_state.invalidate.assert_called_once_with(mock.ANY)
+
+    def test_ha_chassis_priority_update_ignored(self):
+        event = ovn_events.L2VNIHAChassisEvent(self.trunk_manager)
+        row = self._row('HA_Chassis', chassis_name='chassis-1', priority=2)
+        old = self._row('HA_Chassis', priority=1)
+
+        self.assertFalse(event.matches(event.ROW_UPDATE, row, old))
+
+    def test_gateway_chassis_name_update(self):
+        event = ovn_events.L2VNIGatewayChassisEvent(self.trunk_manager)
+        row = self._row('Gateway_Chassis', chassis_name='chassis-2')
+        old = self._row('Gateway_Chassis', chassis_name='chassis-1')
+
+        self.assertEqual('Gateway_Chassis', event.table)
+        self.assertTrue(event.matches(event.ROW_UPDATE, row, old))
+
+    def test_chassis_bridge_mappings_update(self):
+        event = ovn_events.L2VNIChassisEvent(self.trunk_manager)
+        row = self._row('Chassis', other_config={
+            'ovn-bridge-mappings': 'physnet1:br-ex,physnet2:br-p2'})
+        old = self._row('Chassis', other_config={
+            'ovn-bridge-mappings': 'physnet1:br-ex'})
+
+        self.assertTrue(event.matches(event.ROW_UPDATE, row, old))
+        event.run(event.ROW_UPDATE, row, old)
+        self.desired_state.invalidate.assert_called_once_with(mock.ANY)
+
+    def test_chassis_other_update_ignored(self):
+        event = ovn_events.L2VNIChassisEvent(self.trunk_manager)
+        row = self._row('Chassis', other_config={
+            'ovn-bridge-mappings': 'physnet1:br-ex', 'other': 'new'})
+        old = self._row('Chassis', other_config={
+            'ovn-bridge-mappings': 'physnet1:br-ex'})
+
+        self.assertFalse(event.matches(event.ROW_UPDATE, row, old))
+        self.assertFalse(event.matches(
+            event.ROW_UPDATE, row, self._row('Chassis', nb_cfg=1)))
+
+    def test_chassis_create(self):
+        event = ovn_events.L2VNIChassisEvent(self.trunk_manager)
+        row = self._row('Chassis', other_config={})
+
+        self.assertTrue(event.matches(event.ROW_CREATE, row))
@@ -0,0 +1,56 @@
+# Copyright (c) 2026 Red Hat, Inc.
+# All Rights Reserved
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest import mock
+
+from oslotest import base
+
+from networking_baremetal.agent import rate_limiter
+
+
+@mock.patch.object(rate_limiter.time, 'sleep', autospec=True)
+@mock.patch.object(rate_limiter.time, 'monotonic', autospec=True)
+class TestTokenBucket(base.BaseTestCase):
+    """Test cases for the token bucket rate limiter."""
+
+    def test_invalid_rate(self, mock_monotonic, mock_sleep):
+        self.assertRaises(ValueError, rate_limiter.TokenBucket, 0)
+
+    def test_consume_burst(self, mock_monotonic, mock_sleep):
+        mock_monotonic.return_value = 100.0
+        bucket = rate_limiter.TokenBucket(rate=5)
+
+        for _ in range(5):
+            self.assertEqual(0, bucket.consume())
+        mock_sleep.assert_not_called()
+
+    def test_consume_waits_for_token(self, mock_monotonic, mock_sleep):
+        mock_monotonic.side_effect = [100.0, 100.0, 100.0, 100.0, 100.5]
+        bucket = rate_limiter.TokenBucket(rate=2)
+
+        bucket.consume()
+        bucket.consume()
+        # The bucket is empty, the next token is added after 0.5 seconds
+        self.assertEqual(0.5, bucket.consume())
+        mock_sleep.assert_called_once_with(0.5)
+
+    def test_refill_capped_at_capacity(self, mock_monotonic, mock_sleep):
+        mock_monotonic.side_effect = [100.0, 1000.0, 1000.0, 1000.0, 1001.0]
+        bucket = rate_limiter.TokenBucket(rate=1, capacity=2)
+
+        bucket.consume()
+        bucket.consume()
+        self.assertEqual(1, bucket.consume())
+        mock_sleep.assert_called_once_with(1.0)
@@ -1029,9 +1029,12 @@ class TestHAChassisGroupNetworkEvent(tests_base.BaseTestCase):
         from ovsdbapp.backend.ovs_idl import event as row_event
         self.event.run(row_event.RowEvent.ROW_CREATE, row, None)
 
+        # The binding is handled by an OVN event worker
         mock_bind = (self.mock_router_ha_binding.
                      bind_router_interfaces_for_network)
-        mock_bind.assert_called_once_with(network_id, ha_group_uuid)
+        self.mock_agent._submit_ovn_event.assert_called_once_with(
+            mock_bind, network_id, ha_group_uuid)
+        mock_bind.assert_not_called()
 
     def test_run_handles_missing_router_ha_binding_manager(self):
         """Test run() handles missing router HA binding manager."""
@@ -0,0 +1,75 @@
+# Copyright (c) 2026 Red Hat, Inc.
+# All Rights Reserved
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from oslotest import base
+
+from networking_baremetal.agent import state_snapshot
+
+
+class TestStateSnapshot(base.BaseTestCase):
+    """Test cases for the agent state snapshot."""
+
+    def setUp(self):
+        super(TestStateSnapshot, self).setUp()
+        self.tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tempdir)
+        self.path = os.path.join(self.tempdir, 'snapshot.json')
+
+    def test_save_and_load(self):
+        reported_nodes = {'node-1': 'digest-1', 'node-2': 'digest-2'}
+        self.assertTrue(state_snapshot.save(
+            self.path, 'agent-id', 'host', reported_nodes))
+        self.assertEqual({'agent_id': 'agent-id', 'host': 'host',
+                          'reported_nodes': reported_nodes},
+                         state_snapshot.load(self.path))
+        # No temporary file is left behind
+        self.assertEqual(['snapshot.json'], os.listdir(self.tempdir))
+
+    def test_load_missing(self):
+        self.assertIsNone(state_snapshot.load(self.path))
+
+    def test_load_corrupt(self):
+        with open(self.path, 'w') as f:
+            f.write('{"version": 1, "agent_')
+        self.assertIsNone(state_snapshot.load(self.path))
+
+    def test_load_unsupported_version(self):
+        with open(self.path, 'w') as f:
+            json.dump({'version': 2, 'agent_id': 'agent-id', 'host': 'host',
+                       'reported_nodes': {}}, f)
+        self.assertIsNone(state_snapshot.load(self.path))
+
+    def test_load_malformed(self):
+        with open(self.path, 'w') as f:
+            json.dump({'version': 1, 'agent_id': 'agent-id'}, f)
+        self.assertIsNone(state_snapshot.load(self.path))
+
+    @mock.patch.object(state_snapshot.os, 'replace', autospec=True)
+    def test_save_failure_keeps_previous_snapshot(self, mock_replace):
+        mock_replace.side_effect = OSError
+        with open(self.path, 'w') as f:
+            f.write('previous')
+
+        self.assertFalse(state_snapshot.save(
+            self.path, 'agent-id', 'host', {}))
+        with open(self.path) as f:
+            self.assertEqual('previous', f.read())
+        self.assertEqual(['snapshot.json'], os.listdir(self.tempdir))
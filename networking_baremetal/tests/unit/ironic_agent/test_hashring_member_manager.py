@@ -37,7 +37,8 @@ class TestHashRingMemberManagerNotificationEndpoint(base.BaseTestCase):
         # Create instance without agent_id for backward compatibility tests
         self.member_manager = (
             ironic_neutron_agent.HashRingMemberManagerNotificationEndpoint())
-        self.member_manager.members = []
+        self.member_manager.members = {}
+        self.member_manager._expiry_heap = []
         self.old_timestamp = 1517874977
 
     @mock.patch.object(ironic_neutron_agent.LOG, 'info', autospec=True)
@@ -46,8 +47,9 @@ class TestHashRingMemberManagerNotificationEndpoint(base.BaseTestCase):
         ctxt, publisher_id, event_type, payload, metadata = fake_notification()
         self.member_manager.info(ctxt, publisher_id, event_type, payload,
                                  metadata)
-        self.member_manager.hashring.add_node.assert_called_with(payload['id'])
-        self.assertEqual(payload, self.member_manager.members[0])
+        self.member_manager.hashring.update.assert_called_once_with(
+            add=[payload['id']], remove=[])
+        self.assertEqual(payload, self.member_manager.members[payload['id']])
         self.assertEqual(1, mock_log.call_count)
 
     def test_notification_info_update_timestamp(self):
@@ -55,17 +57,19 @@ class TestHashRingMemberManagerNotificationEndpoint(base.BaseTestCase):
         ctxt, publisher_id, event_type, payload, metadata = fake_notification()
         # Set an old timestamp, and insert into members
         payload['timestamp'] = self.old_timestamp
-        self.member_manager.members.append(copy.deepcopy(payload))
-        # Reset timestamp, and simulate notification, add_node not called
-        # Timestamp in member manager is updated.
+        self.member_manager.members[payload['id']] = copy.deepcopy(payload)
+        # Reset timestamp, and simulate notification, the ring is not
+        # updated. Timestamp in member manager is updated.
         payload['timestamp'] = timeutils.utcnow_ts()
-        self.assertNotEqual(payload['timestamp'],
-                            self.member_manager.members[0]['timestamp'])
+        self.assertNotEqual(
+            payload['timestamp'],
+            self.member_manager.members[payload['id']]['timestamp'])
         self.member_manager.info(ctxt, publisher_id, event_type, payload,
                                  metadata)
-        self.member_manager.hashring.add_node.assert_not_called()
-        self.assertEqual(payload['timestamp'],
-                         self.member_manager.members[0]['timestamp'])
+        self.member_manager.hashring.update.assert_not_called()
+        self.assertEqual(
+            payload['timestamp'],
+            self.member_manager.members[payload['id']]['timestamp'])
 
     @mock.patch.object(ironic_neutron_agent.LOG, 'info', autospec=True)
     def test_remove_old_members(self, mock_log):
@@ -75,7 +79,57 @@ class TestHashRingMemberManagerNotificationEndpoint(base.BaseTestCase):
         payload['timestamp'] = self.old_timestamp
         self.member_manager.info(ctxt, publisher_id, event_type, payload,
                                  metadata)
-        self.member_manager.hashring.remove_node.assert_called_with(
-            payload['id'])
+        self.member_manager.hashring.update.assert_called_once_with(
+            add=[payload['id']], remove=[payload['id']])
         self.assertEqual(0, len(self.member_manager.members))
         self.assertEqual(2, mock_log.call_count)
+
+    def test_expire_members_batched(self):
+        self.member_manager.hashring = mock.Mock()
+        now = timeutils.utcnow_ts()
+        for member_id, timestamp in (('old-1', self.old_timestamp),
+                                     ('old-2', self.old_timestamp),
+                                     ('alive', now)):
+            self.member_manager.members[member_id] = {
+                'id': member_id, 'host': 'host', 'timestamp': timestamp}
+            self.member_manager._expiry_heap.append((timestamp, member_id))
+
+        ctxt, publisher_id, event_type, payload, metadata = fake_notification()
+        self.member_manager.info(ctxt, publisher_id, event_type, payload,
+                                 metadata)
+        # A single ring update for the whole change set
+        self.member_manager.hashring.update.assert_called_once_with(
+            add=[payload['id']], remove=mock.ANY)
+        _args, kwargs = self.member_manager.hashring.update.call_args
+        self.assertEqual({'old-1', 'old-2'}, set(kwargs['remove']))
+        self.assertEqual({'alive', payload['id']},
+                         set(self.member_manager.members))
+
+    def test_expiry_uses_last_heartbeat(self):
+        self.member_manager.hashring = mock.Mock()
+        ctxt, publisher_id, event_type, payload, metadata = fake_notification()
+        # The heap entry has the timestamp of the first heartbeat only
+        self.member_manager.members[payload['id']] = dict(
+            payload, timestamp=timeutils.utcnow_ts())
+        self.member_manager._expiry_heap.append(
+            (self.old_timestamp, payload['id']))
+        self.member_manager.info(ctxt, publisher_id, event_type, payload,
+                                 metadata)
+        self.member_manager.hashring.update.assert_not_called()
+        self.assertIn(payload['id'], self.member_manager.members)
+        self.assertEqual(1, len(self.member_manager._expiry_heap))
+
+    def test_update_failure_retried(self):
+        self.member_manager.hashring = mock.Mock()
+        self.member_manager.hashring.update.side_effect = Exception
+        ctxt, publisher_id, event_type, payload, metadata = fake_notification()
+        self.member_manager.info(ctxt, publisher_id, event_type, payload,
+                                 metadata)
+        self.assertNotIn(payload['id'], self.member_manager.members)
+
+        self.member_manager.hashring.update.side_effect = None
+        self.member_manager.info(ctxt, publisher_id, event_type, payload,
+                                 metadata)
+        self.member_manager.hashring.update.assert_called_with(
+            add=[payload['id']], remove=[])
+        self.assertIn(payload['id'], self.member_manager.members)
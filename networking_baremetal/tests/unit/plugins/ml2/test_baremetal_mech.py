@@ -72,6 +72,18 @@ class TestBaremetalMechDriver(base.AgentMechanismBaseTestCase):
                          self.driver.supported_vnic_types)
         self.assertEqual(portbindings.VIF_TYPE_OTHER, self.driver.vif_type)
 
+    # The neutron-lib RPC fixture already replaces consume_in_threads with
+    # a mock, which autospec cannot inspect
+    @mock.patch.object(baremetal_mech.n_rpc, 'Connection', autospec=False)
+    def test_start_rpc_listeners(self, mock_connection):
+        mock_conn = mock_connection.return_value
+        mock_conn.consume_in_threads.return_value = ['server']
+
+        self.assertEqual(['server'], self.driver.start_rpc_listeners())
+        mock_conn.create_consumer.assert_called_once_with(
+            constants.BAREMETAL_STATE_REPORT_TOPIC, mock.ANY, fanout=False)
+        mock_conn.consume_in_threads.assert_called_once_with()
+
     def test_get_allowed_network_types(self):
         agent_mock = mock.Mock()
         allowed_network_types = self.driver.get_allowed_network_types(
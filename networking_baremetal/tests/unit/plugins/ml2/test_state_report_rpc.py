@@ -0,0 +1,86 @@
+# Copyright (c) 2026 Red Hat, Inc.
+# All Rights Reserved
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import datetime
+from unittest import mock
+
+from neutron.db import agents_db
+from neutron.tests import base
+from neutron_lib.agent import constants as agent_consts
+from neutron_lib import constants as n_const
+from neutron_lib.db import api as db_api
+from neutron_lib.plugins import directory
+from oslo_utils import timeutils
+
+from networking_baremetal import state_report_rpc
+
+
+class TestBaremetalStateReportCallback(base.BaseTestCase):
+
+    def setUp(self):
+        super(TestBaremetalStateReportCallback, self).setUp()
+        self.plugin = mock.Mock()
+        self.plugin.create_or_update_agent.return_value = (
+            agent_consts.AGENT_ALIVE, {})
+        mock.patch.object(directory, 'get_plugin', autospec=True,
+                          return_value=self.plugin).start()
+        # The savepoint property returns a new transaction context manager
+        # on every access, which autospec cannot follow
+        self.mock_writer = mock.patch.object(
+            db_api, 'CONTEXT_WRITER', autospec=False).start()
+        self.context = mock.Mock()
+        self.callback = state_report_rpc.BaremetalStateReportCallback()
+        self.time = timeutils.utcnow().replace(microsecond=0)
+
+    def _report_states(self, agent_states):
+        return self.callback.report_states(
+            self.context, agent_states=agent_states,
+            time=self.time.strftime(n_const.ISO8601_TIME_FORMAT))
+
+    def test_report_states(self):
+        agent_states = [{'host': 'node-1'}, {'host': 'node-2'}]
+
+        self.assertEqual(2, self._report_states(agent_states))
+        self.plugin.create_or_update_agent.assert_has_calls(
+            [mock.call(self.context, {'host': 'node-1'}, self.time),
+             mock.call(self.context, {'host': 'node-2'}, self.time)])
+        self.mock_writer.using.assert_called_once_with(self.context)
+        self.assertEqual(2, self.mock_writer.savepoint.using.call_count)
+
+    @mock.patch.object(state_report_rpc, 'DB_BATCH_SIZE', 2)
+    def test_report_states_batches(self):
+        agent_states = [{'host': 'node-%d' % i} for i in range(5)]
+
+        self.assertEqual(5, self._report_states(agent_states))
+        self.assertEqual(5, self.plugin.create_or_update_agent.call_count)
+        self.assertEqual(3, self.mock_writer.using.call_count)
+
+    @mock.patch.object(state_report_rpc.LOG, 'exception', autospec=True)
+    def test_report_states_failure(self, mock_log):
+        self.plugin.create_or_update_agent.side_effect = [
+            Exception('boom'), (agent_consts.AGENT_ALIVE, {})]
+        agent_states = [{'host': 'node-1'}, {'host': 'node-2'}]
+
+        # The failed agent does not prevent reporting the others
+        self.assertEqual(1, self._report_states(agent_states))
+        self.assertEqual(2, self.plugin.create_or_update_agent.call_count)
+        mock_log.assert_called_once_with(mock.ANY, 'node-1')
+
+    def test_report_states_stale(self):
+        self.time = (agents_db.AgentExtRpcCallback.START_TIME
+                     - datetime.timedelta(seconds=10))
+
+        self._report_states([{'host': 'node-1'}])
+        self.plugin.create_or_update_agent.assert_not_called()